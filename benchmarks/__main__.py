@@ -0,0 +1,87 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+from typing import Any, Dict, List, Optional
+
+from .suite import DEFAULT_CONCURRENCY_LEVELS, run
+
+
+def format_report(results: Dict[str, Any]) -> str:
+    """
+    Formats benchmark results as a plain-text report.
+    """
+    settings = results["settings"]
+    comic = results["comic"]
+    lines = [
+        f"gocomics.py benchmarks (latency {settings['latency'] * 1000:.0f} ms, error rate {settings['error_rate']:.1%}, seed {settings['seed']})",
+        "",
+        f"Comic ({comic['count']} built)",
+        f"  wall time     mean {comic['mean_ms']:8.2f} ms  median {comic['median_ms']:8.2f} ms  p95 {comic['p95_ms']:8.2f} ms",
+        f"  fetches       {comic['fetches_per_comic']:.2f} per comic",
+        f"  about page    {comic['about_ms']:8.2f} ms, {comic['about_fetches']} fetches on first access",
+        "",
+        "Listings"
+    ]
+    for name, listing in results["listings"].items():
+        lines.append(f"  {name:<12}  mean {listing['mean_ms']:8.2f} ms  {listing['fetches']:.2f} fetches")
+    lines += ["", "Parse time (median per page)"]
+    for backend, pages in results["parse"].items():
+        lines.append(f"  {backend:<12}  " + "  ".join(f"{name} {timing['median_ms']:.3f} ms" for name, timing in pages.items()))
+    lines += ["", f"stream_comics throughput ({settings['days']} days)"]
+    for kind, levels in results["stream"].items():
+        for level, stream in levels.items():
+            lines.append(f"  {kind:<8} {level:>3}   {stream['comics_per_second']:8.1f} comics/s  ({stream['comics']} in {stream['seconds']:.2f} s)")
+    lines += ["", "Memory per instance"]
+    for name, memory in results["memory"].items():
+        lines.append(f"  {name:<12}  {memory['bytes_per_instance']:10.0f} bytes")
+    lines += ["", f"{results['requests']} requests served, {results['injected_errors']} errors injected"]
+    return "\n".join(lines)
+
+def parse_levels(value: str) -> List[Optional[int]]:
+    return [int(level) or None for level in value.split(",")]
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Runs the gocomics.py benchmarks against a local replay server.")
+    parser.add_argument("--comics", type=int, default=50, help="the number of comics built by the comic and memory benchmarks")
+    parser.add_argument("--days", type=int, default=60, help="the number of days streamed at each concurrency level")
+    parser.add_argument("--parse-repeat", type=int, default=50, help="the number of times each page is parsed by each backend")
+    parser.add_argument("--latency", type=float, default=0.0, help="the delay added to every response, in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="the fraction of responses replaced by 503 errors")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the error injection")
+    parser.add_argument("--levels", type=parse_levels, default=list(DEFAULT_CONCURRENCY_LEVELS), help="comma-separated concurrency levels, 0 streaming without a thread pool")
+    parser.add_argument("--json", metavar="PATH", help="also write the results to PATH as JSON")
+    args = parser.parse_args(argv)
+    results = run(comics=args.comics, days=args.days, parse_repeat=args.parse_repeat, latency=args.latency, error_rate=args.error_rate, seed=args.seed, levels=args.levels)
+    print(format_report(results))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4)
+
+if __name__ == "__main__":
+    main()
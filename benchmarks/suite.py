@@ -0,0 +1,279 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import statistics
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from datetime import date, timedelta
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from unittest import mock
+
+from gocomics import Comic, DateIndex, RateLimiter, Transport, fetch_comics, get_popular_comics, search, stream_comics
+from gocomics import aio
+from gocomics.about import ABOUT_CACHE
+from gocomics.parsers import PARSER_BACKENDS, get_parser_backend, parse_a_to_z, parse_about, parse_popular, parse_strip, set_parser_backend
+from tests.server import StubServer, page
+
+IDENTIFIER = "garfield"
+FIRST_DATE = date(2020, 1, 1)
+
+PATCHED_MODULES = ("gocomics.about", "gocomics.comic", "gocomics.utils", "gocomics.aio")
+
+DEFAULT_CONCURRENCY_LEVELS = (None, 2, 4, 8, 16)
+
+
+@contextmanager
+def replay_server(days: int, *, latency: float = 0.0, error_rate: float = 0.0, seed: int = 0) -> Iterator[StubServer]:
+    """
+    Runs a replay server serving the recorded pages, with `days` linked strips from :data:`FIRST_DATE`, and points the library at it.
+
+    Every third day has no strip, so streams exercise the publication-date index.
+
+    :param days: The number of days in the archive.
+    :type days: :class:`int`
+    :param latency: The delay added to every response, in seconds.
+    :type latency: :class:`float`
+    :param error_rate: The fraction of responses replaced by 503 errors.
+    :type error_rate: :class:`float`
+    :param seed: The seed of the error injection.
+    :type seed: :class:`int`
+    """
+    server = StubServer(latency=latency, error_rate=error_rate, seed=seed)
+    server.add(f"/{IDENTIFIER}", page("strip.html"))
+    server.add(f"/{IDENTIFIER}/about", page("about.html"))
+    server.add("/comics/a-to-z", page("a-to-z.html"))
+    server.add("/comics/popular", page("popular.html"))
+    server.archive(IDENTIFIER, archive_dates(days))
+    with ExitStack() as stack:
+        stack.enter_context(server)
+        for module in PATCHED_MODULES:
+            stack.enter_context(mock.patch(f"{module}.BASE_URL", server.base_url))
+        yield server
+
+def archive_dates(days: int) -> List[date]:
+    """
+    Returns the dates with a strip in an archive of `days` days.
+    """
+    return [FIRST_DATE + timedelta(days=offset) for offset in range(days) if offset % 3 != 2]
+
+def known_index(days: int) -> DateIndex:
+    """
+    Returns a new publication-date index that knows every strip in an archive of `days` days.
+    """
+    index = DateIndex()
+    dates = archive_dates(days)
+    for previous, day, following in zip([None] + dates, dates, dates[1:] + [None]):
+        index.record(IDENTIFIER, day, previous, following)
+    return index
+
+def new_transport() -> Transport:
+    """
+    Returns a transport without a rate limit, which retries injected errors after a short delay.
+    """
+    return Transport(timeout=10, limiter=RateLimiter(rate=None, base_delay=0.01, max_delay=0.1, min_retries=1000))
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    Returns the mean, median, 95th percentile and total of timing samples, in milliseconds.
+    """
+    ordered = sorted(samples)
+    return {
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "total_ms": sum(ordered) * 1000
+    }
+
+
+def bench_comic(server: StubServer, count: int) -> Dict[str, Any]:
+    """
+    Builds `count` comics one after another, and reports the wall time and the number of requests of each, and of the first access to the about page.
+    """
+    dates = archive_dates(count * 3 // 2 + 3)[:count]
+    times, fetches = [], []
+    with new_transport() as transport:
+        for day in dates:
+            before = len(server.requests)
+            started = perf_counter()
+            Comic(IDENTIFIER, day, transport=transport)
+            times.append(perf_counter() - started)
+            fetches.append(len(server.requests) - before)
+        ABOUT_CACHE.clear()
+        comic = Comic(IDENTIFIER, dates[0], transport=transport)
+        before = len(server.requests)
+        started = perf_counter()
+        comic.about # pylint: disable=pointless-statement
+        about_time = perf_counter() - started
+        about_fetches = len(server.requests) - before
+    return {
+        "count": count,
+        **summarize(times),
+        "fetches_per_comic": statistics.fmean(fetches),
+        "about_ms": about_time * 1000,
+        "about_fetches": about_fetches
+    }
+
+def bench_listings(server: StubServer, repeat: int) -> Dict[str, Any]:
+    """
+    Fetches the A-to-Z and popular listings `repeat` times each, and reports the wall time and the number of requests of each.
+    """
+    results = {}
+    with new_transport() as transport:
+        for name, function in (("a_to_z", search), ("popular", get_popular_comics)):
+            before = len(server.requests)
+            times = []
+            for _ in range(repeat):
+                started = perf_counter()
+                function(transport=transport)
+                times.append(perf_counter() - started)
+            results[name] = {**summarize(times), "fetches": (len(server.requests) - before) / repeat}
+    return results
+
+def bench_parse(repeat: int) -> Dict[str, Any]:
+    """
+    Parses each recorded page `repeat` times with every available backend, and reports the time of each parse.
+    """
+    pages: Dict[str, Callable[..., Any]] = {
+        "strip.html": parse_strip,
+        "about.html": parse_about,
+        "a-to-z.html": parse_a_to_z,
+        "popular.html": parse_popular
+    }
+    results: Dict[str, Any] = {}
+    previous = get_parser_backend()
+    try:
+        for backend in PARSER_BACKENDS:
+            try:
+                set_parser_backend(backend)
+            except ValueError:
+                continue
+            results[backend] = {}
+            for name, parser in pages.items():
+                html = page(name)
+                times = []
+                for _ in range(repeat):
+                    started = perf_counter()
+                    parser(html, backend=backend)
+                    times.append(perf_counter() - started)
+                results[backend][name] = summarize(times)
+    finally:
+        set_parser_backend(previous)
+    return results
+
+def bench_stream(days: int, levels: Sequence[Optional[int]]) -> Dict[str, Any]:
+    """
+    Streams an archive of `days` days at every level of `levels`, with threads and with asyncio, and reports the throughput of each. At every level but 0, the known dates are also fetched by the :func:`fetch_comics` pipeline, with one parse process per CPU.
+
+    Every stream starts from a fresh publication-date index that already knows the archive, as it would after an earlier run, so that no level benefits from the dates learned by another.
+    """
+    results: Dict[str, Any] = {"threads": {}, "asyncio": {}, "pipeline": {}}
+    for workers in levels:
+        with new_transport() as transport:
+            started = perf_counter()
+            streamed = sum(1 for _ in stream_comics(IDENTIFIER, start_date=FIRST_DATE, end_date=FIRST_DATE + timedelta(days=days - 1), transport=transport, workers=workers, index=known_index(days)))
+            elapsed = perf_counter() - started
+        results["threads"][str(workers or 0)] = {"comics": streamed, "seconds": elapsed, "comics_per_second": streamed / elapsed}
+    for workers in filter(None, levels):
+        with new_transport() as transport:
+            started = perf_counter()
+            streamed = sum(isinstance(result, Comic) for result in fetch_comics(((IDENTIFIER, day) for day in archive_dates(days)), fetch_workers=workers, transport=transport))
+            elapsed = perf_counter() - started
+        results["pipeline"][str(workers)] = {"comics": streamed, "seconds": elapsed, "comics_per_second": streamed / elapsed}
+    for concurrency in levels:
+        elapsed, streamed = asyncio.run(_stream_async(days, concurrency or 1, known_index(days)))
+        results["asyncio"][str(concurrency or 1)] = {"comics": streamed, "seconds": elapsed, "comics_per_second": streamed / elapsed}
+    return results
+
+async def _stream_async(days: int, concurrency: int, index: DateIndex) -> tuple:
+    limiter = RateLimiter(rate=None, base_delay=0.01, max_delay=0.1, min_retries=1000)
+    async with aio.AsyncTransport(timeout=10, concurrency=concurrency, per_host=concurrency, limiter=limiter) as transport:
+        started = perf_counter()
+        streamed = 0
+        async for _ in aio.stream_comics(IDENTIFIER, start_date=FIRST_DATE, end_date=FIRST_DATE + timedelta(days=days - 1), concurrency=concurrency, transport=transport, index=index):
+            streamed += 1
+        return perf_counter() - started, streamed
+
+def bench_memory(count: int) -> Dict[str, Any]:
+    """
+    Builds `count` comics and `count` records, keeping them all alive, and reports the memory traced per instance.
+    """
+    dates = archive_dates(count * 3 // 2 + 3)[:count]
+    results = {}
+    with new_transport() as transport:
+        comics = [Comic(IDENTIFIER, dates[0], transport=transport)]
+        for name, build in (("comic", lambda day: Comic(IDENTIFIER, day, transport=transport)), ("record", lambda day: comics[0].to_record())):
+            gc.collect()
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            instances = [build(day) for day in dates]
+            used = tracemalloc.get_traced_memory()[0] - baseline
+            tracemalloc.stop()
+            results[name] = {"count": len(instances), "bytes_per_instance": used / len(instances)}
+            del instances
+    return results
+
+
+def run( # pylint: disable=too-many-arguments
+    *,
+    comics: int = 50,
+    days: int = 60,
+    parse_repeat: int = 50,
+    latency: float = 0.0,
+    error_rate: float = 0.0,
+    seed: int = 0,
+    levels: Sequence[Optional[int]] = DEFAULT_CONCURRENCY_LEVELS
+) -> Dict[str, Any]:
+    """
+    Runs every benchmark against a replay server and returns the results.
+
+    :param comics: The number of comics built by the comic and memory benchmarks.
+    :type comics: :class:`int`
+    :param days: The number of days streamed at each concurrency level.
+    :type days: :class:`int`
+    :param parse_repeat: The number of times each page is parsed by each backend.
+    :type parse_repeat: :class:`int`
+    :param latency: The delay added to every response, in seconds.
+    :type latency: :class:`float`
+    :param error_rate: The fraction of responses replaced by 503 errors.
+    :type error_rate: :class:`float`
+    :param seed: The seed of the error injection.
+    :type seed: :class:`int`
+    :param levels: The concurrency levels of the stream benchmark. ``None`` streams without a thread pool.
+    :type levels: Sequence[Optional[:class:`int`]]
+    """
+    results: Dict[str, Any] = {"settings": {"comics": comics, "days": days, "parse_repeat": parse_repeat, "latency": latency, "error_rate": error_rate, "seed": seed}}
+    with replay_server(max(days, comics * 3 // 2 + 3), latency=latency, error_rate=error_rate, seed=seed) as server:
+        results["comic"] = bench_comic(server, comics)
+        results["listings"] = bench_listings(server, max(1, comics // 10))
+        results["stream"] = bench_stream(days, levels)
+        results["memory"] = bench_memory(comics)
+        results["requests"] = len(server.requests)
+        results["injected_errors"] = server.errors
+    results["parse"] = bench_parse(parse_repeat)
+    return results
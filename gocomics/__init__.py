@@ -16,5 +16,69 @@ __copyright__ = 'Copyright 2025 Omkaar'
 __version__ = '2.1.0'
 
 
-from .comic import *
-from .utils import *
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Submodules are imported on first access to one of their names, so that importing the package stays cheap.
+_EXPORTS = {
+    "endpoints": ("BASE_URL", "requote_uri"),
+    "about": ("ABOUT_CACHE_SIZE", "ABOUT_CACHE_TTL", "ABOUT_CACHE", "About", "Hyperlink", "Character", "get_about"),
+    "cache": ("TTLCache",),
+    "httpcache": ("DEFAULT_TTLS", "CacheEntry", "HTTPCache", "page_kind"),
+    "negativecache": ("RECENT_DAYS", "DEFAULT_RECENT_TTL", "NegativeCache"),
+    "events": ("EVENT_NAMES", "DEFAULT_BUCKETS", "Event", "Histogram", "MetricsCollector", "add_observer", "remove_observer", "observe"),
+    "ratelimit": (
+        "DEFAULT_RATE", "DEFAULT_MAX_RETRIES", "DEFAULT_BASE_DELAY", "DEFAULT_MAX_DELAY", "RETRY_BUDGET_WINDOW", "THROTTLE_CODES", "RETRY_CODES",
+        "RateLimiter", "get_rate_limiter", "set_rate_limiter"
+    ),
+    "transport": ("DEFAULT_TIMEOUT", "DEFAULT_POOL_SIZE", "MAX_REDIRECTS", "REDIRECT_CODES", "DEFAULT_HEADERS", "Response", "Transport", "get_transport", "set_transport"),
+    "parsers": (
+        "PARSER_BACKENDS", "BYLINE_CLASS", "NAME_CLASS", "HEADER_CLASS", "IMAGE_CONTAINER_ID", "PREVIOUS_LINK_CLASS", "NEXT_LINK_CLASS", "A_TO_Z_LINK_CLASS",
+        "POPULAR_LINK_CLASS", "ABOUT_CLASSES", "META_FIELDS", "STRIP_SOURCES", "NAVIGATION_SOURCES", "get_parser_backend", "set_parser_backend", "parse_strip", "parse_about", "parse_a_to_z",
+        "parse_a_to_z_entries", "parse_popular"
+    ),
+    "record": ("RECORD_FIELDS", "StripRecord"),
+    "dates": ("DateIndex", "get_date_index", "set_date_index"),
+    "comic": ("DOWNLOAD_CHUNK_SIZE", "MISSING_CODES", "IMAGE_EXTENSIONS", "STRIP_FIELDS", "Comic"),
+    "utils": ("search", "search_political", "get_popular_comics", "stream_comics"),
+    "archive": ("MANIFEST_NAME", "DEFAULT_MIRROR_WORKERS", "DEFAULT_SYNC_WORKERS", "DEFAULT_LATEST_WORKERS", "DEFAULT_FETCH_WORKERS", "mirror", "read_manifest", "sync", "fetch_latest", "fetch_comics", "read_sync_state"),
+    "catalog": ("COMIC_CATEGORIES", "POLITICAL_CATEGORIES", "DEFAULT_CATALOG_WORKERS", "CatalogEntry", "Catalog"),
+    "exports": ("EXPORT_FIELDS", "EXPORT_FORMATS", "DEFAULT_BATCH_SIZE", "FORMAT_SUFFIXES", "export"),
+    "aio": ("AsyncComic", "AsyncResponse", "AsyncTransport", "get_async_transport", "set_async_transport")
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = tuple(_MODULES)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return import_module(f".{name}", __name__)
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_MODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
+
+
+if TYPE_CHECKING:
+    from .endpoints import BASE_URL, requote_uri
+    from .about import *
+    from .cache import *
+    from .httpcache import *
+    from .negativecache import *
+    from .events import *
+    from .ratelimit import *
+    from .transport import *
+    from .parsers import *
+    from .record import *
+    from .dates import *
+    from .comic import *
+    from .utils import *
+    from .archive import *
+    from .catalog import *
+    from .exports import *
+    from .aio import *
@@ -0,0 +1,218 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .cache import TTLCache
+from .endpoints import BASE_URL, requote_uri
+from .events import _emit, _stage
+from .parsers import parse_about
+from .transport import Transport, _BaseTransport, get_transport
+
+ABOUT_CACHE_SIZE = 512
+ABOUT_CACHE_TTL = 6 * 60 * 60
+
+
+class Hyperlink:
+    """
+    A class that represents a hyperlink.
+
+    :param url: The URL of the hyperlink.
+    :type url: :class:`str`
+    :param text: The text of the hyperlink.
+    :type text: :class:`str`
+    """
+
+    __slots__ = ("url", "text")
+
+    def __init__(self, url: str, text: str) -> None:
+        self.url = url
+        self.text = text
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> Hyperlink:
+        """
+        Builds a hyperlink from a dictionary returned by :meth:`to_dict`.
+
+        :param data: The dictionary.
+        :type data: Dict[:class:`str`, :class:`str`]
+        """
+        return cls(data["url"], data["text"])
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Returns the hyperlink as a JSON-serializable dictionary.
+        """
+        return {"url": self.url, "text": self.text}
+
+    def __eq__(self, __o: object) -> bool:
+        if not isinstance(__o, Hyperlink):
+            return NotImplemented
+        return (self.url, self.text) == (__o.url, __o.text)
+
+    def __hash__(self) -> int:
+        return hash((self.url, self.text))
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"Hyperlink(url={self.url}, text={self.text})"
+
+
+class Character:
+    """
+    A class that represents a character in a comic.
+
+    :param name: The name of the character.
+    :type name: :class:`str`
+    :param image_url: The URL of the character's image.
+    :type image_url: :class:`str`
+    :param description: A description of the character.
+    :type description: :class:`str`
+    """
+
+    __slots__ = ("name", "image_url", "description")
+
+    def __init__(self, name: str, image_url: str, description: str) -> None:
+        self.name = name
+        self.image_url = image_url
+        self.description = description
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> Character:
+        """
+        Builds a character from a dictionary returned by :meth:`to_dict`.
+
+        :param data: The dictionary.
+        :type data: Dict[:class:`str`, :class:`str`]
+        """
+        return cls(data["name"], data["image_url"], data["description"])
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Returns the character as a JSON-serializable dictionary.
+        """
+        return {"name": self.name, "image_url": self.image_url, "description": self.description}
+
+    def __eq__(self, __o: object) -> bool:
+        if not isinstance(__o, Character):
+            return NotImplemented
+        return (self.name, self.image_url, self.description) == (__o.name, __o.image_url, __o.description)
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.image_url, self.description))
+
+    def __repr__(self) -> str:
+        return f"Character(name={self.name})"
+
+
+class About:
+
+    """
+    A class that represents a comic's about page.
+
+    .. note::
+
+        Use :func:`get_about` instead of creating instances directly, so that the page is only fetched once per identifier.
+
+    :param identifier: The comic's identifier.
+    :type identifier: :class:`str`
+    :param transport: The transport used to fetch the page. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
+    :ivar url: The URL of the about page.
+    :ivar about: A list of hyperlinks and text describing the comic.
+    :ivar about_feature_url: The URL of the comic's about feature image.
+    :ivar about_author: A list of hyperlinks and text describing the comic's author.
+    :ivar author_image_url: The URL of the comic author's image.
+    :ivar social_urls: A list of hyperlinks to the comic's social media profiles.
+    :ivar characters: A list of characters in the comic.
+    """
+
+    def __init__(self, identifier: str, *, transport: Optional[Transport] = None) -> None:
+        self.identifier = identifier
+        self.url = _about_url(identifier)
+
+        transport = transport or get_transport()
+        self._apply(transport.get(self.url, parser=parse_about).parsed)
+
+    @classmethod
+    def _from_fields(cls, identifier: str, fields: Dict[str, Any]) -> About:
+        about = cls.__new__(cls)
+        about.identifier = identifier
+        about.url = _about_url(identifier)
+        about._apply(fields)
+        return about
+
+    def _apply(self, fields: Dict[str, Any]) -> None:
+        self.about = _from_rich_text(fields["about"])
+        self.about_feature_url = fields["about_feature_url"]
+        self.about_author = _from_rich_text(fields["about_author"])
+        self.author_image_url = fields["author_image_url"]
+        self.social_urls = list(fields["social_urls"])
+        self.characters = [Character.from_dict(character) for character in fields["characters"]]
+
+    def __repr__(self) -> str:
+        return f"About(identifier={self.identifier})"
+
+
+def _about_url(identifier: str) -> str:
+    return requote_uri(f"{BASE_URL}{identifier}/about")
+
+def _about_key(identifier: str, transport: Optional[_BaseTransport]) -> Tuple[str, _BaseTransport]:
+    # Pages are cached per transport, so that a page fetched through one transport is never served to the callers of another.
+    return identifier, transport or get_transport()
+
+def _from_rich_text(items: List[Union[Dict[str, str], str]]) -> List[Union[Hyperlink, str]]:
+    return [Hyperlink.from_dict(item) if isinstance(item, dict) else item for item in items]
+
+
+ABOUT_CACHE = TTLCache(ABOUT_CACHE_SIZE, ABOUT_CACHE_TTL)
+
+
+def get_about(identifier: str, *, transport: Optional[Transport] = None) -> About:
+    """
+    Returns the about page of a comic, fetching and parsing it only if it is not already cached.
+
+    .. note::
+
+        About pages are shared by every :class:`Comic` with the same identifier and transport, and kept in `ABOUT_CACHE` for `ABOUT_CACHE_TTL` seconds, keyed by ``(identifier, transport)``.
+
+    :param identifier: The comic's identifier.
+    :type identifier: :class:`str`
+    :param transport: The transport used if the page has to be fetched. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
+    """
+    key = _about_key(identifier, transport)
+    with _stage("about"):
+        about = ABOUT_CACHE.get(key)
+        _emit("cache_miss" if about is None else "cache_hit", cache="about", identifier=identifier)
+        if about is None:
+            about = About(identifier, transport=key[1])
+            ABOUT_CACHE.set(key, about)
+    return about
@@ -0,0 +1,748 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextvars import copy_context
+from datetime import datetime, date, timedelta
+from functools import partial
+from http.client import HTTPMessage, parse_headers
+from io import BytesIO
+from ssl import SSLContext, create_default_context
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, AsyncIterator, BinaryIO, Callable, Dict, FrozenSet, Iterator, List, Literal, Mapping, Optional, Tuple, Union
+from urllib.error import URLError
+from urllib.parse import SplitResult
+
+from .about import ABOUT_CACHE, About, _about_key
+from .cache import _Shared
+from .comic import DOWNLOAD_CHUNK_SIZE, STRIP_FIELDS, Comic, _is_missing, _open_image
+from .dates import DateIndex, _installed_date_index
+from .events import _emit, _stage
+from .endpoints import BASE_URL, requote_uri
+from .ratelimit import RateLimiter, get_rate_limiter
+from .transport import DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT, MAX_REDIRECTS, _backoff, _BaseResponse, _BaseTransport, _cache_lookup, _cached_response, _coalesced, _flight_key, _follow, _is_redirect, _parse, _Request, _request_parts, _revalidated, _waiter_error, _with_parsed
+from .parsers import _strip_parser, parse_a_to_z, parse_about, parse_popular, parse_strip
+from .utils import _following_date, _listing_url, _popular_url
+
+if TYPE_CHECKING:
+    from .httpcache import HTTPCache
+    from .negativecache import NegativeCache
+
+__all__ = ("AsyncComic", "AsyncResponse", "AsyncTransport", "get_async_transport", "set_async_transport")
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 8
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, timeout: float) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.timeout = timeout
+
+    async def exchange(self, request: bytes) -> Tuple[int, str, HTTPMessage]:
+        self.writer.write(request)
+        await asyncio.wait_for(self.writer.drain(), self.timeout)
+        return await asyncio.wait_for(self._read_head(), self.timeout)
+
+    async def _read_head(self) -> Tuple[int, str, HTTPMessage]:
+        line = await self.reader.readline()
+        if not line:
+            raise EOFError("The connection was closed by the server.")
+        version, status, *reason = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        if not version.startswith("HTTP/"):
+            raise ValueError(f"Invalid status line {line!r}.")
+
+        block = b""
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            block += line
+        return int(status), reason[0] if reason else "", parse_headers(BytesIO(block + b"\r\n"))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def _encode_request(url: str, method: str, default_headers: Mapping[str, str], headers: Optional[Mapping[str, str]]) -> Tuple[SplitResult, bytes]:
+    parts, target, request_headers = _request_parts(url, default_headers, headers)
+    lines = [f"{method} {target} HTTP/1.1", f"Host: {parts.netloc}"]
+    lines.extend(f"{name}: {value}" for name, value in request_headers.items())
+    return parts, ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+async def _pace(limiter: RateLimiter, url: str, netloc: str) -> None:
+    delay = limiter.reserve(netloc)
+    if delay:
+        _emit("sleep", duration=delay, url=url, reason="rate_limit")
+        await asyncio.sleep(delay)
+
+async def _in_executor(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    # Runs a blocking call in the loop's default executor, in a copy of the current context so that its events reach the same handlers.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(copy_context().run, partial(function, *args, **kwargs)))
+
+
+class AsyncResponse(_BaseResponse):
+
+    """
+    A class that represents an HTTP response returned by an :class:`AsyncTransport`.
+
+    The body is decoded as it is read. The connection and the concurrency slots held by the request are released once the body has been read completely, so always read the body or close the response.
+
+    :ivar url: The final URL of the response, after redirects.
+    :ivar status: The HTTP status code.
+    :ivar reason: The HTTP reason phrase.
+    :ivar headers: The response headers.
+    :ivar from_cache: Whether the response was served from an :class:`HTTPCache`.
+    :ivar coalesced: Whether the response was shared with a concurrent request for the same URL, instead of being fetched for this one.
+    :ivar parsed: The result of the parser passed to :meth:`AsyncTransport.get`, if any.
+    """
+
+    async def __aenter__(self) -> AsyncResponse:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.close()
+
+    async def read(self) -> bytes:
+        """
+        Reads and returns the whole decoded body.
+        """
+        if self._content is None:
+            self._content = b"".join([chunk async for chunk in self.iter_content()])
+        return self._content
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            raise ValueError("The response body has not been read yet. Await read() first.")
+        return self._content
+
+    async def iter_content(self, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """
+        Yields the decoded body in chunks of at most `chunk_size` raw bytes.
+
+        :param chunk_size: The number of bytes to read from the connection at a time.
+        :type chunk_size: :class:`int`
+        """
+        if self._content is not None:
+            yield self._content
+            return
+
+        connection = self._pending().stream
+        framing = self._framing()
+        try:
+            async for data in self._iter_raw(connection, framing, chunk_size):
+                data = self._decode(data)
+                if data:
+                    yield data
+        except BaseException:
+            self.close()
+            raise
+
+        tail = self._flush()
+        if tail:
+            yield tail
+        self._finish(framing is not None and self.headers.get("Connection", "").lower() != "close")
+
+    def _framing(self) -> Optional[str]:
+        # How the end of the body is found, or None if it ends when the server closes the connection.
+        if self._request.method == "HEAD" or self.status in (204, 304) or 100 <= self.status < 200:
+            return "empty"
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            return "chunked"
+        if self.headers.get("Content-Length") is not None:
+            return "length"
+        return None
+
+    async def _iter_raw(self, connection: _Connection, framing: Optional[str], chunk_size: int) -> AsyncIterator[bytes]:
+        reader, timeout = connection.reader, connection.timeout
+        if framing == "empty":
+            return
+
+        if framing == "chunked":
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout)
+                size = int(line.split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    while (await asyncio.wait_for(reader.readline(), timeout)) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return
+                while size:
+                    data = await asyncio.wait_for(reader.read(min(size, chunk_size)), timeout)
+                    if not data:
+                        raise asyncio.IncompleteReadError(b"", size)
+                    size -= len(data)
+                    yield data
+                await asyncio.wait_for(reader.readexactly(2), timeout)
+
+        if framing == "length":
+            remaining = int(self.headers["Content-Length"])
+            while remaining:
+                data = await asyncio.wait_for(reader.read(min(remaining, chunk_size)), timeout)
+                if not data:
+                    raise asyncio.IncompleteReadError(b"", remaining)
+                remaining -= len(data)
+                yield data
+            return
+
+        while True:
+            data = await asyncio.wait_for(reader.read(chunk_size), timeout)
+            if not data:
+                return
+            yield data
+
+    def close(self) -> None:
+        """
+        Closes the response. If the body was not read completely, the connection is discarded instead of being reused.
+        """
+        self._finish(False, complete=False)
+
+
+class AsyncTransport(_BaseTransport):
+
+    """
+    A class that sends HTTP requests from an asyncio event loop over pooled keep-alive connections.
+
+    The number of requests in flight is bounded both overall and per host.
+
+    .. note::
+
+        A transport is bound to the event loop it is first used in. If it is used from another loop, its idle connections are dropped.
+
+    :param timeout: The timeout, in seconds, for connecting and for each read.
+    :type timeout: :class:`float`
+    :param concurrency: The maximum number of requests in flight at once.
+    :type concurrency: :class:`int`
+    :param per_host: The maximum number of requests in flight to a single host.
+    :type per_host: :class:`int`
+    :param pool_size: The maximum number of idle connections kept per host.
+    :type pool_size: :class:`int`
+    :param headers: Extra headers sent with every request.
+    :type headers: Optional[Mapping[:class:`str`, :class:`str`]]
+    :param ssl_context: The SSL context used for HTTPS connections.
+    :type ssl_context: Optional[:class:`ssl.SSLContext`]
+    :param cache: A persistent cache consulted by :meth:`get`.
+    :type cache: Optional[:class:`HTTPCache`]
+    :param negative_cache: A persistent cache of the comics known not to exist, consulted by :class:`Comic` before any request.
+    :type negative_cache: Optional[:class:`NegativeCache`]
+    :param limiter: The rate limiter pacing and retrying requests. Defaults to the shared rate limiter.
+    :type limiter: Optional[:class:`RateLimiter`]
+    :param coalesce: Whether concurrent calls to :meth:`get` for the same URL share a single request.
+    :type coalesce: :class:`bool`
+    """
+
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        per_host: int = DEFAULT_PER_HOST,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        headers: Optional[Mapping[str, str]] = None,
+        ssl_context: Optional[SSLContext] = None,
+        cache: Optional[HTTPCache] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        limiter: Optional[RateLimiter] = None,
+        coalesce: bool = True
+    ) -> None:
+        super().__init__(timeout=timeout, pool_size=pool_size, headers=headers, ssl_context=ssl_context, cache=cache, negative_cache=negative_cache, limiter=limiter, coalesce=coalesce)
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self._loop = None
+        self._idle: Dict[Tuple[str, str], List[_Connection]] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._host_semaphores: Dict[Tuple[str, str], asyncio.Semaphore] = {}
+        self._flights: Dict[tuple, Tuple[asyncio.Task, Optional[Callable[[bytes], Any]]]] = {}
+
+    async def __aenter__(self) -> AsyncTransport:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def open(self, url: str, *, method: str = "GET", headers: Optional[Mapping[str, str]] = None) -> AsyncResponse:
+        """
+        Sends a request and returns the response without reading its body. Redirects are followed.
+
+        Requests are paced by the transport's rate limiter. Throttled or failed requests (429, 502, 503, 504 or connection errors) are retried with backoff, as long as the limiter allows it.
+
+        :param url: The URL to request.
+        :type url: :class:`str`
+        :param method: The HTTP method.
+        :type method: :class:`str`
+        :param headers: Extra headers for this request.
+        :type headers: Optional[Mapping[:class:`str`, :class:`str`]]
+
+        :raises HTTPError: If the server answers with a status code of 400 or above.
+        :raises URLError: If the server cannot be reached.
+        """
+        limiter = self.limiter or get_rate_limiter()
+        attempt = 0
+        while True:
+            try:
+                return await self._open(url, method, headers, limiter)
+            except URLError as e:
+                delay = _backoff(limiter, url, e, attempt)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _open(self, url: str, method: str, headers: Optional[Mapping[str, str]], limiter: RateLimiter) -> AsyncResponse:
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self._send(url, method, headers, limiter)
+            if response.status < 400 and not _is_redirect(response):
+                return response
+            url, method = _follow(url, method, response, await response.read())
+        raise URLError(f"Too many redirects while fetching '{url}'.")
+
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        parser: Optional[Callable[[bytes], Any]] = None,
+        refresh: bool = False
+    ) -> AsyncResponse:
+        """
+        Sends a GET request and returns the response with its body already read.
+
+        If the transport has a cache, fresh entries are returned without a request and stale ones are revalidated with a conditional request.
+
+        Unless `coalesce` is False, a call made while another task is already getting the same URL, with the same headers and `refresh`, waits for that request instead of sending its own. It receives a copy of the response, with :attr:`AsyncResponse.coalesced` set, and a copy of the parsed result if it uses the same parser. If the request fails, it raises a copy of the error, chained to the original. Cancelling one of the waiting calls does not cancel the shared request.
+
+        :param url: The URL to request.
+        :type url: :class:`str`
+        :param headers: Extra headers for this request.
+        :type headers: Optional[Mapping[:class:`str`, :class:`str`]]
+        :param parser: A function turning the body into a JSON-serializable value, stored as :attr:`AsyncResponse.parsed`. Its result is cached alongside the body.
+        :type parser: Optional[Callable[[:class:`bytes`], Any]]
+        :param refresh: If True, a full request is made even if the cache holds the page.
+        :type refresh: :class:`bool`
+        """
+        if not self.coalesce:
+            return await self._get(url, headers, parser, refresh)
+
+        key = _flight_key(url, headers, refresh)
+        flight = self._flights.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(self._get(url, headers, parser, refresh))
+            flight = self._flights[key] = (task, parser)
+            task.add_done_callback(partial(self._land, key))
+            self._stats["flights"] += 1
+            return await asyncio.shield(task)
+
+        self._stats["coalesced"] += 1
+        _emit("cache_hit", url=url, cache="inflight")
+        task, shared_parser = flight
+        try:
+            response = await asyncio.shield(task)
+        except Exception as e:
+            raise _waiter_error(e) from e
+        return _coalesced(response, self.cache, url, parser, shared_parser)
+
+    def _land(self, key: tuple, task: asyncio.Task) -> None:
+        del self._flights[key]
+        if not task.cancelled():
+            # Retrieved here in case every caller was cancelled.
+            task.exception()
+
+    async def _get(self, url: str, headers: Optional[Mapping[str, str]], parser: Optional[Callable[[bytes], Any]], refresh: bool) -> AsyncResponse:
+        entry, request_headers = _cache_lookup(self.cache, url, headers, refresh)
+        if entry is not None and entry.fresh:
+            return _with_parsed(self.cache, url, _cached_response(AsyncResponse, entry), parser)
+        response = await self.open(url, headers=request_headers)
+        await response.read()
+        return _with_parsed(self.cache, url, _revalidated(self.cache, url, entry, response), parser)
+
+    async def close(self) -> None:
+        """
+        Closes every idle connection in the pool.
+        """
+        connections = [connection for pool in self._idle.values() for connection in pool]
+        self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+    def _bind(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._idle = {}
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._host_semaphores = {}
+
+    async def _limit(self, key: Tuple[str, str]) -> None:
+        self._bind()
+        if key not in self._host_semaphores:
+            self._host_semaphores[key] = asyncio.Semaphore(self.per_host)
+        await self._semaphore.acquire()
+        try:
+            await self._host_semaphores[key].acquire()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def _unlimit(self, key: Tuple[str, str]) -> None:
+        self._host_semaphores[key].release()
+        self._semaphore.release()
+
+    async def _send(self, url: str, method: str, headers: Optional[Mapping[str, str]], limiter: RateLimiter) -> AsyncResponse:
+        parts, request = _encode_request(url, method, self.headers, headers)
+        key = (parts.scheme, parts.netloc)
+        await _pace(limiter, url, parts.netloc)
+
+        await self._limit(key)
+        try:
+            while True:
+                connection, reused = await self._acquire(parts)
+                started = perf_counter()
+                try:
+                    status, reason, response_headers = await connection.exchange(request)
+                except (OSError, EOFError, ValueError, asyncio.TimeoutError) as e:
+                    connection.close()
+                    if reused and not isinstance(e, asyncio.TimeoutError):
+                        continue
+                    limiter.record(parts.netloc, None)
+                    _emit("request", duration=perf_counter() - started, size=0, url=url, method=method, error=str(e) or type(e).__name__)
+                    raise URLError(TimeoutError(f"Timed out while fetching '{url}'.") if isinstance(e, asyncio.TimeoutError) else e) from e
+                limiter.record(parts.netloc, status, response_headers.get("Retry-After"))
+                return AsyncResponse(url, status, reason, response_headers, _Request(method, started, connection, partial(self._done, key, connection)))
+        except BaseException:
+            self._unlimit(key)
+            raise
+
+    async def _acquire(self, parts) -> Tuple[_Connection, bool]:
+        pool = self._idle.get((parts.scheme, parts.netloc))
+        while pool:
+            connection = pool.pop()
+            if not connection.reader.at_eof():
+                return connection, True
+            connection.close()
+
+        ssl = None
+        if parts.scheme == "https":
+            if self.ssl_context is None:
+                self.ssl_context = create_default_context()
+            ssl = self.ssl_context
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(parts.hostname, port, ssl=ssl, server_hostname=parts.hostname if ssl else None),
+                self.timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise URLError(e) from e
+        return _Connection(reader, writer, self.timeout), False
+
+    def _release(self, key: Tuple[str, str], connection: _Connection) -> None:
+        pool = self._idle.setdefault(key, [])
+        if len(pool) < self.pool_size:
+            pool.append(connection)
+        else:
+            connection.close()
+
+
+_shared = _Shared(AsyncTransport)
+
+
+def get_async_transport() -> AsyncTransport:
+    """
+    Returns the asyncio transport shared by the library, creating it on first use.
+    """
+    return _shared.get()
+
+def set_async_transport(transport: Optional[AsyncTransport]) -> None:
+    """
+    Replaces the asyncio transport shared by the library. Passing None restores a default transport on next use.
+
+    :param transport: The new shared transport.
+    :type transport: Optional[:class:`AsyncTransport`]
+    """
+    _shared.set(transport)
+
+
+class AsyncComic(Comic):
+
+    """
+    An awaitable variant of :class:`Comic` that fetches its page without blocking the event loop.
+
+    Awaiting the instance fetches and parses the page and returns the instance itself:
+
+    .. code-block:: python
+
+        comic = await AsyncComic("garfield")
+
+    .. note::
+
+        The attributes of :class:`Comic` are only available once the instance has been awaited. Await :meth:`fetch_about` before reading the about page attributes to avoid a blocking request.
+
+    :meth:`refresh`, :meth:`download`, :meth:`download_to`, :meth:`read_image` and :meth:`show` are coroutines. The page is refreshed through the asyncio transport, while the image is transferred by the blocking transport in the event loop's default executor. :meth:`iter_image` is not supported.
+
+    :param identifier: The comic's identifier.
+    :type identifier: :class:`str`
+    :param date: The comic's date.
+    :type date: Optional[:class:`datetime` or :class:`date`]
+    :param transport: The transport used for every request made by the comic. Defaults to the shared asyncio transport.
+    :type transport: Optional[:class:`AsyncTransport`]
+    """
+
+    def __init__(self, identifier: str, release_date: Optional[Union[datetime, date]] = None, *, transport: Optional[AsyncTransport] = None) -> None:
+        self._async_transport = transport
+        super().__init__(identifier, release_date)
+
+    def _build(self, fields: FrozenSet[str]) -> None:
+        # The page is fetched when the instance is awaited.
+        pass
+
+    def __await__(self):
+        return self._load().__await__()
+
+    async def _load(self) -> AsyncComic:
+        with _stage("comic", self.url):
+            self._apply(await self._complete_async((await self._fetch_async(parse_strip)).parsed))
+        return self
+
+    def _limiter(self) -> RateLimiter:
+        return (self._async_transport or get_async_transport()).limiter or get_rate_limiter()
+
+    async def _fetch_async(self, parser: Optional[Callable[[bytes], Any]], *, refresh: bool = False, headers: Optional[Mapping[str, str]] = None) -> AsyncResponse:
+        transport = self._async_transport or get_async_transport()
+        self._check_missing(transport.negative_cache)
+        try:
+            response = await transport.get(self.url, headers=headers, parser=parser, refresh=refresh)
+        except Exception as e:
+            self._record_missing(transport.negative_cache, e)
+            raise self._fetch_error(e) from e
+        return self._fetched(response)
+
+    async def _complete_async(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        for delay in self._retry_delays(lambda: "image_url" in fields and fields["image_url"] is None):
+            await asyncio.sleep(delay)
+            try:
+                fields = {**fields, "image_url": (await self._fetch_async(parse_strip, refresh=True)).parsed["image_url"]}
+            except ValueError:
+                continue
+        return fields
+
+    async def refresh(self, *, about: bool = False) -> List[str]: # pylint: disable=invalid-overridden-method
+        """
+        Refreshes the comic data from the website without blocking, and returns the names of the fields that changed. This is the asyncio variant of :meth:`Comic.refresh`.
+
+        :param about: Whether to also drop the comic's about page from `ABOUT_CACHE` and from the transport's cache.
+        :type about: :class:`bool`
+        """
+        transport = self._async_transport or get_async_transport()
+        if about:
+            self._forget_about(transport)
+
+        with _stage("comic", self.url):
+            response = await self._fetch_async(None, refresh=True, headers=self._validators)
+            if self._unchanged(response, transport.cache):
+                return []
+
+            names = [name for name in STRIP_FIELDS if name in self.__dict__]
+            fields = await self._complete_async(_parse(transport.cache, self.url, response, _strip_parser(frozenset(names))))
+            return self._update(names, fields)
+
+    async def download( # pylint: disable=invalid-overridden-method,too-many-arguments
+        self,
+        *,
+        filename: Optional[str] = None,
+        path: Optional[str] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        resume: bool = True,
+        overwrite: bool = False
+    ) -> str:
+        """
+        Downloads the comic image in the event loop's default executor and returns the file path. This is the asyncio variant of :meth:`Comic.download`, and takes the same parameters.
+        """
+        return await _in_executor(super().download, filename=filename, path=path, chunk_size=chunk_size, resume=resume, overwrite=overwrite)
+
+    async def download_to(self, file: BinaryIO, *, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> int: # pylint: disable=invalid-overridden-method
+        """
+        Streams the comic image into a writable binary file object in the event loop's default executor, and returns the number of bytes written. This is the asyncio variant of :meth:`Comic.download_to`.
+        """
+        return await _in_executor(super().download_to, file, chunk_size=chunk_size)
+
+    def iter_image(self, *, chunk_size: int = DOWNLOAD_CHUNK_SIZE, max_size: Optional[int] = None, checksum: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Not supported, since every chunk would block the event loop. Use :meth:`read_image` instead.
+
+        :raises TypeError: Always.
+        """
+        raise TypeError("AsyncComic cannot stream its image without blocking, use 'await comic.read_image()' instead.")
+
+    async def read_image(self, *, chunk_size: int = DOWNLOAD_CHUNK_SIZE, max_size: Optional[int] = None, checksum: Optional[str] = None) -> memoryview: # pylint: disable=invalid-overridden-method
+        """
+        Reads the comic image into memory in the event loop's default executor. This is the asyncio variant of :meth:`Comic.read_image`, and takes the same parameters.
+        """
+        return await _in_executor(super().read_image, chunk_size=chunk_size, max_size=max_size, checksum=checksum)
+
+    async def show(self, *, filename: Optional[str] = None, path: Optional[str] = None) -> None: # pylint: disable=invalid-overridden-method
+        """
+        Downloads the comic image without blocking and opens it in the default image viewer app. This is the asyncio variant of :meth:`Comic.show`.
+        """
+        await _in_executor(_open_image, await self.download(filename=filename, path=path))
+
+    async def fetch_about(self) -> About:
+        """
+        Fetches the comic's about page without blocking and stores it in the shared about cache, so that the about attributes can be read without a request.
+        """
+        url = requote_uri(f"{BASE_URL}{self.identifier}/about")
+        key = _about_key(self.identifier, self._async_transport or get_async_transport())
+        with _stage("about", url):
+            about = ABOUT_CACHE.get(key)
+            _emit("cache_miss" if about is None else "cache_hit", url=url, cache="about")
+            if about is None:
+                response = await key[1].get(url, parser=parse_about)
+                about = About._from_fields(self.identifier, response.parsed)
+                ABOUT_CACHE.set(key, about)
+        return about
+
+    def _about(self) -> About:
+        # The page stored by fetch_about is keyed by the asyncio transport. Without it, the page is fetched with the blocking transport.
+        about = ABOUT_CACHE.get(_about_key(self.identifier, self._async_transport or get_async_transport()))
+        return about if about is not None else super()._about()
+
+
+async def search(
+    *,
+    last_updated_today: Optional[bool] = None,
+    categories: List[Literal["comicos-en-espanol", "family-comics", "funny-animals", "gag-comics", "graphic-novels", "mental-health-comics", "newspaper-comic-strips", "offbeat-comics", "office-humor", "relationship-comics", "sci-fi-fantasy-comics", "sports-comics", "vintage-comics", "webcomics", "kids"]] = None,
+    transport: Optional[AsyncTransport] = None
+) -> List[str]:
+    """
+    Returns an alphabetical list of comic identifiers. This is the asyncio variant of :func:`gocomics.search`.
+
+    :param last_updated_today: If True, only return comics updated today.
+    :type last_updated_today: Optional[bool]
+    :param categories: A list of categories to filter the comics.
+    :type categories: List[Literal["comicos-en-espanol", "family-comics", "funny-animals", "gag-comics", "graphic-novels", "mental-health-comics", "newspaper-comic-strips", "offbeat-comics", "office-humor", "relationship-comics", "sci-fi-fantasy-comics", "sports-comics", "vintage-comics", "webcomics", "kids"]]
+    :param transport: The transport used to fetch the page. Defaults to the shared asyncio transport.
+    :type transport: Optional[:class:`AsyncTransport`]
+    """
+    transport = transport or get_async_transport()
+    url = _listing_url(f"{BASE_URL}comics/a-to-z", last_updated_today, categories)
+    with _stage("search", url):
+        return (await transport.get(url, parser=parse_a_to_z)).parsed
+
+async def search_political(
+    *,
+    last_updated_today: Optional[bool] = None,
+    categories: List[Literal["left", "center", "right"]] = None,
+    transport: Optional[AsyncTransport] = None
+) -> List[str]:
+    """
+    Returns an alphabetical list of political comic identifiers. This is the asyncio variant of :func:`gocomics.search_political`.
+
+    :param last_updated_today: If True, only return comics updated today.
+    :type last_updated_today: Optional[bool]
+    :param categories: A list of political categories to filter the comics.
+    :type categories: List[Literal["left", "center", "right"]]
+    :param transport: The transport used to fetch the page. Defaults to the shared asyncio transport.
+    :type transport: Optional[:class:`AsyncTransport`]
+    """
+    transport = transport or get_async_transport()
+    url = _listing_url(f"{BASE_URL}political-cartoons/political-a-to-z", last_updated_today, categories)
+    with _stage("search_political", url):
+        return (await transport.get(url, parser=parse_a_to_z)).parsed
+
+async def get_popular_comics(*, political: Optional[bool] = False, transport: Optional[AsyncTransport] = None) -> List[str]:
+    """
+    Returns a list of popular comic identifiers. This is the asyncio variant of :func:`gocomics.get_popular_comics`.
+
+    :param political: If True, returns popular political comics.
+    :type political: Optional[bool]
+    :param transport: The transport used to fetch the page. Defaults to the shared asyncio transport.
+    :type transport: Optional[:class:`AsyncTransport`]
+    """
+    transport = transport or get_async_transport()
+    url = _popular_url(political)
+    with _stage("popular", url):
+        return (await transport.get(url, parser=parse_popular)).parsed
+
+async def stream_comics( # pylint: disable=too-many-arguments
+    identifier: str,
+    *,
+    start_date: Optional[Union[datetime, date]] = datetime(1993, 7, 12),
+    end_date: Optional[Union[datetime, date]] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    transport: Optional[AsyncTransport] = None,
+    index: Optional[DateIndex] = None
+) -> AsyncIterator[Union[AsyncComic, Exception]]:
+    """
+    Streams comics for a given identifier from `start_date` to `end_date`, in date order. This is the asyncio variant of :func:`gocomics.stream_comics`.
+
+    Up to `concurrency` comics are fetched ahead of the consumer. Dates without a strip are skipped, using the links remembered in the date index. Like the threaded stream of :func:`gocomics.stream_comics`, a date that fails to resolve yields the exception it raised instead of an :class:`AsyncComic`, and the stream carries on.
+
+    :param identifier: The comic identifier.
+    :type identifier: str
+    :param start_date: The start date for the comic stream.
+    :type start_date: Optional[datetime]
+    :param end_date: The end date for the comic stream. Defaults to today.
+    :type end_date: Optional[datetime]
+    :param concurrency: The number of comics fetched ahead of the consumer.
+    :type concurrency: int
+    :param transport: The transport used by every comic. Defaults to the shared asyncio transport.
+    :type transport: Optional[:class:`AsyncTransport`]
+    :param index: The index of publication dates to use and update. Defaults to the index installed with :func:`set_date_index`, or else a new in-memory index for this stream only. It is saved when the stream ends.
+    :type index: Optional[:class:`DateIndex`]
+    """
+    index = index or _installed_date_index() or DateIndex()
+    start_date = start_date.date() if isinstance(start_date, datetime) else start_date
+    end_date = end_date.date() if isinstance(end_date, datetime) else end_date or date.today()
+    current_date = index.first_date(identifier, start_date) or start_date
+
+    pending = deque()
+    try:
+        while (current_date is not None and current_date <= end_date) or pending:
+            while current_date is not None and current_date <= end_date and len(pending) < max(concurrency, 1):
+                comic = AsyncComic(identifier, current_date, transport=transport)
+                pending.append((current_date, asyncio.ensure_future(comic)))
+                current_date = index.next_date(identifier, current_date) or current_date + timedelta(days=1)
+            _, task = pending.popleft()
+            try:
+                comic = await task
+            except Exception as e: # pylint: disable=broad-except
+                if not _is_missing(e):
+                    yield e
+                continue
+            index.record(identifier, comic.date, comic.previous_date, comic.next_date)
+            following = _following_date(comic, end_date)
+            # Dates before the next strip have no strip of their own.
+            while pending and (following is None or pending[0][0] < following):
+                pending.popleft()[1].cancel()
+            if following is None or (current_date is not None and current_date < following):
+                current_date = following
+            yield comic
+    finally:
+        for _, task in pending:
+            task.cancel()
+        index.save()
@@ -0,0 +1,559 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter, deque
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from contextlib import closing
+from datetime import date, datetime, timedelta
+from functools import partial
+from hashlib import sha256
+from itertools import islice
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .about import ABOUT_CACHE, About, _about_key, _about_url
+from .comic import DOWNLOAD_CHUNK_SIZE, Comic, _is_missing
+from .dates import DateIndex, _installed_date_index
+from .negativecache import RECENT_DAYS
+from .parsers import parse_about, parse_strip
+from .ratelimit import _retry_deadline
+from .transport import Response, Transport, _cached_parse, _store_parse, get_transport
+from .utils import _prefetched_comics, search, search_political, stream_comics
+
+if TYPE_CHECKING:
+    from .httpcache import HTTPCache
+
+MANIFEST_NAME = "manifest.jsonl"
+
+DEFAULT_MIRROR_WORKERS = 4
+DEFAULT_SYNC_WORKERS = 8
+DEFAULT_LATEST_WORKERS = 16
+DEFAULT_FETCH_WORKERS = 16
+
+
+def mirror( # pylint: disable=too-many-arguments
+    identifier: str,
+    start_date: Union[datetime, date],
+    end_date: Optional[Union[datetime, date]] = None,
+    dest: str = ".",
+    *,
+    workers: int = DEFAULT_MIRROR_WORKERS,
+    transport: Optional[Transport] = None,
+    manifest: str = MANIFEST_NAME,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE
+) -> Dict[str, int]:
+    """
+    Mirrors the archive of a comic between two dates into a directory and returns the number of dates that ended with each status.
+
+    Strip pages are resolved in one thread pool, going from each strip straight to the next one it links to like :func:`stream_comics`, and their images are downloaded in another, with :meth:`Comic.download` writing each image atomically as `YYYY-MM-DD.<extension>`. Every date is recorded in a JSON Lines manifest as soon as it is done, with its image URL, file name, SHA-256 hash, size and status: `complete`, `missing` (no strip was published that day) or `failed`. The dates skipped between two strips are recorded as missing without being requested. Running the mirror again skips the dates that are complete, and the dates missing for more than a week, and retries the rest, so an interrupted mirror picks up where it stopped and recent strips published late are still mirrored.
+
+    :param identifier: The comic identifier.
+    :type identifier: str
+    :param start_date: The first date to mirror.
+    :type start_date: Union[datetime, date]
+    :param end_date: The last date to mirror. Defaults to today.
+    :type end_date: Optional[Union[datetime, date]]
+    :param dest: The directory the images and the manifest are written to. It is created if needed.
+    :type dest: str
+    :param workers: The number of threads resolving pages, and of threads downloading images.
+    :type workers: int
+    :param transport: The transport used for every request. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
+    :param manifest: The file name of the manifest inside `dest`.
+    :type manifest: str
+    :param chunk_size: The number of bytes read from the connection and written at a time.
+    :type chunk_size: int
+    """
+    start_date = _as_date(start_date)
+    end_date = _as_date(end_date or date.today())
+    os.makedirs(dest, exist_ok=True)
+
+    manifest_path = os.path.join(dest, manifest)
+    spans, counts = _spans_to_mirror(manifest_path, dest, start_date, end_date)
+    build = partial(Comic, identifier, transport=transport, fields=("image_url",))
+    with closing(_strips_to_mirror(identifier, spans, _installed_date_index() or DateIndex(), build, workers)) as strips:
+        calls = ((day, strip, last_day, dest, chunk_size) for day, strip, last_day in strips)
+        with closing(_in_order(_mirror_strip, calls, workers)) as results:
+            _write_manifest(manifest_path, results, counts)
+
+    return dict(counts)
+
+def read_manifest(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Reads a manifest written by :func:`mirror` and returns the latest entry for each date, keyed by its ISO date. A missing manifest reads as empty.
+
+    :param path: The path of the manifest.
+    :type path: str
+    """
+    entries = {}
+    try:
+        with open(path, encoding="utf-8") as manifest_file:
+            for line in manifest_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                entries[entry["date"]] = entry
+    except FileNotFoundError:
+        pass
+    return entries
+
+def sync( # pylint: disable=too-many-arguments
+    identifiers: Iterable[str],
+    state_path: str,
+    *,
+    since: Optional[Union[datetime, date]] = None,
+    workers: int = DEFAULT_SYNC_WORKERS,
+    transport: Optional[Transport] = None,
+    check_updates: bool = True
+) -> Generator[Union[Comic, Exception], None, None]:
+    """
+    Yields the strips published since the last sync for each comic, and remembers how far each comic has been synced.
+
+    The state file records, for each identifier, the date of the last strip yielded and the date up to which every strip has been yielded. Comics are synced in a thread pool, and the strips of each comic are yielded in date order once it is done. Today only counts as synced once its strip was found, so a strip published later in the day is yielded by the next sync. A comic's state is saved once all of its strips have been yielded, so if the consumer stops early, those strips are yielded again by the next sync. A comic that fails to sync yields the exception it raised after its strips, and it is retried from where it stopped by the next sync.
+
+    .. note::
+
+        If `check_updates` is True, the comics updated today are listed with :func:`search` and :func:`search_political`. A comic synced up to yesterday that is not listed is skipped without any request.
+
+    :param identifiers: The comic identifiers.
+    :type identifiers: Iterable[str]
+    :param state_path: The JSON file the state is loaded from and saved to.
+    :type state_path: str
+    :param since: The first date to sync for comics without any state. Defaults to today.
+    :type since: Optional[Union[datetime, date]]
+    :param workers: The number of comics synced at once.
+    :type workers: int
+    :param transport: The transport used for every request. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
+    :param check_updates: Whether to skip the comics that were not updated today.
+    :type check_updates: bool
+    """
+    today = date.today()
+    state = read_sync_state(state_path)
+
+    updated = None
+    if check_updates:
+        updated = set(search(last_updated_today=True, transport=transport)) | set(search_political(last_updated_today=True, transport=transport))
+    starts = _sync_starts(identifiers, state, _as_date(since or today), today, updated)
+
+    executor = ThreadPoolExecutor(max(workers, 1))
+    futures = {executor.submit(_sync_comic, identifier, start, today, transport): identifier for identifier, start in starts.items()}
+    try:
+        for future in as_completed(futures):
+            comics, error = future.result()
+            yield from comics
+
+            _record_sync(state.setdefault(futures[future], {"mark": None, "checked": None}), comics, error, today)
+            _write_sync_state(state_path, state)
+
+            if error is not None:
+                yield error
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+def fetch_latest(
+    identifiers: Iterable[str],
+    *,
+    workers: int = DEFAULT_LATEST_WORKERS,
+    deadline: Optional[float] = None,
+    transport: Optional[Transport] = None
+) -> Tuple[Dict[str, Comic], Dict[str, Exception]]:
+    """
+    Fetches the latest strip of every comic at once, and returns the comics and the failures, each keyed by identifier.
+
+    .. code-block:: python3
+
+        comics, failures = gocomics.fetch_latest(gocomics.get_popular_comics(), deadline=60)
+
+    If `deadline` passes, the comics fetched so far are returned, and every other identifier fails with a :class:`TimeoutError`. Retries that would end after the deadline are not made, so the remaining threads finish soon after in the background.
+
+    .. note::
+
+        Requests are paced per host by the transport's rate limiter. To also bound the number of requests in flight to each host, pass a transport created with `per_host`.
+
+    :param identifiers: The comic identifiers. Duplicates are fetched once.
+    :type identifiers: Iterable[str]
+    :param workers: The number of comics fetched at once.
+    :type workers: int
+    :param deadline: The number of seconds after which to stop waiting and return.
+    :type deadline: Optional[float]
+    :param transport: The transport used for every request. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
+    """
+    identifiers = list(dict.fromkeys(identifiers))
+    expires = monotonic() + deadline if deadline is not None else None
+
+    executor = ThreadPoolExecutor(max(workers, 1))
+    futures = {identifier: executor.submit(_fetch_latest_comic, identifier, transport, expires) for identifier in identifiers}
+    try:
+        wait(futures.values(), timeout=deadline)
+    finally:
+        for future in futures.values():
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    comics, failures = {}, {}
+    for identifier, future in futures.items():
+        if not future.done() or future.cancelled():
+            failures[identifier] = TimeoutError(f"Comic with identifier '{identifier}' was not fetched within {deadline} seconds.")
+        elif future.exception() is not None:
+            failures[identifier] = future.exception()
+        else:
+            comics[identifier] = future.result()
+    return comics, failures
+
+def fetch_comics( # pylint: disable=too-many-arguments
+    strips: Iterable[Union[str, Tuple[str, Optional[Union[datetime, date]]]]],
+    *,
+    fetch_workers: int = DEFAULT_FETCH_WORKERS,
+    parse_workers: Optional[int] = None,
+    prefetch: Optional[int] = None,
+    about: bool = False,
+    transport: Optional[Transport] = None
+) -> Generator[Union[Comic, Exception], None, None]:
+    """
+    Fetches many strips at once, parsing their pages in a process pool, and yields the comics in the order they were given.
+
+    .. code-block:: python3
+
+        if __name__ == "__main__":
+            days = [("garfield", date(2024, 1, 1) + timedelta(days=n)) for n in range(366)]
+            for comic in gocomics.fetch_comics(days, fetch_workers=32, parse_workers=16):
+                ...
+
+    The pipeline has two stages, sized separately: `fetch_workers` threads only download the pages, and hand the raw bytes to `parse_workers` processes, which parse them into fields. The comics are then built from the fields back in the fetch threads, which request a page again only if its image URL is missing, like :class:`Comic` does. Pages whose parsed fields are already in the transport's cache skip the pool. A strip that cannot be fetched yields the exception it raised instead of a :class:`Comic`, and the pipeline carries on.
+
+    .. note::
+
+        The parse processes are started with the default method of the platform. Where it is "spawn" (Windows and macOS), the calling script must be guarded by ``if __name__ == "__main__":``. Pass ``parse_workers=0`` to parse in the fetch threads instead.
+
+    :param strips: The strips to fetch, as identifiers (for the latest strip) or ``(identifier, date)`` pairs.
+    :type strips: Iterable[Union[str, Tuple[str, Optional[date]]]]
+    :param fetch_workers: The number of pages downloaded at once.
+    :type fetch_workers: int
+    :param parse_workers: The number of processes parsing pages. Defaults to the number of CPUs.
+    :type parse_workers: Optional[int]
+    :param prefetch: The maximum number of strips fetched, parsed or buffered ahead of the consumer. Defaults to twice the number of workers of both stages.
+    :type prefetch: Optional[int]
+    :param about: Whether to also fetch and parse the about page of every comic, so that the about attributes of the comics do not need a request. Pages already in `ABOUT_CACHE` are not fetched again.
+    :type about: bool
+    :param transport: The transport used for every request. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
+    """
+    parse_workers = (os.cpu_count() or 1) if parse_workers is None else parse_workers
+    window = max(prefetch or 2 * (fetch_workers + parse_workers), 1)
+    cache = (transport or get_transport()).cache
+
+    fetcher = ThreadPoolExecutor(max(fetch_workers, 1))
+    pool = ProcessPoolExecutor(parse_workers) if parse_workers > 0 else None
+    try:
+        yield from _pipeline(_page_jobs(strips, about, transport), fetcher, pool, cache, window)
+    finally:
+        fetcher.shutdown(wait=False)
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+def read_sync_state(path: str) -> Dict[str, Dict[str, Optional[str]]]:
+    """
+    Reads a state file written by :func:`sync` and returns, for each identifier, the ISO dates of the last strip yielded (``"mark"``) and of the day up to which every strip has been yielded (``"checked"``). A missing state file reads as empty.
+
+    :param path: The path of the state file.
+    :type path: str
+    """
+    try:
+        with open(path, encoding="utf-8") as state_file:
+            return json.load(state_file)
+    except FileNotFoundError:
+        return {}
+
+def _spans_to_mirror(manifest_path: str, dest: str, start_date: date, end_date: date) -> Tuple[List[Tuple[date, date]], Counter]:
+    # Returns the first and last day of every run of dates that are not done yet.
+    settled = (date.today() - timedelta(days=RECENT_DAYS)).isoformat()
+    done = {day for day, entry in read_manifest(manifest_path).items() if _is_done(entry, dest, settled)}
+    spans, counts = [], Counter()
+    for offset in range((end_date - start_date).days + 1):
+        day = start_date + timedelta(days=offset)
+        if day.isoformat() in done:
+            counts["skipped"] += 1
+        elif spans and spans[-1][1] == day - timedelta(days=1):
+            spans[-1] = (spans[-1][0], day)
+        else:
+            spans.append((day, day))
+    return spans, counts
+
+def _strips_to_mirror(identifier: str, spans: List[Tuple[date, date]], index: DateIndex, build: Callable[[date], Comic], workers: int) -> Generator[Tuple[date, Union[Comic, Exception], date], None, None]:
+    # Yields every date tried in each span, with its comic or error and the last day of the span. Dates between a strip and the next one it links to are not tried.
+    for first_day, last_day in spans:
+        start = index.first_date(identifier, first_day) or first_day
+        with closing(_prefetched_comics(identifier, start, last_day, index, build, workers=max(workers, 1), window=max(workers, 1) * 2)) as strips:
+            for day, strip in strips:
+                yield day, strip, last_day
+
+def _in_order(function: Callable[..., Any], calls: Iterable[tuple], workers: int) -> Generator[Any, None, None]:
+    # Runs the calls in a thread pool, at most two per thread ahead of the consumer, and yields their results in order.
+    executor = ThreadPoolExecutor(max(workers, 1))
+    calls = iter(calls)
+    pending = deque()
+    try:
+        while True:
+            for args in islice(calls, max(workers, 1) * 2 - len(pending)):
+                pending.append(executor.submit(function, *args))
+            if not pending:
+                return
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+def _mirror_strip(day: date, strip: Union[Comic, Exception], last_day: date, dest: str, chunk_size: int) -> List[Dict[str, Any]]:
+    # Returns the entry for `day`, followed by those for the days before the next strip, which have none.
+    entries = [_mirror_entry(day, strip, dest, chunk_size)]
+    if isinstance(strip, Comic) and strip.next_date is not None:
+        blank = day + timedelta(days=1)
+        while blank < strip.next_date and blank <= last_day:
+            entries.append(_manifest_entry(blank, "missing"))
+            blank += timedelta(days=1)
+    return entries
+
+def _mirror_entry(day: date, strip: Union[Comic, Exception], dest: str, chunk_size: int) -> Dict[str, Any]:
+    entry = _manifest_entry(day, "failed")
+    if isinstance(strip, Exception):
+        if _is_missing(strip):
+            entry["status"] = "missing"
+        else:
+            entry["error"] = str(strip)
+        return entry
+
+    entry["url"] = strip.image_url
+    if not strip.image_url:
+        entry["error"] = "The strip page has no image URL."
+        return entry
+    try:
+        full_path = strip.download(filename=day.isoformat(), path=dest, chunk_size=chunk_size)
+    except Exception as e: # pylint: disable=broad-except
+        entry["error"] = str(e)
+        return entry
+
+    digest = sha256()
+    with open(full_path, "rb") as image_file:
+        for chunk in iter(lambda: image_file.read(chunk_size), b""):
+            digest.update(chunk)
+    entry.update(file=os.path.basename(full_path), sha256=digest.hexdigest(), size=os.path.getsize(full_path), status="complete")
+    return entry
+
+def _write_manifest(manifest_path: str, results: Iterable[List[Dict[str, Any]]], counts: Counter) -> None:
+    with open(manifest_path, "a", encoding="utf-8") as manifest_file:
+        for entries in results:
+            for entry in entries:
+                counts[entry["status"]] += 1
+                manifest_file.write(json.dumps(entry) + "\n")
+            manifest_file.flush()
+
+def _manifest_entry(day: date, status: str) -> Dict[str, Any]:
+    return {"date": day.isoformat(), "url": None, "file": None, "sha256": None, "size": None, "status": status, "error": None}
+
+def _page_jobs(strips: Iterable[Union[str, Tuple[str, Optional[Union[datetime, date]]]]], about: bool, transport: Optional[Transport]) -> Iterator[tuple]:
+    # Yields the fetch function and its arguments for every page to fetch.
+    seen = set()
+    for strip in strips:
+        identifier, day = (strip, None) if isinstance(strip, str) else strip
+        if about and identifier not in seen and ABOUT_CACHE.get(_about_key(identifier, transport)) is None:
+            yield _fetch_about_page, identifier, transport
+        seen.add(identifier)
+        yield _fetch_strip_page, identifier, _as_date(day) if day is not None else None, transport
+
+def _pipeline(jobs: Iterator[tuple], fetcher: ThreadPoolExecutor, pool: Optional[ProcessPoolExecutor], cache: Optional[HTTPCache], window: int) -> Generator[Union[Comic, Exception], None, None]:
+    pending = deque()
+    try:
+        while True:
+            for job in islice(jobs, max(window - len(pending), 0)):
+                pending.append((job[0], *_submit(fetcher, pool, cache, *job)))
+            if not pending:
+                return
+            fetch, _, outcome = pending.popleft()
+            try:
+                result = outcome.result()
+            except Exception as e: # pylint: disable=broad-except
+                # The about attributes are fetched on first access instead.
+                result = None if fetch is _fetch_about_page else e
+            if result is not None:
+                yield result
+    finally:
+        for _, fetched, _ in pending:
+            fetched.cancel()
+
+def _submit(fetcher: ThreadPoolExecutor, pool: Optional[ProcessPoolExecutor], cache: Optional[HTTPCache], fetch: Callable[..., _Page], *args) -> Tuple[Future, Future]:
+    outcome = Future()
+    fetched = fetcher.submit(_fetch_page, cache, pool is None, fetch, *args)
+    fetched.add_done_callback(partial(_hand_off, fetcher, pool, cache, outcome))
+    return fetched, outcome
+
+def _fetch_page(cache: Optional[HTTPCache], inline: bool, fetch: Callable[..., _Page], *args) -> Any:
+    # Returns the page itself if it is left to the parse pool, and the result built from its fields otherwise.
+    page = fetch(*args)
+    found, fields = _cached_parse(cache, page.url, page.response, page.parser)
+    if found:
+        return page.finish(cache, fields)
+    if inline:
+        return page.finish(cache, *_timed_parse(page.parser, page.response.content))
+    return page
+
+def _fetch_strip_page(identifier: str, day: Optional[date], transport: Optional[Transport]) -> _Page:
+    comic, response = Comic._unparsed(identifier, day, transport) # pylint: disable=protected-access
+    return _Page(comic.url, response, parse_strip, comic._finish) # pylint: disable=protected-access
+
+def _fetch_about_page(identifier: str, transport: Optional[Transport]) -> _Page:
+    url = _about_url(identifier)
+    key = _about_key(identifier, transport)
+    return _Page(url, key[1].get(url), parse_about, partial(_cache_about, key))
+
+def _cache_about(key: Tuple[str, Transport], fields: Dict[str, Any]) -> None:
+    ABOUT_CACHE.set(key, About._from_fields(key[0], fields)) # pylint: disable=protected-access
+
+def _hand_off(fetcher: ThreadPoolExecutor, pool: Optional[ProcessPoolExecutor], cache: Optional[HTTPCache], outcome: Future, fetched: Future) -> None:
+    if fetched.cancelled() or not outcome.set_running_or_notify_cancel():
+        return
+    if fetched.exception() is not None:
+        outcome.set_exception(fetched.exception())
+        return
+    page = fetched.result()
+    if not isinstance(page, _Page):
+        outcome.set_result(page)
+        return
+    try:
+        parsed = pool.submit(_timed_parse, page.parser, page.response.content)
+    except RuntimeError as e:
+        # The pool is shut down once the consumer stops.
+        outcome.set_exception(e)
+        return
+    parsed.add_done_callback(partial(_settle, fetcher, partial(page.finish, cache), outcome))
+
+def _settle(fetcher: ThreadPoolExecutor, finish: Callable[[Any, float], Any], outcome: Future, parsed: Future) -> None:
+    # The result is built in a fetch thread, since completing a comic may fetch its page again.
+    if parsed.cancelled():
+        outcome.set_exception(CancelledError())
+        return
+    if parsed.exception() is not None:
+        outcome.set_exception(parsed.exception())
+        return
+    try:
+        finished = fetcher.submit(finish, *parsed.result())
+    except RuntimeError as e:
+        outcome.set_exception(e)
+        return
+    finished.add_done_callback(partial(_relay, outcome))
+
+def _relay(outcome: Future, finished: Future) -> None:
+    if finished.cancelled():
+        outcome.set_exception(CancelledError())
+    elif finished.exception() is not None:
+        outcome.set_exception(finished.exception())
+    else:
+        outcome.set_result(finished.result())
+
+def _timed_parse(parser: Callable[[bytes], Any], html: bytes) -> Tuple[Any, float]:
+    started = perf_counter()
+    fields = parser(html)
+    return fields, perf_counter() - started
+
+def _fetch_latest_comic(identifier: str, transport: Optional[Transport], expires: Optional[float]) -> Comic:
+    with _retry_deadline(expires):
+        return Comic(identifier, transport=transport)
+
+def _sync_comic(identifier: str, start_date: date, end_date: date, transport: Optional[Transport]) -> Tuple[List[Comic], Optional[Exception]]:
+    comics = []
+    try:
+        for comic in stream_comics(identifier, start_date=start_date, end_date=end_date, transport=transport):
+            comics.append(comic)
+    except Exception as e: # pylint: disable=broad-except
+        return comics, e
+    return comics, None
+
+def _sync_starts(identifiers: Iterable[str], state: Dict[str, Dict[str, Optional[str]]], since: date, today: date, updated: Optional[set]) -> Dict[str, date]:
+    # Returns the date each comic that needs a sync starts from.
+    yesterday = (today - timedelta(days=1)).isoformat()
+    starts = {}
+    for identifier in identifiers:
+        checked = state.get(identifier, {}).get("checked")
+        if checked is None:
+            starts[identifier] = since
+        elif checked < today.isoformat() and (updated is None or identifier in updated or checked < yesterday):
+            starts[identifier] = date.fromisoformat(checked) + timedelta(days=1)
+    return starts
+
+def _record_sync(entry: Dict[str, Optional[str]], comics: List[Comic], error: Optional[Exception], today: date) -> None:
+    if comics:
+        entry["mark"] = comics[-1].date.isoformat()
+    if error is None:
+        # Today's strip may not be published yet, so today is only checked once it was found.
+        entry["checked"] = today.isoformat() if comics and comics[-1].date == today else max(entry["checked"] or "", (today - timedelta(days=1)).isoformat())
+    elif comics:
+        entry["checked"] = comics[-1].date.isoformat()
+
+def _write_sync_state(path: str, state: Dict[str, Dict[str, Optional[str]]]) -> None:
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as state_file:
+        json.dump(state, state_file, indent=1, sort_keys=True)
+    os.replace(temporary_path, path)
+
+def _is_done(entry: Dict[str, Any], dest: str, settled: str) -> bool:
+    # A recent date may be missing only because its strip is not published yet.
+    if entry.get("status") == "missing":
+        return entry["date"] < settled
+    if entry.get("status") != "complete" or not entry.get("file"):
+        return False
+    full_path = os.path.join(dest, entry["file"])
+    return os.path.isfile(full_path) and os.path.getsize(full_path) == entry.get("size")
+
+def _as_date(value: Union[datetime, date]) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class _Page:
+
+    # A fetched page, and the function building the pipeline's result from its parsed fields.
+
+    __slots__ = ("url", "response", "parser", "build")
+
+    def __init__(self, url: str, response: Response, parser: Callable[[bytes], Any], build: Callable[[Dict[str, Any]], Any]) -> None:
+        self.url = url
+        self.response = response
+        self.parser = parser
+        self.build = build
+
+    def finish(self, cache: Optional[HTTPCache], fields: Dict[str, Any], duration: Optional[float] = None) -> Any:
+        # A duration is given for fields that were just parsed, which are stored in the cache.
+        if duration is not None:
+            _store_parse(cache, self.url, self.response, self.parser, value=fields, duration=duration)
+        return self.build(fields)
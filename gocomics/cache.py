@@ -0,0 +1,166 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+
+_T = TypeVar("_T")
+
+
+class TTLCache:
+
+    """
+    A thread-safe, size-bounded cache that evicts the least recently used entry when full and drops entries older than `ttl` seconds.
+
+    :param maxsize: The maximum number of entries kept in the cache.
+    :type maxsize: :class:`int`
+    :param ttl: The number of seconds an entry stays valid, or None to keep entries until they are evicted.
+    :type ttl: Optional[:class:`float`]
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def _expire(self) -> None:
+        if self.ttl is None:
+            return
+        now = monotonic()
+        for key in [key for key, (expires, _) in self._data.items() if expires <= now]:
+            del self._data[key]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value stored for `key`, or `default` if it is missing or expired.
+
+        :param key: The key to look up.
+        :type key: Hashable
+        :param default: The value returned on a miss.
+        :type default: Any
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires, value = item
+            if expires is not None and expires <= monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores `value` under `key`, evicting the least recently used entry if the cache is full.
+
+        :param key: The key to store the value under.
+        :type key: Hashable
+        :param value: The value to store.
+        :type value: Any
+        """
+        with self._lock:
+            expires = monotonic() + self.ttl if self.ttl is not None else None
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._expire()
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Removes `key` from the cache and returns its value, or `default` if it was not cached.
+
+        :param key: The key to remove.
+        :type key: Hashable
+        :param default: The value returned if the key is missing.
+        :type default: Any
+        """
+        with self._lock:
+            item = self._data.pop(key, None)
+        return item[1] if item is not None else default
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+
+class _Shared(Generic[_T]):
+
+    """
+    Holds an instance shared by the library, such as the shared transport. It is created on first use and can be replaced at any time.
+
+    :param factory: Creates the instance on first use, and again after it is replaced with None.
+    :type factory: Callable[[], T]
+    """
+
+    def __init__(self, factory: Callable[[], _T]) -> None:
+        self._factory = factory
+        self._value = None
+        self._lock = Lock()
+
+    def get(self) -> _T:
+        """
+        Returns the shared instance, creating it if there is none.
+        """
+        with self._lock:
+            if self._value is None:
+                self._value = self._factory()
+            return self._value
+
+    def set(self, value: Optional[_T]) -> Optional[_T]:
+        """
+        Replaces the shared instance and returns the previous one, if any.
+
+        :param value: The new instance, or None to create a new one on next use.
+        :type value: Optional[T]
+        """
+        with self._lock:
+            previous, self._value = self._value, value
+        return previous
+
+
+_MISSING = object()
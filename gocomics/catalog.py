@@ -0,0 +1,358 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .endpoints import BASE_URL
+from .parsers import parse_a_to_z_entries
+from .transport import Transport, get_transport
+from .utils import _listing_url, get_popular_comics
+
+COMIC_CATEGORIES = (
+    "comicos-en-espanol", "family-comics", "funny-animals", "gag-comics", "graphic-novels", "mental-health-comics", "newspaper-comic-strips",
+    "offbeat-comics", "office-humor", "relationship-comics", "sci-fi-fantasy-comics", "sports-comics", "vintage-comics", "webcomics", "kids"
+)
+POLITICAL_CATEGORIES = ("left", "center", "right")
+
+DEFAULT_CATALOG_WORKERS = 8
+
+
+class CatalogEntry:
+
+    """
+    A class that represents a comic in a :class:`Catalog`.
+
+    :param identifier: The comic's identifier.
+    :type identifier: :class:`str`
+    :param name: The comic's display name.
+    :type name: :class:`str`
+    :param categories: The categories the comic is listed in. For political comics, these are its leanings.
+    :type categories: Iterable[:class:`str`]
+    :param political: Whether the comic is a political cartoon.
+    :type political: :class:`bool`
+    :param rank: The comic's position in the popular comics, starting at 1, if it is listed there.
+    :type rank: Optional[:class:`int`]
+    """
+
+    __slots__ = ("identifier", "name", "categories", "political", "rank")
+
+    def __init__(self, identifier: str, name: str, categories: Iterable[str] = (), political: bool = False, rank: Optional[int] = None) -> None:
+        self.identifier = identifier
+        self.name = name
+        self.categories = tuple(sorted(categories))
+        self.political = political
+        self.rank = rank
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> CatalogEntry:
+        """
+        Creates an entry from a dictionary returned by :meth:`to_dict`.
+
+        :param data: The dictionary.
+        :type data: Dict[:class:`str`, Any]
+        """
+        return cls(data["identifier"], data["name"], data["categories"], data["political"], data["rank"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the entry as a JSON-serializable dictionary.
+        """
+        return {"identifier": self.identifier, "name": self.name, "categories": list(self.categories), "political": self.political, "rank": self.rank}
+
+    def __eq__(self, __o: object) -> bool:
+        if not isinstance(__o, CatalogEntry):
+            return NotImplemented
+        return self.to_dict() == __o.to_dict()
+
+    def __hash__(self) -> int:
+        return hash((self.identifier, self.name, self.categories, self.political, self.rank))
+
+    def __repr__(self) -> str:
+        return f"CatalogEntry(identifier={self.identifier!r}, name={self.name!r}, categories={self.categories!r}, political={self.political!r}, rank={self.rank!r})"
+
+
+class Catalog:
+
+    """
+    A class that keeps a local catalog of every comic, with its name, categories, political flag and popularity rank, and answers queries about it from memory.
+
+    The catalog is built once with :meth:`build`, which fetches the A to Z listings under every category filter, and kept up to date with :meth:`refresh`. It is kept in a JSON file if a path is given, so that later runs can query it without any request.
+
+    .. code-block:: python3
+
+        catalog = gocomics.Catalog("gocomics-catalog.json")
+        if not catalog:
+            catalog.build()
+        catalog.category("funny-animals")
+        catalog.prefix("cal")
+        catalog.fuzzy("calvin hobbs")
+
+    :param path: The JSON file the catalog is loaded from and saved to. Defaults to None, to keep it in memory only.
+    :type path: Optional[:class:`str`]
+
+    :ivar updated: When the catalog was last built or refreshed, if ever.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self.updated: Optional[datetime] = None
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._categories: Dict[str, Tuple[CatalogEntry, ...]] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._trigrams: Dict[str, List[str]] = {}
+        self._trigram_counts: Dict[str, int] = {}
+        self._lock = Lock()
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as catalog_file:
+                data = json.load(catalog_file)
+            self._load([CatalogEntry.from_dict(entry) for entry in data["entries"]], datetime.fromisoformat(data["updated"]) if data["updated"] else None)
+
+    def build(self, *, transport: Optional[Transport] = None, workers: int = DEFAULT_CATALOG_WORKERS) -> None:
+        """
+        Builds the catalog from scratch and saves it. The A to Z listings, under every category filter, and the popular comics are fetched at once in a thread pool.
+
+        :param transport: The transport used for every request. Defaults to the shared transport.
+        :type transport: Optional[:class:`Transport`]
+        :param workers: The number of listings fetched at once.
+        :type workers: :class:`int`
+        """
+        self._update(transport, workers, categorize=True)
+
+    def refresh(self, *, transport: Optional[Transport] = None, workers: int = DEFAULT_CATALOG_WORKERS) -> Tuple[List[str], List[str]]:
+        """
+        Updates the catalog and saves it, returning the identifiers added and removed.
+
+        Only the full A to Z listings and the popular comics are fetched, which updates names and ranks. The listings under each category filter are fetched again only if comics were added. Use a transport with an :class:`HTTPCache` to make unchanged listings cost a conditional request.
+
+        :param transport: The transport used for every request. Defaults to the shared transport.
+        :type transport: Optional[:class:`Transport`]
+        :param workers: The number of listings fetched at once.
+        :type workers: :class:`int`
+        """
+        if not self._entries:
+            self.build(transport=transport, workers=workers)
+            return sorted(self._entries), []
+        return self._update(transport, workers, categorize=False)
+
+    def get(self, identifier: str) -> Optional[CatalogEntry]:
+        """
+        Returns the entry of a comic, or None if it is not in the catalog.
+
+        :param identifier: The comic's identifier.
+        :type identifier: :class:`str`
+        """
+        return self._entries.get(identifier)
+
+    def category(self, category: str) -> List[CatalogEntry]:
+        """
+        Returns the comics listed in a category, or with a political leaning, sorted by identifier.
+
+        :param category: A category from :data:`COMIC_CATEGORIES` or :data:`POLITICAL_CATEGORIES`.
+        :type category: :class:`str`
+        """
+        return list(self._categories.get(category, ()))
+
+    def political(self) -> List[CatalogEntry]:
+        """
+        Returns the political comics, sorted by identifier.
+        """
+        return [entry for entry in self._entries.values() if entry.political]
+
+    def popular(self, *, political: Optional[bool] = None, limit: Optional[int] = None) -> List[CatalogEntry]:
+        """
+        Returns the popular comics, most popular first.
+
+        :param political: If True, only political comics. If False, only other comics. If None, both, ordered by rank with ties kept together.
+        :type political: Optional[:class:`bool`]
+        :param limit: The maximum number of comics returned.
+        :type limit: Optional[:class:`int`]
+        """
+        entries = [entry for entry in self._entries.values() if entry.rank is not None and (political is None or entry.political == political)]
+        entries.sort(key=lambda entry: (entry.rank, entry.political))
+        return entries[:limit]
+
+    def prefix(self, text: str, *, limit: Optional[int] = None) -> List[CatalogEntry]:
+        """
+        Returns the comics whose identifier, name or a word of their name starts with `text`, ignoring case, spaces and punctuation, sorted by identifier.
+
+        :param text: The prefix.
+        :type text: :class:`str`
+        :param limit: The maximum number of comics returned.
+        :type limit: Optional[:class:`int`]
+        """
+        key = _normalize(text)
+        if not key:
+            return []
+        keys = self._keys
+        found: Dict[str, None] = {}
+        position = bisect_left(keys, (key, ""))
+        while position < len(keys) and keys[position][0].startswith(key):
+            found[keys[position][1]] = None
+            position += 1
+        return [self._entries[identifier] for identifier in sorted(found)][:limit]
+
+    def fuzzy(self, text: str, *, limit: int = 10, cutoff: float = 0.3) -> List[CatalogEntry]:
+        """
+        Returns the comics whose name or identifier is most similar to `text`, best match first. Similarity is measured by the trigrams the two have in common, so typos and missing words still match.
+
+        :param text: The approximate name.
+        :type text: :class:`str`
+        :param limit: The maximum number of comics returned.
+        :type limit: :class:`int`
+        :param cutoff: The minimum similarity, between 0 and 1, of the comics returned.
+        :type cutoff: :class:`float`
+        """
+        query = _trigrams(text)
+        if not query:
+            return []
+        common: Dict[str, int] = defaultdict(int)
+        for trigram in query:
+            for identifier in self._trigrams.get(trigram, ()):
+                common[identifier] += 1
+        scores = []
+        for identifier, count in common.items():
+            score = 2 * count / (len(query) + self._trigram_counts[identifier])
+            if score >= cutoff:
+                scores.append((-score, identifier))
+        scores.sort()
+        return [self._entries[identifier] for _, identifier in scores[:limit]]
+
+    def save(self) -> None:
+        """
+        Writes the catalog to its file, if it has one. The file is replaced atomically.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            data = {"updated": self.updated.isoformat() if self.updated else None, "entries": [entry.to_dict() for entry in self._entries.values()]}
+            temporary_path = f"{self.path}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as catalog_file:
+                json.dump(data, catalog_file, indent=1)
+            os.replace(temporary_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._entries
+
+    def __iter__(self) -> Iterator[CatalogEntry]:
+        return iter(list(self._entries.values()))
+
+    def __repr__(self) -> str:
+        return f"Catalog(path={self.path!r}, entries={len(self._entries)})"
+
+    def _update(self, transport: Optional[Transport], workers: int, *, categorize: bool) -> Tuple[List[str], List[str]]:
+        transport = transport or get_transport()
+        listings = {
+            "comics": _listing_url(f"{BASE_URL}comics/a-to-z", None, None),
+            "political": _listing_url(f"{BASE_URL}political-cartoons/political-a-to-z", None, None)
+        }
+        with ThreadPoolExecutor(max(workers, 1)) as executor:
+            popular = {political: executor.submit(get_popular_comics, political=political, transport=transport) for political in (False, True)}
+            names = {kind: executor.submit(_fetch_listing, transport, url) for kind, url in listings.items()}
+            comics = {entry["identifier"]: entry["name"] for entry in names["comics"].result()}
+            political = {entry["identifier"]: entry["name"] for entry in names["political"].result()}
+
+            added = sorted((comics.keys() | political.keys()) - self._entries.keys())
+            removed = sorted(self._entries.keys() - comics.keys() - political.keys())
+            if categorize or added:
+                categories = _fetch_categories(executor, transport)
+            else:
+                categories = defaultdict(set, {identifier: set(entry.categories) for identifier, entry in self._entries.items()})
+            ranks = _popular_ranks(popular)
+
+        self._load(_catalog_entries(comics, political, categories, ranks), datetime.now(timezone.utc))
+        self.save()
+        return added, removed
+
+    def _load(self, entries: List[CatalogEntry], updated: Optional[datetime]) -> None:
+        by_category: Dict[str, List[CatalogEntry]] = defaultdict(list)
+        keys = []
+        trigrams: Dict[str, List[str]] = defaultdict(list)
+        trigram_counts = {}
+        for entry in sorted(entries, key=lambda entry: entry.identifier):
+            for category in entry.categories:
+                by_category[category].append(entry)
+            words = {_normalize(entry.identifier), _normalize(entry.name), *map(_normalize, entry.name.split())}
+            keys.extend((word, entry.identifier) for word in words if word)
+            entry_trigrams = _trigrams(entry.name) | _trigrams(entry.identifier)
+            for trigram in entry_trigrams:
+                trigrams[trigram].append(entry.identifier)
+            trigram_counts[entry.identifier] = len(entry_trigrams)
+        keys.sort()
+
+        with self._lock:
+            self._entries = {entry.identifier: entry for entry in sorted(entries, key=lambda entry: entry.identifier)}
+            self._categories = {category: tuple(members) for category, members in by_category.items()}
+            self._keys = keys
+            self._trigrams = dict(trigrams)
+            self._trigram_counts = trigram_counts
+            self.updated = updated
+
+
+def _catalog_entries(comics: Dict[str, str], political: Dict[str, str], categories: Dict[str, Set[str]], ranks: Dict[Tuple[str, bool], int]) -> List[CatalogEntry]:
+    entries = []
+    for identifier in sorted(comics.keys() | political.keys()):
+        is_political = identifier in political
+        name = comics.get(identifier) or political.get(identifier) or identifier
+        entries.append(CatalogEntry(identifier, name, categories[identifier], is_political, ranks.get((identifier, is_political))))
+    return entries
+
+def _fetch_categories(executor: ThreadPoolExecutor, transport: Transport) -> Dict[str, Set[str]]:
+    urls = {category: _listing_url(f"{BASE_URL}comics/a-to-z", None, [category]) for category in COMIC_CATEGORIES}
+    urls.update({category: _listing_url(f"{BASE_URL}political-cartoons/political-a-to-z", None, [category]) for category in POLITICAL_CATEGORIES})
+    futures = {category: executor.submit(_fetch_listing, transport, url) for category, url in urls.items()}
+    categories: Dict[str, Set[str]] = defaultdict(set)
+    for category, future in futures.items():
+        for entry in future.result():
+            categories[entry["identifier"]].add(category)
+    return categories
+
+def _popular_ranks(popular: Dict[bool, Future]) -> Dict[Tuple[str, bool], int]:
+    # Maps each popular comic, with whether it is political, to its best rank.
+    ranks = {}
+    for is_political, future in popular.items():
+        for rank, identifier in enumerate(future.result(), 1):
+            ranks.setdefault((identifier, is_political), rank)
+    return ranks
+
+def _fetch_listing(transport: Transport, url: str) -> List[Dict[str, str]]:
+    return transport.get(url, parser=parse_a_to_z_entries).parsed
+
+def _normalize(text: str) -> str:
+    return "".join(character for character in text.lower() if character.isalnum())
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {_normalize(text)} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)} if padded.strip() else set()
@@ -25,25 +25,38 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import hashlib
+import os
 from datetime import datetime, date
-from re import search
-from functools import cached_property
-from urllib.parse import urlparse, urlunparse
-from urllib.request import Request, urlopen
+from functools import partial
+from http.client import HTTPException, HTTPMessage
+from socket import timeout as SocketTimeout
 from urllib.error import HTTPError
-from typing import List, Optional, Union
-from json import loads
-from subprocess import run
+from urllib.parse import urlsplit
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 from time import sleep
-from platform import system
 
-from bs4 import BeautifulSoup
-from requests.utils import requote_uri
+from .about import ABOUT_CACHE, About, Character, Hyperlink, _about_key, _about_url, get_about
+from .dates import _installed_date_index
+from .endpoints import BASE_URL, requote_uri
+from .events import _emit, _stage
+from .parsers import _strip_parser
+from .ratelimit import RateLimiter, get_rate_limiter
+from .record import RECORD_FIELDS, StripRecord, _iso_date
+from .transport import Response, Transport, _parse, get_transport
 
-from .endpoints import BASE_URL
+if TYPE_CHECKING:
+    from .httpcache import HTTPCache
+    from .negativecache import NegativeCache
+    from .transport import _BaseResponse, _BaseTransport
 
-RETRY_COUNT = 5
-BASE_DELAY = 0.5
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+MISSING_CODES = (404, 410)
+
+IMAGE_EXTENSIONS = {"image/png": "png", "image/jpeg": "jpg", "image/gif": "gif", "image/webp": "webp"}
+
+STRIP_FIELDS = ("title", "description", "share_image_url", "keywords", "author", "followers_count", "name", "header_feature_url", "image_url")
 
 
 class Comic:
@@ -58,12 +71,16 @@ class Comic:
 
     .. note::
 
-        Update the values of `RETRY_COUNT` and `BASE_DELAY` if you encounter issues with fetching comic data.
+        A page that is missing its image is fetched again with backoff, as allowed by the transport's rate limiter. Pass a transport with a :class:`RateLimiter` of your own if you encounter issues with fetching comic data.
 
     :param identifier: The comic's identifier.
     :type identifier: :class:`str`
     :param date: The comic's date.
     :type date: Optional[:class:`datetime` or :class:`date`]
+    :param transport: The transport used for every request made by the comic. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
+    :param fields: The fields from `STRIP_FIELDS` to extract from the comic's page. Defaults to all of them. The others are fetched and extracted together on first access. The image is only fetched again with backoff if ``"image_url"`` is requested.
+    :type fields: Optional[Iterable[:class:`str`]]
     :ivar url: The URL of the comic.
     :ivar title: The title of the comic.
     :ivar description: The description of the comic.
@@ -74,51 +91,56 @@ class Comic:
     :ivar name: The name of the comic.
     :ivar header_feature_url: The URL of the comic's header feature image.
     :ivar image_url: The URL of the comic's main image.
+    :ivar previous_date: The date of the previous strip, as linked from the comic's page.
+    :ivar next_date: The date of the next strip, as linked from the comic's page.
+    :ivar fetch_count: The number of times the comic's page was fetched from the network, while it was being built or refreshed.
     :ivar about: A list of hyperlinks and text describing the comic.
     :ivar about_feature_url: The URL of the comic's about feature image.
     :ivar about_author: A list of hyperlinks and text describing the comic's author.
     :ivar author_image_url: The URL of the comic author's image.
     :ivar social_urls: A list of hyperlinks to the comic's social media profiles.
     :ivar characters: A list of characters in the comic.
-    """
 
-    class Hyperlink:
-        """
-        A class that represents a hyperlink.
-
-        :param url: The URL of the hyperlink.
-        :type url: :class:`str`
-        :param text: The text of the hyperlink.
-        :type text: :class:`str`
-        """
-        def __init__(self, url: str, text: str) -> None:
-            self.url = url
-            self.text = text
-
-        def __str__(self) -> str:
-            return self.text
+    .. note::
 
-        def __repr__(self) -> str:
-            return f"Hyperlink(url={self.url}, text={self.text})"
+        The about page attributes are fetched on first access and shared between every instance with the same identifier. See :func:`get_about`.
 
-    class Character:
-        """
-        A class that represents a character in a comic.
-
-        :param name: The name of the character.
-        :type name: :class:`str`
-        :param image_url: The URL of the character's image.
-        :type image_url: :class:`str`
-        :param description: A description of the character.
-        :type description: :class:`str`
-        """
-        def __init__(self, name: str, image_url: str, description: str) -> None:
-            self.name = name
-            self.image_url = image_url
-            self.description = description
+    .. note::
 
-    def __init__(self, identifier: str, release_date: Optional[Union[datetime, date]] = None) -> None:
+        If the transport has a :class:`NegativeCache`, comics it knows not to exist raise a :class:`ValueError` without any request.
+    """
 
+    Hyperlink = Hyperlink
+    Character = Character
+
+    def __init__(
+        self,
+        identifier: str,
+        release_date: Optional[Union[datetime, date]] = None,
+        *,
+        transport: Optional[Transport] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> None:
+        self._prepare(identifier, release_date, transport)
+        self._build(frozenset(STRIP_FIELDS if fields is None else fields))
+
+    def _build(self, fields: FrozenSet[str]) -> None:
+        self._fields = fields
+        parser = _strip_parser(fields)
+
+        with _stage("comic", self.url):
+            self._apply(self._complete(self._fetch(parser).parsed))
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for missing attributes: the fields left out by `fields`.
+        if name not in STRIP_FIELDS or "_fields" not in self.__dict__:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        missing = frozenset(field for field in STRIP_FIELDS if field not in self.__dict__)
+        with _stage("comic", self.url):
+            self._apply(self._complete(self._fetch(_strip_parser(missing)).parsed))
+        return self.__dict__[name]
+
+    def _prepare(self, identifier: str, release_date: Optional[Union[datetime, date]], transport: Optional[Transport]) -> None:
         if release_date is not None and isinstance(release_date, datetime):
             release_date = release_date.date()
 
@@ -127,202 +149,331 @@ class Comic:
 
         self.identifier = identifier
         self.date = release_date
+        self._transport = transport
 
         if self.date is None:
             self.url = f"{BASE_URL}{self.identifier}"
         else:
             self.url = f"{BASE_URL}{self.identifier}/{self.date.strftime('%Y/%m/%d')}"
 
-        try:
-            page = Request(self.url)
-            with urlopen(page) as result:
-                soup = BeautifulSoup(result.read(), "html.parser")
-        except HTTPError as e:
-            raise ValueError(f"Comic with identifier '{identifier}' and date '{self.date}' does not exist.") from e
-        except Exception as e:
-            raise ValueError("An error occurred while fetching the comic.") from e
-
-        tag = soup.find("meta", {"property": "og:title"})
-        self.title = tag.attrs["content"] if tag else None
-
-        tag = soup.find("meta", {"property": "og:description"})
-        self.description = tag.attrs["content"] if tag else None
-
-        tag = soup.find("meta", {"property": "og:image"})
-        self.share_image_url = tag.attrs["content"] if tag else None
+        self.fetch_count = 0
+        self.previous_date = None
+        self.next_date = None
+        self._validators = None
 
-        tag = soup.find("meta", {"name": "keywords"})
-        self.keywords = tag.attrs["content"].split(", ") if tag else None
-
-        tag = soup.find("span", {"class": "Typography_typography__C_Hp6 Typography_typography_body2___WsK9"}).text.split(" | ")
-        self.author = tag[0][3:] if tag else None
-        self.followers_count = tag[1].split(" ")[0] if tag else None
-
-        tag = soup.find("h1", {"class": "Typography_typography__C_Hp6 Typography_typography_d2__3FxkY"})
-        self.name = tag.text if tag else None
-
-        tag = soup.find("div", {"class": "HeaderFeature_headerFeature__backgroundImage__ipPVn"})
-        style = tag.attrs["style"] if tag else None
-        if style:
-            match = search(r'url\("([^"]+)"\)', style)
-            self.header_feature_url = urlunparse(urlparse(match.group(1))._replace(query="")) if match else None
-
-        for _ in range(RETRY_COUNT):
+    @classmethod
+    def from_record(cls, record: StripRecord, *, transport: Optional[Transport] = None) -> Comic:
+        """
+        Builds a comic from a :class:`StripRecord`, without any request.
 
+        :param record: The record.
+        :type record: :class:`StripRecord`
+        :param transport: The transport used for later requests made by the comic. Defaults to the shared transport.
+        :type transport: Optional[:class:`Transport`]
+        """
+        comic = cls.__new__(cls)
+        comic._prepare(record.identifier, record.date, transport)
+        fields = {name: getattr(record, name) for name in RECORD_FIELDS}
+        fields["keywords"] = list(record.keywords) if record.keywords is not None else None
+        comic._apply(fields)
+        return comic
+
+    def to_record(self) -> StripRecord:
+        """
+        Returns the comic's metadata as a :class:`StripRecord`.
+        """
+        return StripRecord(self.identifier, self.date, **{name: getattr(self, name) for name in RECORD_FIELDS})
+
+    def _limiter(self) -> RateLimiter:
+        return (self._transport or get_transport()).limiter or get_rate_limiter()
+
+    @classmethod
+    def _unparsed(cls, identifier: str, release_date: Optional[date], transport: Optional[Transport]) -> Tuple[Comic, Response]:
+        # Fetches the page without parsing it, for callers that parse it elsewhere and pass the fields to _finish.
+        comic = cls.__new__(cls)
+        comic._prepare(identifier, release_date, transport)
+        comic._fields = frozenset(STRIP_FIELDS)
+        return comic, comic._fetch(None)
+
+    def _finish(self, fields: Dict[str, Any]) -> Comic:
+        self._apply(self._complete(fields))
+        return self
+
+    def _fetch(self, parser: Optional[Callable[[bytes], Any]], *, refresh: bool = False, headers: Optional[Mapping[str, str]] = None) -> Response:
+        transport = self._transport or get_transport()
+        self._check_missing(transport.negative_cache)
+        try:
+            response = transport.get(self.url, headers=headers, parser=parser, refresh=refresh)
+        except Exception as e:
+            self._record_missing(transport.negative_cache, e)
+            raise self._fetch_error(e) from e
+        return self._fetched(response)
+
+    def _fetched(self, response: Response) -> Response:
+        if not response.from_cache and not response.coalesced:
+            self.fetch_count += 1
+        if response.status == 200:
+            self._validators = _validators(response.headers)
+        return response
+
+    def _complete(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        for delay in self._retry_delays(lambda: "image_url" in fields and fields["image_url"] is None):
+            sleep(delay)
             try:
-                page = Request(self.url)
-                with urlopen(page) as result:
-                    soup = BeautifulSoup(result.read(), "html.parser")
-            except HTTPError:
-                pass
-
-            tag = soup.find("div", {"id": "S:4"})
-            if tag:
-                subtag = tag.find("script", {"type": "application/ld+json"})
-                if subtag:
-                    self.image_url = loads(subtag.text)["contentUrl"]
-                    break
-
-            sleep(BASE_DELAY)
+                fields = {**fields, "image_url": self._fetch(_strip_parser(frozenset(("image_url",))), refresh=True).parsed["image_url"]}
+            except ValueError:
+                continue
+        return fields
+
+    def _retry_delays(self, missing: Callable[[], bool]) -> Iterator[float]:
+        # Yields the delays before fetching the page again, for as long as it has no image and the limiter allows.
+        limiter = self._limiter()
+        attempt = 0
+        while missing():
+            delay = limiter.retry_delay(attempt)
+            if delay is None:
+                return
+            _emit("sleep", duration=delay, url=self.url, reason="retry")
+            yield delay
+            attempt += 1
+
+    def _check_missing(self, negative_cache: Optional[NegativeCache]) -> None:
+        if negative_cache is None:
+            return
+        if negative_cache.contains(self.identifier, self.date):
+            _emit("cache_hit", url=self.url, cache="negative")
+            error = HTTPError(self.url, 404, "Not Found", HTTPMessage(), None)
+            raise self._fetch_error(error) from error
+        _emit("cache_miss", url=self.url, cache="negative")
+
+    def _record_missing(self, negative_cache: Optional[NegativeCache], error: Exception) -> None:
+        if negative_cache is not None and isinstance(error, HTTPError) and error.code in MISSING_CODES:
+            negative_cache.add(self.identifier, self.date)
+
+    def _fetch_error(self, error: Exception) -> ValueError:
+        if isinstance(error, HTTPError):
+            return ValueError(f"Comic with identifier '{self.identifier}' and date '{self.date}' does not exist.")
+        return ValueError("An error occurred while fetching the comic.")
+
+    def _apply(self, fields: Dict[str, Any]) -> None:
+        for name in STRIP_FIELDS:
+            if name in fields:
+                setattr(self, name, fields[name])
+
+        self.previous_date = _iso_date(fields.get("previous_date"))
+        self.next_date = _iso_date(fields.get("next_date"))
+        index = _installed_date_index()
+        if index is not None and self.date is not None:
+            index.record(self.identifier, self.date, self.previous_date, self.next_date)
 
     def __eq__(self, __o: Comic) -> bool:
         if not isinstance(__o, Comic):
             return False
         return self.url == __o.url
 
-    @cached_property
+    @property
     def about(self) -> List[Union[Hyperlink, str]]:
-        page = Request(requote_uri(f"{BASE_URL}{self.identifier}/about"))
-        with urlopen(page) as result:
-            soup = BeautifulSoup(result.read(), "html.parser")
-
-        tags = soup.find("div", {"class": "AboutFeature_aboutFeature__details__ru_As"}).find("div", {"class": "RichTextParser_richTextParser__joxf7"}).find_all("p")
-        subtags = []
-        for tag in tags:
-            subtags.extend(list(tag.descendants))
-
-        text = []
-        index = 0
-        while index < len(subtags):
-            if subtags[index].name == "a":
-                text.append(self.Hyperlink(subtags[index].attrs["href"], subtags[index].text))
-                index += 2
-            else:
-                text.append(subtags[index].text)
-                index += 1
-        return text
-
-    @cached_property
-    def about_feature_url(self) -> str:
-        page = Request(requote_uri(f"{BASE_URL}{self.identifier}/about"))
-        with urlopen(page) as result:
-            soup = BeautifulSoup(result.read(), "html.parser")
-
-        tag = soup.find("div", {"class": "AboutFeature_aboutFeature__imageContainer__nE23W"}).find("img")
-        urls = tag.attrs["srcset"].split(", ") if tag else []
-
-        banner_url = urls[0].split(" ")[0] if urls else None
-        if banner_url:
-            return urlunparse(urlparse(banner_url)._replace(query=""))
-        return None
+        return list(self._about().about)
 
-    @cached_property
+    @property
+    def about_feature_url(self) -> Optional[str]:
+        return self._about().about_feature_url
+
+    @property
     def about_author(self) -> List[Union[Hyperlink, str]]:
-        page = Request(requote_uri(f"{BASE_URL}{self.identifier}/about"))
-        with urlopen(page) as result:
-            soup = BeautifulSoup(result.read(), "html.parser")
-
-        tags = soup.find("div", {"class": "AboutCreator_aboutCreator__details__6YZp3"}).find("div", {"class": "RichTextParser_richTextParser__joxf7"}).find_all("p")
-        subtags = []
-        for tag in tags:
-            subtags.extend(list(tag.descendants))
-
-        text = []
-        index = 0
-        while index < len(subtags):
-            if subtags[index].name == "a":
-                text.append(self.Hyperlink(subtags[index].attrs["href"], subtags[index].text))
-                index += 2
-            else:
-                text.append(subtags[index].text)
-                index += 1
-        return text
-
-    @cached_property
-    def author_image_url(self) -> str:
-        page = Request(requote_uri(f"{BASE_URL}{self.identifier}/about"))
-        with urlopen(page) as result:
-            soup = BeautifulSoup(result.read(), "html.parser")
-
-        tag = soup.find("div", {"class": "AboutCreator_aboutCreator__tcSD7"}).find("img")
-        urls = tag.attrs["srcset"].split(", ") if tag else []
-
-        image_url = urls[0].split(" ")[0] if urls else None
-        if image_url:
-            return urlunparse(urlparse(image_url)._replace(query=""))
-        return None
+        return list(self._about().about_author)
 
-    @cached_property
-    def social_urls(self) -> List[Hyperlink]:
-        page = Request(requote_uri(f"{BASE_URL}{self.identifier}/about"))
-        with urlopen(page) as result:
-            soup = BeautifulSoup(result.read(), "html.parser")
+    @property
+    def author_image_url(self) -> Optional[str]:
+        return self._about().author_image_url
 
-        tags = soup.find_all("a", {"class": "SocialLinks_socialLinks__link__84fhl"})
-        return [tag.attrs["href"] for tag in tags]
+    @property
+    def social_urls(self) -> List[str]:
+        return list(self._about().social_urls)
 
-    @cached_property
+    @property
     def characters(self) -> List[Character]:
-        page = Request(requote_uri(f"{BASE_URL}{self.identifier}/about"))
-        with urlopen(page) as result:
-            soup = BeautifulSoup(result.read(), "html.parser")
-
-        tags = soup.find_all("div", {"class": "AboutCharacter_aboutCharacter__cAOuK"})
-        characters = []
-        for tag in tags:
-            name = tag.find("h3").text if tag.find("h3") else None
-            image_tag = tag.find("img")
-            image_url = image_tag.attrs["srcset"].split(", ")[0].split(" ")[0] if image_tag else None
-            description = tag.find("p").text if tag.find("p") else None
-
-            if name and image_url and description:
-                characters.append(self.Character(name, urlunparse(urlparse(image_url)._replace(query="")), description))
-        return characters
-
-    def download(self, *, filename: Optional[str] = None, path: Optional[str] = None) -> str:
+        return list(self._about().characters)
+
+    def _about(self) -> About:
+        return get_about(self.identifier, transport=self._transport)
+
+    def download(
+        self,
+        *,
+        filename: Optional[str] = None,
+        path: Optional[str] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        resume: bool = True,
+        overwrite: bool = False
+    ) -> str:
         """
         Downloads the comic image and returns the file path.
 
-        :param filename: Optional filename for the downloaded image.
+        The image is streamed into a temporary file next to the target, which is renamed into place once it is complete, so an interrupted download never leaves a truncated image behind. It is resumed by the next call if the server supports range requests and the image has not changed since. The image's ETag or Last-Modified validator is kept next to it in a ``.validator`` file, and the next download to the same target is conditional on it, so the image is only transferred again if it changed.
+
+        :param filename: Optional filename for the downloaded image. A name without an extension gets the one matching the image's content type. Defaults to the comic's identifier.
         :type filename: Optional[str]
         :param path: Optional path where the image will be saved.
         :type path: Optional[str]
+        :param chunk_size: The number of bytes read from the connection and written at a time.
+        :type chunk_size: int
+        :param resume: Whether to resume an interrupted download.
+        :type resume: bool
+        :param overwrite: Whether to download the image even if the target already exists and has not changed.
+        :type overwrite: bool
         """
+        if filename is not None and "." in filename and not _has_image_extension(filename):
+            raise ValueError("Filename must end with .png, .jpg, .jpeg, .gif or .webp, or have no extension")
+
+        with _stage("download", self.image_url):
+            return self._download(path or ".", filename or self.identifier, chunk_size, resume, overwrite)
+
+    def _download(self, directory: str, name: str, chunk_size: int, resume: bool, overwrite: bool) -> str:
+        # A name without an image extension gets the one matching the image's content type.
         if not self.image_url:
             raise ValueError("Comic does not have an image URL.")
 
-        if filename is None:
-            filename = f"{self.identifier}.png"
+        url = requote_uri(self.image_url)
+        transport = self._transport or get_transport()
+        base_path = os.path.join(directory, name)
+        part_path = f"{base_path}.part"
+        if not resume:
+            _discard(part_path)
+        existing = _existing_image(base_path)
+        condition = None if overwrite or existing is None else _read_validator(existing)
+
+        headers = _retrying(self._limiter(), url, partial(_fetch_image, transport, url, part_path, chunk_size, condition))
+        if headers is None:
+            return existing
+
+        full_path = base_path if _has_image_extension(name) else f"{base_path}.{_image_extension(headers, url)}"
+        # The image is replaced before its validator, so that a stale validator can only cause a new transfer.
+        os.replace(part_path, full_path)
+        if os.path.isfile(f"{part_path}.validator"):
+            os.replace(f"{part_path}.validator", f"{full_path}.validator")
+        else:
+            _write_validator(full_path, None)
+        return full_path
 
-        if path is None:
-            path = "."
+    def download_to(self, file: BinaryIO, *, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> int:
+        """
+        Streams the comic image into a writable binary file object, such as an open file or an :class:`io.BytesIO`, and returns the number of bytes written.
 
-        if filename.split(".")[-1] not in ["png", "jpg", "jpeg"]:
-            raise ValueError("Filename must end with .png, .jpg, or .jpeg")
+        :param file: The file object to write the image to.
+        :type file: BinaryIO
+        :param chunk_size: The number of bytes read from the connection and written at a time.
+        :type chunk_size: int
+        """
+        if not self.image_url:
+            raise ValueError("Comic does not have an image URL.")
 
-        full_path = f"{path}/{filename}"
-        req = Request(requote_uri(self.image_url))
+        transport = self._transport or get_transport()
+        with _stage("download", self.image_url):
+            return self._write_image(transport, requote_uri(self.image_url), file, chunk_size)
 
-        with urlopen(req) as response, open(full_path, "wb") as out_file:
-            out_file.write(response.read())
+    def iter_image(self, *, chunk_size: int = DOWNLOAD_CHUNK_SIZE, max_size: Optional[int] = None, checksum: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Streams the comic image from the connection as an iterator of chunks, without writing it anywhere.
 
-        return full_path
+        .. code-block:: python3
+
+            for chunk in comic.iter_image(max_size=10 * 1024 * 1024, checksum="sha256:9f86d0..."):
+                upload.write(chunk)
+
+        The last chunk is only yielded once the image is known to be complete and to match `checksum`. Otherwise a :class:`ValueError` is raised in its place, so the data received so far should be discarded.
+
+        :param chunk_size: The number of bytes read from the connection at a time.
+        :type chunk_size: int
+        :param max_size: The maximum size of the image, in bytes. A larger image raises a :class:`ValueError`, before any of it is read if the server announces its size.
+        :type max_size: Optional[int]
+        :param checksum: The expected digest of the image, as ``"<algorithm>:<hex digest>"`` with any algorithm of :mod:`hashlib`, checked as the image streams.
+        :type checksum: Optional[str]
+        """
+        if not self.image_url:
+            raise ValueError("Comic does not have an image URL.")
+
+        return self._image_chunks(chunk_size, max_size, checksum)
 
-    def refresh(self) -> None:
+    def _image_chunks(self, chunk_size: int, max_size: Optional[int], checksum: Optional[str]) -> Iterator[bytes]:
+        transport = self._transport or get_transport()
+        algorithm, expected = _checksum(checksum)
+        return _image_chunks(transport, requote_uri(self.image_url), chunk_size, max_size, algorithm=algorithm, expected=expected)
+
+    def read_image(self, *, chunk_size: int = DOWNLOAD_CHUNK_SIZE, max_size: Optional[int] = None, checksum: Optional[str] = None) -> memoryview:
         """
-        Refreshes the comic data by re-fetching it from the website. It can be useful if a particular attribute is not set or if you want to update the comic's data without creating a new instance.
+        Reads the comic image into memory and returns it as a read-only buffer, without touching the disk. Call :func:`bytes` on it for a copy.
+
+        A failed transfer is started again with backoff, as allowed by the transport's rate limiter.
+
+        :param chunk_size: The number of bytes read from the connection at a time.
+        :type chunk_size: int
+        :param max_size: The maximum size of the image, in bytes. A larger image raises a :class:`ValueError`.
+        :type max_size: Optional[int]
+        :param checksum: The expected digest of the image, as ``"<algorithm>:<hex digest>"``. An image that does not match raises a :class:`ValueError`.
+        :type checksum: Optional[str]
         """
-        self.__init__(self.identifier, self.date)
+        if not self.image_url:
+            raise ValueError("Comic does not have an image URL.")
+
+        _checksum(checksum)
+        with _stage("download", self.image_url):
+            return _retrying(self._limiter(), self.image_url, partial(self._read_image, chunk_size, max_size, checksum))
+
+    def _read_image(self, chunk_size: int, max_size: Optional[int], checksum: Optional[str]) -> memoryview:
+        buffer = bytearray()
+        for chunk in self._image_chunks(chunk_size, max_size, checksum):
+            buffer += chunk
+        return memoryview(buffer).toreadonly()
+
+    @staticmethod
+    def _write_image(transport: Transport, url: str, file: BinaryIO, chunk_size: int) -> int:
+        written = 0
+        with transport.open(url, headers={"Accept-Encoding": "identity"}) as response:
+            for chunk in response.iter_content(chunk_size):
+                file.write(chunk)
+                written += len(chunk)
+        return written
+
+    def refresh(self, *, about: bool = False) -> List[str]:
+        """
+        Refreshes the comic data from the website, and returns the names of the fields that changed, from `STRIP_FIELDS`, ``"previous_date"`` and ``"next_date"``.
+
+        The request is conditional on the page having changed since it was last fetched, so an unchanged page costs a single empty response and is not parsed again. Only the fields already extracted are compared and updated. The others are still extracted on first access.
+
+        :param about: Whether to also drop the comic's about page from `ABOUT_CACHE` and from the transport's cache, so that the about attributes are fetched again on next access.
+        :type about: :class:`bool`
+        """
+        transport = self._transport or get_transport()
+        if about:
+            self._forget_about(transport)
+
+        with _stage("comic", self.url):
+            response = self._fetch(None, refresh=True, headers=self._validators)
+            if self._unchanged(response, transport.cache):
+                return []
+
+            names = [name for name in STRIP_FIELDS if name in self.__dict__]
+            fields = self._complete(_parse(transport.cache, self.url, response, _strip_parser(frozenset(names))))
+            return self._update(names, fields)
+
+    def _forget_about(self, transport: _BaseTransport) -> None:
+        ABOUT_CACHE.pop(_about_key(self.identifier, transport))
+        if transport.cache is not None:
+            transport.cache.discard(_about_url(self.identifier))
+
+    def _unchanged(self, response: _BaseResponse, cache: Optional[HTTPCache]) -> bool:
+        if response.status != 304:
+            return False
+        if cache is not None:
+            cache.revalidated(self.url)
+        return True
+
+    def _update(self, names: List[str], fields: Dict[str, Any]) -> List[str]:
+        # Applies refreshed fields and returns the names of those that changed.
+        previous = {name: getattr(self, name) for name in (*names, "previous_date", "next_date")}
+        self._apply(fields)
+        return [name for name, value in previous.items() if getattr(self, name) != value]
 
     def show(self, *, filename: Optional[str] = None, path: Optional[str] = None) -> None:
         """
@@ -333,4 +484,150 @@ class Comic:
         :param path: Optional path where the image will be saved.
         :type path: Optional[str]
         """
-        run(['open' if system() == 'Darwin' else 'xdg-open' if system() == 'Linux' else 'start', self.download(filename=filename, path=path)], shell=True, check=False)
+        _open_image(self.download(filename=filename, path=path))
+
+
+def _open_image(path: str) -> None:
+    from platform import system # pylint: disable=import-outside-toplevel
+    from subprocess import run # pylint: disable=import-outside-toplevel
+
+    run(['open' if system() == 'Darwin' else 'xdg-open' if system() == 'Linux' else 'start', path], shell=True, check=False)
+
+def _has_image_extension(name: str) -> bool:
+    return name.split(".")[-1] in ("jpeg", *IMAGE_EXTENSIONS.values())
+
+def _existing_image(base_path: str) -> Optional[str]:
+    if _has_image_extension(base_path):
+        return base_path if os.path.isfile(base_path) else None
+    for extension in (*IMAGE_EXTENSIONS.values(), "jpeg"):
+        if os.path.isfile(f"{base_path}.{extension}"):
+            return f"{base_path}.{extension}"
+    return None
+
+def _fetch_image(transport: Transport, url: str, part_path: str, chunk_size: int, condition: Optional[str]) -> Optional[Mapping[str, str]]:
+    # Returns the response headers once the image is in `part_path`, or None if it has not changed since `condition`.
+    headers = {"Accept-Encoding": "identity"}
+    if condition:
+        headers["If-None-Match" if condition.startswith(('"', "W/")) else "If-Modified-Since"] = condition
+    validator = _read_validator(part_path)
+    offset = os.path.getsize(part_path) if validator and os.path.isfile(part_path) else 0
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+
+    try:
+        with transport.open(url, headers=headers) as response:
+            if response.status == 304:
+                return None
+            appending = offset and response.status == 206
+            _write_validator(part_path, response.headers.get("ETag") or response.headers.get("Last-Modified"))
+            with open(part_path, "ab" if appending else "wb") as part_file:
+                for chunk in response.iter_content(chunk_size):
+                    part_file.write(chunk)
+            size = _content_length(response.headers)
+    except HTTPError as e:
+        if e.code != 416 or not offset:
+            raise
+        _discard(part_path)
+        return _fetch_image(transport, url, part_path, chunk_size, condition)
+
+    if size is not None and os.path.getsize(part_path) != size + (offset if appending else 0):
+        raise ValueError("The downloaded image is incomplete.")
+    return response.headers
+
+def _read_validator(path: str) -> Optional[str]:
+    try:
+        with open(f"{path}.validator", encoding="utf-8") as validator_file:
+            return validator_file.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+def _write_validator(path: str, validator: Optional[str]) -> None:
+    if validator:
+        with open(f"{path}.validator", "w", encoding="utf-8") as validator_file:
+            validator_file.write(validator)
+    elif os.path.isfile(f"{path}.validator"):
+        os.remove(f"{path}.validator")
+
+def _discard(part_path: str) -> None:
+    for stale_path in (part_path, f"{part_path}.validator"):
+        if os.path.isfile(stale_path):
+            os.remove(stale_path)
+
+def _retrying(limiter: RateLimiter, url: str, attempt: Callable[[], Any]) -> Any:
+    # Starts a failed transfer again with backoff, as allowed by the limiter.
+    attempts = 0
+    while True:
+        try:
+            return attempt()
+        except (HTTPException, ConnectionError, SocketTimeout):
+            delay = limiter.retry_delay(attempts)
+            if delay is None:
+                raise
+            _emit("sleep", duration=delay, url=url, reason="retry")
+            sleep(delay)
+            attempts += 1
+
+def _image_extension(headers: Mapping[str, str], url: str) -> str:
+    content_type = (headers.get("Content-Type") or "").split(";")[0].strip().lower()
+    if content_type in IMAGE_EXTENSIONS:
+        return IMAGE_EXTENSIONS[content_type]
+    extension = os.path.splitext(urlsplit(url).path)[1][1:].lower()
+    if extension in ("jpeg", *IMAGE_EXTENSIONS.values()):
+        return extension
+    return "png"
+
+def _image_chunks(transport: Transport, url: str, chunk_size: int, max_size: Optional[int], *, algorithm: Optional[str] = None, expected: Optional[str] = None) -> Iterator[bytes]: # pylint: disable=too-many-arguments
+    digest = hashlib.new(algorithm) if algorithm is not None else None
+    with transport.open(url, headers={"Accept-Encoding": "identity"}) as response:
+        size = _content_length(response.headers)
+        if max_size is not None and size is not None and size > max_size:
+            raise ValueError(f"The image is larger than {max_size} bytes.")
+
+        received = 0
+        pending = None
+        for chunk in response.iter_content(chunk_size):
+            received += len(chunk)
+            if max_size is not None and received > max_size:
+                raise ValueError(f"The image is larger than {max_size} bytes.")
+            if digest is not None:
+                digest.update(chunk)
+            if pending is not None:
+                yield pending
+            pending = chunk
+
+    if size is not None and received != size:
+        raise ValueError("The downloaded image is incomplete.")
+    if digest is not None and digest.hexdigest() != expected:
+        raise ValueError("The image does not match its checksum.")
+    if pending is not None:
+        yield pending
+
+def _checksum(checksum: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    if checksum is None:
+        return None, None
+    algorithm, separator, expected = checksum.partition(":")
+    if not separator or not expected:
+        raise ValueError("Checksum must be given as '<algorithm>:<hex digest>'.")
+    algorithm = algorithm.strip().lower()
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"Unsupported checksum algorithm '{algorithm}'.")
+    return algorithm, expected.strip().lower()
+
+def _validators(headers: Mapping[str, str]) -> Dict[str, str]:
+    validators = {}
+    if headers.get("ETag"):
+        validators["If-None-Match"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = headers["Last-Modified"]
+    return validators
+
+def _content_length(headers: Mapping[str, str]) -> Optional[int]:
+    try:
+        return int(headers["Content-Length"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def _is_missing(error: Exception) -> bool:
+    cause = error.__cause__
+    return isinstance(error, ValueError) and isinstance(cause, HTTPError) and cause.code in MISSING_CODES
@@ -0,0 +1,176 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+import json
+import os
+from bisect import bisect_left
+from datetime import date
+from threading import Lock
+from typing import Dict, List, Optional
+
+from .cache import _Shared
+
+
+class DateIndex:
+
+    """
+    A class that remembers the publication dates of comics, so that dates without a strip are not requested.
+
+    Every strip page links to the previous and next strips. :func:`stream_comics` records those links in its index as it goes, and uses them to go from one strip straight to the next. The links are kept in memory, and also in a JSON file if a path is given, so that later runs know the dates ahead of time.
+
+    :param path: The JSON file the index is loaded from and saved to, or None to keep it in memory only.
+    :type path: Optional[:class:`str`]
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self._links: Dict[str, Dict[str, str]] = {}
+        self._lock = Lock()
+        self._dirty = False
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as index_file:
+                self._links = json.load(index_file)
+
+    def record(self, identifier: str, day: date, previous_date: Optional[date] = None, next_date: Optional[date] = None) -> None:
+        """
+        Records that a strip was published on `day`, along with the strips linked from its page.
+
+        :param identifier: The comic identifier.
+        :type identifier: :class:`str`
+        :param day: The date of the strip.
+        :type day: :class:`date`
+        :param previous_date: The date of the previous strip, if any.
+        :type previous_date: Optional[:class:`date`]
+        :param next_date: The date of the next strip, if any.
+        :type next_date: Optional[:class:`date`]
+        """
+        with self._lock:
+            links = self._links.setdefault(identifier, {})
+            for start, end in ((previous_date, day), (day, next_date)):
+                if start is not None and end is not None and start < end and links.get(start.isoformat()) != end.isoformat():
+                    links[start.isoformat()] = end.isoformat()
+                    self._dirty = True
+
+    def next_date(self, identifier: str, day: date) -> Optional[date]:
+        """
+        Returns the date of the strip published after the one on `day`, or None if it is not known.
+
+        :param identifier: The comic identifier.
+        :type identifier: :class:`str`
+        :param day: The date of a strip.
+        :type day: :class:`date`
+        """
+        with self._lock:
+            following = self._links.get(identifier, {}).get(day.isoformat())
+        return date.fromisoformat(following) if following else None
+
+    def first_date(self, identifier: str, start: date) -> Optional[date]:
+        """
+        Returns the first date on or after `start` with a strip, or None unless the index knows that no strip was published between the two.
+
+        :param identifier: The comic identifier.
+        :type identifier: :class:`str`
+        :param start: The earliest date wanted.
+        :type start: :class:`date`
+        """
+        key = start.isoformat()
+        with self._lock:
+            links = self._links.get(identifier, {})
+            if key in links:
+                return start
+            days = sorted(links)
+            position = bisect_left(days, key)
+            following = links[days[position - 1]] if position else None
+        return date.fromisoformat(following) if following and following >= key else None
+
+    def dates(self, identifier: str) -> List[date]:
+        """
+        Returns the known publication dates of a comic, in order.
+
+        :param identifier: The comic identifier.
+        :type identifier: :class:`str`
+        """
+        with self._lock:
+            links = self._links.get(identifier, {})
+            days = set(links) | set(links.values())
+        return [date.fromisoformat(day) for day in sorted(days)]
+
+    def save(self) -> None:
+        """
+        Writes the index to its file, if it has one and it has changed. The file is replaced atomically.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            temporary_path = f"{self.path}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as index_file:
+                json.dump(self._links, index_file, sort_keys=True)
+            os.replace(temporary_path, self.path)
+            self._dirty = False
+
+    def clear(self, identifier: Optional[str] = None) -> None:
+        """
+        Forgets the dates of a comic, or of every comic if no identifier is given.
+
+        :param identifier: The comic identifier.
+        :type identifier: Optional[:class:`str`]
+        """
+        with self._lock:
+            if identifier is None:
+                self._links.clear()
+            else:
+                self._links.pop(identifier, None)
+            self._dirty = True
+
+
+_shared = _Shared(DateIndex)
+_installed = _Shared(lambda: None)
+
+
+def get_date_index() -> DateIndex:
+    """
+    Returns the date index installed with :func:`set_date_index`, or else an in-memory one created on first use.
+    """
+    return _installed.get() or _shared.get()
+
+def set_date_index(index: Optional[DateIndex]) -> None:
+    """
+    Replaces the date index shared by the library. Passing None restores an in-memory index on next use.
+
+    Each :class:`Comic` built for a date, in a stream or not, also records its links in an index set this way, and streams use it by default. Without one, every stream records into an index of its own, so that a long-running process does not grow an index no one reads.
+
+    :param index: The new shared index.
+    :type index: Optional[:class:`DateIndex`]
+    """
+    _installed.set(index)
+    _shared.set(index)
+
+def _installed_date_index() -> Optional[DateIndex]:
+    return _installed.get()
@@ -22,5 +22,31 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from string import ascii_letters, digits
+from urllib.parse import quote
+
 
 BASE_URL = "https://gocomics.com/"
+
+UNRESERVED_CHARACTERS = frozenset(ascii_letters + digits + "-._~")
+
+
+def requote_uri(uri: str) -> str:
+    """
+    Quotes the characters of a URI that are not allowed in a URL, so that it is quoted fully and consistently. Reserved characters and valid percent-escapes are kept, and escapes of unreserved characters are decoded. This matches ``requests.utils.requote_uri``.
+
+    :param uri: The URI.
+    :type uri: :class:`str`
+    """
+    parts = uri.split("%")
+    for index in range(1, len(parts)):
+        escape = parts[index][:2]
+        if len(escape) == 2 and escape.isalnum():
+            try:
+                character = chr(int(escape, 16))
+            except ValueError:
+                return quote(uri, safe="!#$&'()*+,/:;=?@[]~")
+            parts[index] = character + parts[index][2:] if character in UNRESERVED_CHARACTERS else f"%{parts[index]}"
+        else:
+            parts[index] = f"%{parts[index]}"
+    return quote("".join(parts), safe="!#$%&'()*+,/:;=?@[]~")
@@ -0,0 +1,358 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter, time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+__all__ = ("EVENT_NAMES", "DEFAULT_BUCKETS", "Event", "Histogram", "MetricsCollector", "add_observer", "remove_observer", "observe")
+
+EVENT_NAMES = ("request", "retry", "sleep", "cache_hit", "cache_miss", "parse", "stage")
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Event:
+
+    """
+    A class that represents something the library did, passed to every observer.
+
+    - ``"request"``: an HTTP request, emitted once its body has been read or it failed. `duration` runs from sending the request to the end of the body, `size` counts the bytes received, and `detail` holds the ``method``, the ``first_byte`` time in seconds and, if it failed, the ``error``.
+    - ``"retry"``: a failed request about to be retried. `duration` is the backoff, and `detail` holds the ``attempt`` and the ``error``.
+    - ``"sleep"``: a pause, with its `duration` and the ``reason`` in `detail`: ``"rate_limit"`` or ``"retry"``.
+    - ``"cache_hit"`` and ``"cache_miss"``: a cache lookup, with the ``cache`` in `detail`: ``"http"``, ``"parsed"``, ``"negative"``, ``"about"`` or ``"inflight"`` (a call sharing a concurrent request for the same URL, hits only).
+    - ``"parse"``: a page parsed, with its `duration`, the `size` of the page and the ``parser`` in `detail`.
+    - ``"stage"``: a public call completed, with its `duration`. Its name is the `stage`, which also tags every event emitted during the call: ``"comic"``, ``"about"``, ``"download"``, ``"search"``, ``"search_political"`` or ``"popular"``.
+
+    :ivar name: The kind of event, one of :data:`EVENT_NAMES`.
+    :ivar stage: The public call the event was emitted in, if any.
+    :ivar duration: The time the event took, in seconds, if it is timed.
+    :ivar size: The number of bytes involved, if any.
+    :ivar url: The URL involved, if any.
+    :ivar status: The HTTP status code, if any.
+    :ivar detail: Other details, depending on the kind of event.
+    :ivar timestamp: The time the event was emitted, in seconds since the epoch.
+    """
+
+    __slots__ = ("name", "stage", "duration", "size", "url", "status", "detail", "timestamp")
+
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        *,
+        stage: Optional[str] = None,
+        duration: Optional[float] = None,
+        size: Optional[int] = None,
+        url: Optional[str] = None,
+        status: Optional[int] = None,
+        detail: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.name = name
+        self.stage = stage
+        self.duration = duration
+        self.size = size
+        self.url = url
+        self.status = status
+        self.detail = detail or {}
+        self.timestamp = time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the event as a JSON-serializable dictionary.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"Event(name={self.name!r}, stage={self.stage!r}, duration={self.duration!r}, size={self.size!r}, url={self.url!r}, status={self.status!r})"
+
+
+class Histogram:
+
+    """
+    A class that counts values in fixed buckets, and keeps their count, sum, minimum and maximum.
+
+    :param buckets: The upper bounds of the buckets, in increasing order. Larger values fall in an overflow bucket.
+    :type buckets: Sequence[:class:`float`]
+
+    :ivar count: The number of values observed.
+    :ivar total: The sum of the values observed.
+    :ivar minimum: The smallest value observed, if any.
+    :ivar maximum: The largest value observed, if any.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        """
+        Adds a value.
+
+        :param value: The value to add.
+        :type value: :class:`float`
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """
+        The mean of the values observed, if any.
+        """
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Returns an estimate of the `q` quantile: the upper bound of the bucket holding it, capped by the largest value observed.
+
+        :param q: The quantile, between 0 and 1.
+        :type q: :class:`float`
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the histogram as a JSON-serializable dictionary, with its median and 95th and 99th percentiles.
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([*map(str, self.buckets), "+Inf"], self.counts))
+        }
+
+
+class MetricsCollector:
+
+    """
+    An observer that aggregates events in memory: how many there were, how many bytes they involved, and a :class:`Histogram` of their durations.
+
+    Metrics are kept per event name, stage and, for cache events, cache. Queries add up every metric matching the labels given.
+
+    .. code-block:: python3
+
+        with gocomics.observe(gocomics.MetricsCollector()) as metrics:
+            gocomics.Comic("garfield")
+        print(metrics.count("request", stage="comic"), metrics.histogram("request").mean)
+
+    :param buckets: The upper bounds, in seconds, of the histogram buckets.
+    :type buckets: Sequence[:class:`float`]
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._counts: Counter = Counter()
+        self._sizes: Counter = Counter()
+        self._histograms: Dict[Tuple[str, Optional[str], Optional[str]], Histogram] = {}
+        self._lock = Lock()
+
+    def __call__(self, event: Event) -> None:
+        key = (event.name, event.stage, event.detail.get("cache"))
+        with self._lock:
+            self._counts[key] += 1
+            if event.size:
+                self._sizes[key] += event.size
+            if event.duration is not None:
+                if key not in self._histograms:
+                    self._histograms[key] = Histogram(self.buckets)
+                self._histograms[key].observe(event.duration)
+
+    def count(self, name: str, *, stage: Optional[str] = None, cache: Optional[str] = None) -> int:
+        """
+        Returns the number of events with the given name and labels.
+
+        :param name: The event name.
+        :type name: :class:`str`
+        :param stage: Only count events emitted in this stage.
+        :type stage: Optional[:class:`str`]
+        :param cache: Only count cache events of this cache.
+        :type cache: Optional[:class:`str`]
+        """
+        with self._lock:
+            return sum(count for key, count in self._counts.items() if _matches(key, name, stage, cache))
+
+    def size(self, name: str, *, stage: Optional[str] = None, cache: Optional[str] = None) -> int:
+        """
+        Returns the number of bytes involved in the events with the given name and labels.
+
+        :param name: The event name.
+        :type name: :class:`str`
+        :param stage: Only count events emitted in this stage.
+        :type stage: Optional[:class:`str`]
+        :param cache: Only count cache events of this cache.
+        :type cache: Optional[:class:`str`]
+        """
+        with self._lock:
+            return sum(size for key, size in self._sizes.items() if _matches(key, name, stage, cache))
+
+    def histogram(self, name: str, *, stage: Optional[str] = None, cache: Optional[str] = None) -> Histogram:
+        """
+        Returns a histogram of the durations of the events with the given name and labels.
+
+        :param name: The event name.
+        :type name: :class:`str`
+        :param stage: Only include events emitted in this stage.
+        :type stage: Optional[:class:`str`]
+        :param cache: Only include cache events of this cache.
+        :type cache: Optional[:class:`str`]
+        """
+        merged = Histogram(self.buckets)
+        with self._lock:
+            for key, histogram in self._histograms.items():
+                if not _matches(key, name, stage, cache) or not histogram.count:
+                    continue
+                merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+                merged.count += histogram.count
+                merged.total += histogram.total
+                merged.minimum = histogram.minimum if merged.minimum is None else min(merged.minimum, histogram.minimum)
+                merged.maximum = histogram.maximum if merged.maximum is None else max(merged.maximum, histogram.maximum)
+        return merged
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Returns every metric as a JSON-serializable list of dictionaries, one per event name, stage and cache.
+        """
+        with self._lock:
+            return [
+                {
+                    "name": name,
+                    "stage": stage,
+                    "cache": cache,
+                    "count": count,
+                    "size": self._sizes[(name, stage, cache)],
+                    "duration": self._histograms[(name, stage, cache)].to_dict() if (name, stage, cache) in self._histograms else None
+                }
+                for (name, stage, cache), count in sorted(self._counts.items(), key=lambda item: tuple(str(part) for part in item[0]))
+            ]
+
+    def reset(self) -> None:
+        """
+        Discards every metric.
+        """
+        with self._lock:
+            self._counts.clear()
+            self._sizes.clear()
+            self._histograms.clear()
+
+
+# Replaced as a whole on every change, so that emitting never needs the lock.
+_registry: Dict[str, Tuple[Callable[[Event], Any], ...]] = {"observers": ()}
+_observers_lock = Lock()
+_current_stage: ContextVar[Optional[str]] = ContextVar("gocomics_stage", default=None)
+
+
+def add_observer(observer: Callable[[Event], Any]) -> None:
+    """
+    Registers a function called with every :class:`Event` the library emits, in the thread or task that emitted it.
+
+    Observers should return quickly. Exceptions they raise propagate to the caller of the library.
+
+    :param observer: The function to call.
+    :type observer: Callable[[:class:`Event`], Any]
+    """
+    with _observers_lock:
+        _registry["observers"] = (*_registry["observers"], observer)
+
+def remove_observer(observer: Callable[[Event], Any]) -> None:
+    """
+    Unregisters an observer added with :func:`add_observer`. Unknown observers are ignored.
+
+    :param observer: The function to remove.
+    :type observer: Callable[[:class:`Event`], Any]
+    """
+    with _observers_lock:
+        _registry["observers"] = tuple(registered for registered in _registry["observers"] if registered != observer)
+
+@contextmanager
+def observe(observer: Callable[[Event], Any]) -> Iterator[Callable[[Event], Any]]:
+    """
+    Registers `observer` for the duration of a ``with`` block, and returns it.
+
+    :param observer: The function to call.
+    :type observer: Callable[[:class:`Event`], Any]
+    """
+    add_observer(observer)
+    try:
+        yield observer
+    finally:
+        remove_observer(observer)
+
+
+def _emit(name: str, *, duration: Optional[float] = None, size: Optional[int] = None, url: Optional[str] = None, status: Optional[int] = None, **detail: Any) -> None:
+    observers = _registry["observers"]
+    # No event is built unless someone observes it.
+    if not observers:
+        return
+    event = Event(name, stage=_current_stage.get(), duration=duration, size=size, url=url, status=status, detail=detail)
+    for observer in observers:
+        observer(event)
+
+@contextmanager
+def _stage(name: str, url: Optional[str] = None) -> Iterator[None]:
+    if not _registry["observers"]:
+        yield
+        return
+    token = _current_stage.set(name)
+    started = perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = repr(e)
+        raise
+    finally:
+        detail = {"error": error} if error else {}
+        _emit("stage", duration=perf_counter() - started, url=url, **detail)
+        _current_stage.reset(token)
+
+def _matches(key: Tuple[str, Optional[str], Optional[str]], name: str, stage: Optional[str], cache: Optional[str]) -> bool:
+    return key[0] == name and (stage is None or key[1] == stage) and (cache is None or key[2] == cache)
@@ -0,0 +1,217 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+import csv
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .comic import STRIP_FIELDS, Comic, _is_missing
+from .record import StripRecord
+from .transport import Transport, get_transport
+
+EXPORT_FIELDS = ("identifier", "date", *STRIP_FIELDS)
+EXPORT_FORMATS = ("jsonl", "csv", "parquet")
+DEFAULT_BATCH_SIZE = 1000
+
+FORMAT_SUFFIXES = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".parquet": "parquet"}
+
+
+def export( # pylint: disable=too-many-arguments
+    items: Iterable[Union[Comic, StripRecord, str, Exception]],
+    path: Union[str, Path],
+    *,
+    format: Optional[str] = None, # pylint: disable=redefined-builtin
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: Optional[int] = None,
+    transport: Optional[Transport] = None
+) -> int:
+    """
+    Writes the metadata of comics to a JSON Lines, CSV or Parquet file and returns the number of rows written.
+
+    Rows are written in batches of `batch_size`, so only one batch is held in memory at a time, whatever the number of comics. Each row has the comic's identifier, its date and the fields in `STRIP_FIELDS`.
+
+    .. note::
+
+        `items` can be the output of :func:`stream_comics`, any other iterable of :class:`Comic` or :class:`StripRecord`, or comic identifiers. The latest strip of each identifier is fetched as a :class:`Comic`, with `workers` threads if set. Identifiers and exceptions for comics that do not exist (404 or 410) are skipped, and any other exception, yielded by the stream or raised while fetching a page, is raised.
+
+    .. note::
+
+        Parquet files require pyarrow, which is installed by the ``parquet`` extra. Each batch is written as a row group.
+
+    :param items: The comics to export.
+    :type items: Iterable[Union[:class:`Comic`, :class:`StripRecord`, str, Exception]]
+    :param path: The file to write.
+    :type path: Union[str, :class:`pathlib.Path`]
+    :param format: One of ``"jsonl"``, ``"csv"`` or ``"parquet"``. Defaults to the format matching the file's extension.
+    :type format: Optional[str]
+    :param batch_size: The number of rows written at a time.
+    :type batch_size: int
+    :param workers: The number of threads fetching the pages of identifiers.
+    :type workers: Optional[int]
+    :param transport: The transport used to fetch the pages of identifiers. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
+    """
+    path = Path(path)
+    format = format or FORMAT_SUFFIXES.get(path.suffix.lower())
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format for '{path}'. Choose one of {', '.join(EXPORT_FORMATS)}.")
+
+    writer = _WRITERS[format](path)
+    count = 0
+    batch = []
+    try:
+        for row in _rows(items, transport or get_transport(), workers):
+            batch.append(row)
+            if len(batch) >= max(batch_size, 1):
+                writer.write(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write(batch)
+            count += len(batch)
+    finally:
+        writer.close()
+    return count
+
+
+def _rows(items: Iterable[Union[Comic, StripRecord, str, Exception]], transport: Transport, workers: Optional[int]) -> Iterator[Dict[str, Any]]:
+    identifiers = []
+    for item in items:
+        if isinstance(item, str):
+            identifiers.append(item)
+            continue
+        yield from _latest_rows(identifiers, transport, workers)
+        identifiers = []
+        if isinstance(item, Exception):
+            if not _is_missing(item):
+                raise item
+        else:
+            yield _row(item)
+    yield from _latest_rows(identifiers, transport, workers)
+
+def _latest_rows(identifiers: Sequence[str], transport: Transport, workers: Optional[int]) -> Iterator[Dict[str, Any]]:
+    if not identifiers:
+        return
+    if not workers:
+        rows = (_latest_row(identifier, transport) for identifier in identifiers)
+        yield from (row for row in rows if row is not None)
+        return
+
+    pending = deque()
+    with ThreadPoolExecutor(workers) as executor:
+        for identifier in identifiers:
+            pending.append(executor.submit(_latest_row, identifier, transport))
+            while len(pending) >= workers * 2 or (pending and pending[0].done()):
+                row = pending.popleft().result()
+                if row is not None:
+                    yield row
+        while pending:
+            row = pending.popleft().result()
+            if row is not None:
+                yield row
+
+def _latest_row(identifier: str, transport: Transport) -> Optional[Dict[str, Any]]:
+    try:
+        comic = Comic(identifier, transport=transport)
+    except ValueError as e:
+        if not _is_missing(e):
+            raise
+        return None
+    return _row(comic)
+
+def _row(item: Union[Comic, StripRecord]) -> Dict[str, Any]:
+    return {name: getattr(item, name) for name in EXPORT_FIELDS}
+
+
+class _JSONLWriter:
+    def __init__(self, path: Path) -> None:
+        self._file = open(path, "w", encoding="utf-8") # pylint: disable=consider-using-with
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self._file.write("".join(json.dumps(_plain(row)) + "\n" for row in rows))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _CSVWriter:
+    def __init__(self, path: Path) -> None:
+        self._file = open(path, "w", encoding="utf-8", newline="") # pylint: disable=consider-using-with
+        self._writer = csv.DictWriter(self._file, EXPORT_FIELDS)
+        self._writer.writeheader()
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            row = _plain(row)
+            if row["keywords"] is not None:
+                row["keywords"] = ", ".join(row["keywords"])
+            self._writer.writerow(row)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path) -> None:
+        try:
+            import pyarrow # pylint: disable=import-outside-toplevel
+            import pyarrow.parquet # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ValueError("Parquet export requires the pyarrow package. Install gocomics.py[parquet].") from e
+        self._pyarrow = pyarrow
+        columns = [(name, pyarrow.string()) for name in EXPORT_FIELDS]
+        columns[EXPORT_FIELDS.index("date")] = ("date", pyarrow.date32())
+        columns[EXPORT_FIELDS.index("keywords")] = ("keywords", pyarrow.list_(pyarrow.string()))
+        self._schema = pyarrow.schema(columns)
+        self._writer = pyarrow.parquet.ParquetWriter(str(path), self._schema)
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        columns = {name: [row[name] for row in rows] for name in EXPORT_FIELDS}
+        columns["keywords"] = [list(keywords) if keywords is not None else None for keywords in columns["keywords"]]
+        self._writer.write_table(self._pyarrow.Table.from_pydict(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_WRITERS = {"jsonl": _JSONLWriter, "csv": _CSVWriter, "parquet": _ParquetWriter}
+
+
+def _plain(row: Dict[str, Any]) -> Dict[str, Any]:
+    row = dict(row)
+    if isinstance(row["date"], date):
+        row["date"] = row["date"].isoformat()
+    if row["keywords"] is not None:
+        row["keywords"] = list(row["keywords"])
+    return row
@@ -0,0 +1,241 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+import sqlite3
+from http.client import HTTPMessage, parse_headers
+from io import BytesIO
+from json import dumps, loads
+from os import fspath
+from pathlib import Path
+from re import fullmatch
+from threading import Lock
+from time import time
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+DEFAULT_TTLS = {
+    "archive": None,
+    "latest": 15 * 60,
+    "about": 24 * 60 * 60,
+    "listing": 60 * 60,
+    "popular": 60 * 60,
+    "other": 0,
+}
+
+
+def page_kind(url: str) -> str:
+    """
+    Returns the kind of page a URL points to: ``"archive"``, ``"latest"``, ``"about"``, ``"listing"``, ``"popular"`` or ``"other"``.
+
+    :param url: The URL of the page.
+    :type url: :class:`str`
+    """
+    path = urlsplit(url).path.strip("/")
+    if path.endswith("a-to-z"):
+        return "listing"
+    if path.endswith("popular"):
+        return "popular"
+    if path.endswith("/about"):
+        return "about"
+    if fullmatch(r"[^/]+/\d{4}/\d{2}/\d{2}", path):
+        return "archive"
+    if fullmatch(r"[^/]+", path):
+        return "latest"
+    return "other"
+
+
+class CacheEntry:
+
+    """
+    A class that represents a response stored in an :class:`HTTPCache`.
+
+    :ivar url: The URL of the response.
+    :ivar headers: The response headers.
+    :ivar body: The decoded response body.
+    :ivar stored_at: The UNIX time at which the response was stored or last revalidated.
+    :ivar fresh: Whether the entry can be used without revalidating it.
+    """
+
+    def __init__(self, url: str, headers: HTTPMessage, body: bytes, stored_at: float, fresh: bool) -> None:
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+        self.fresh = fresh
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Returns the headers that make a request conditional on this entry having changed.
+        """
+        headers = {}
+        if self.headers.get("ETag"):
+            headers["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+
+class HTTPCache:
+
+    """
+    A class that persists page responses, with their validators, in an SQLite database.
+
+    Fresh entries are served without a request. Stale entries are revalidated with a conditional request, so unchanged pages come back as 304 responses. Parsed results are stored next to the body, so a cache hit skips parsing too.
+
+    .. note::
+
+        How long an entry stays fresh depends on the kind of page, see :func:`page_kind`. By default, archive strips never expire, the latest strip is revalidated after 15 minutes, listings after an hour and about pages after a day. A TTL of None never expires and a TTL of 0 always revalidates.
+
+    :param path: The path of the SQLite database. Defaults to ``":memory:"``, a cache that is not persisted.
+    :type path: Union[:class:`str`, :class:`pathlib.Path`]
+    :param ttls: TTLs, in seconds, overriding the defaults for each kind of page.
+    :type ttls: Optional[Mapping[:class:`str`, Optional[:class:`float`]]]
+    :ivar hits: The number of lookups answered without a request.
+    :ivar revalidations: The number of stale entries confirmed unchanged by the server.
+    :ivar misses: The number of lookups that needed a full response.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:", *, ttls: Optional[Mapping[str, Optional[float]]] = None) -> None:
+        self.path = fspath(path)
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, headers TEXT NOT NULL, body BLOB NOT NULL, stored_at REAL NOT NULL)")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS parsed (url TEXT NOT NULL, parser TEXT NOT NULL, data TEXT NOT NULL, PRIMARY KEY (url, parser))")
+
+    def __enter__(self) -> HTTPCache:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """
+        Returns the entry stored for `url`, or None if there is none. Fresh entries are counted as hits.
+
+        :param url: The URL to look up.
+        :type url: :class:`str`
+        """
+        ttl = self.ttls.get(page_kind(url), self.ttls["other"])
+        with self._lock:
+            row = self._connection.execute("SELECT headers, body, stored_at FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            headers, body, stored_at = row
+            fresh = ttl is None or time() - stored_at < ttl
+            if fresh:
+                self.hits += 1
+        return CacheEntry(url, parse_headers(BytesIO(headers.encode("latin-1"))), body, stored_at, fresh)
+
+    def store(self, url: str, headers: HTTPMessage, body: bytes) -> None:
+        """
+        Stores a full response for `url`, replacing any previous entry and its parsed results.
+
+        :param url: The URL of the response.
+        :type url: :class:`str`
+        :param headers: The response headers.
+        :type headers: :class:`http.client.HTTPMessage`
+        :param body: The decoded response body.
+        :type body: :class:`bytes`
+        """
+        kept = "".join(f"{name}: {value}\r\n" for name, value in headers.items() if name.lower() not in ("content-encoding", "content-length", "transfer-encoding", "connection"))
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", (url, kept + "\r\n", body, time()))
+            self._connection.execute("DELETE FROM parsed WHERE url = ?", (url,))
+
+    def revalidated(self, url: str) -> None:
+        """
+        Marks the entry for `url` as confirmed unchanged by the server, which makes it fresh again.
+
+        :param url: The URL of the entry.
+        :type url: :class:`str`
+        """
+        with self._lock, self._connection:
+            self.revalidations += 1
+            self._connection.execute("UPDATE responses SET stored_at = ? WHERE url = ?", (time(), url))
+
+    def parsed(self, url: str, parser: str) -> Tuple[bool, Any]:
+        """
+        Returns a ``(found, value)`` tuple with the result `parser` produced for the stored body of `url`.
+
+        :param url: The URL of the entry.
+        :type url: :class:`str`
+        :param parser: The name of the parser.
+        :type parser: :class:`str`
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM parsed WHERE url = ? AND parser = ?", (url, parser)).fetchone()
+        return (True, loads(row[0])) if row else (False, None)
+
+    def store_parsed(self, url: str, parser: str, value: Any) -> None:
+        """
+        Stores the JSON-serializable result `parser` produced for the stored body of `url`.
+
+        :param url: The URL of the entry.
+        :type url: :class:`str`
+        :param parser: The name of the parser.
+        :type parser: :class:`str`
+        :param value: The parsed result.
+        :type value: Any
+        """
+        with self._lock, self._connection:
+            if self._connection.execute("SELECT 1 FROM responses WHERE url = ?", (url,)).fetchone():
+                self._connection.execute("INSERT OR REPLACE INTO parsed VALUES (?, ?, ?)", (url, parser, dumps(value)))
+
+    def discard(self, url: str) -> None:
+        """
+        Removes the entry for `url` and its parsed results.
+
+        :param url: The URL of the entry.
+        :type url: :class:`str`
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._connection.execute("DELETE FROM parsed WHERE url = ?", (url,))
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.execute("DELETE FROM parsed")
+
+    def close(self) -> None:
+        """
+        Closes the underlying database.
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,142 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import date, timedelta
+from os import fspath
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Optional, Union
+
+RECENT_DAYS = 7
+DEFAULT_RECENT_TTL = 60 * 60
+
+
+class NegativeCache:
+
+    """
+    A class that persists the comics known not to exist, in an SQLite database, so that they are not requested again.
+
+    An entry is keyed by a comic identifier and a date, or by the identifier alone for its latest strip. It is added whenever the site answers 404 or 410 for the comic's page, and is consulted before any request is made for it.
+
+    .. note::
+
+        Gaps in old archives are permanent, so by default entries for dates older than a week never expire. Entries for recent dates, whose strip may just not be published yet, and for identifiers alone expire after an hour.
+
+    :param path: The path of the SQLite database. Defaults to ``":memory:"``, a cache that is not persisted.
+    :type path: Union[:class:`str`, :class:`pathlib.Path`]
+    :param ttl: The number of seconds before an entry for an old date expires, or None for never.
+    :type ttl: Optional[:class:`float`]
+    :param recent_ttl: The number of seconds before an entry for a recent date or an identifier alone expires, or None for never.
+    :type recent_ttl: Optional[:class:`float`]
+    :ivar hits: The number of lookups that found an entry, each of which saved a request.
+    :ivar misses: The number of lookups that found no entry.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:", *, ttl: Optional[float] = None, recent_ttl: Optional[float] = DEFAULT_RECENT_TTL) -> None:
+        self.path = fspath(path)
+        self.ttl = ttl
+        self.recent_ttl = recent_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS missing (identifier TEXT NOT NULL, day TEXT NOT NULL, stored_at REAL NOT NULL, PRIMARY KEY (identifier, day))")
+
+    def __enter__(self) -> NegativeCache:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def contains(self, identifier: str, day: Optional[date] = None) -> bool:
+        """
+        Returns whether the comic is known not to exist. Expired entries are removed and do not count.
+
+        :param identifier: The comic identifier.
+        :type identifier: :class:`str`
+        :param day: The date of the comic, or None for its latest strip.
+        :type day: Optional[:class:`date`]
+        """
+        key = (identifier, day.isoformat() if day else "")
+        with self._lock:
+            row = self._connection.execute("SELECT stored_at FROM missing WHERE identifier = ? AND day = ?", key).fetchone()
+            ttl = self.ttl if day and day < date.today() - timedelta(days=RECENT_DAYS) else self.recent_ttl
+            if row is not None and ttl is not None and time() - row[0] >= ttl:
+                with self._connection:
+                    self._connection.execute("DELETE FROM missing WHERE identifier = ? AND day = ?", key)
+                row = None
+            if row is None:
+                self.misses += 1
+                return False
+            self.hits += 1
+            return True
+
+    def add(self, identifier: str, day: Optional[date] = None) -> None:
+        """
+        Records that the comic does not exist.
+
+        :param identifier: The comic identifier.
+        :type identifier: :class:`str`
+        :param day: The date of the comic, or None for its latest strip.
+        :type day: Optional[:class:`date`]
+        """
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO missing VALUES (?, ?, ?)", (identifier, day.isoformat() if day else "", time()))
+
+    def discard(self, identifier: str, day: Optional[date] = None) -> None:
+        """
+        Removes the entry for the comic, if any.
+
+        :param identifier: The comic identifier.
+        :type identifier: :class:`str`
+        :param day: The date of the comic, or None for its latest strip.
+        :type day: Optional[:class:`date`]
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM missing WHERE identifier = ? AND day = ?", (identifier, day.isoformat() if day else ""))
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM missing")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM missing").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Closes the underlying database.
+        """
+        with self._lock:
+            self._connection.close()
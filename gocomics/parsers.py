@@ -0,0 +1,519 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+from functools import lru_cache
+from html.parser import HTMLParser
+from json import loads
+from re import IGNORECASE, search
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlparse, urlunparse
+
+from .cache import _Shared
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+PARSER_BACKENDS = ("fast", "strainer", "html.parser", "lxml")
+
+BYLINE_CLASS = "Typography_typography__C_Hp6 Typography_typography_body2___WsK9"
+NAME_CLASS = "Typography_typography__C_Hp6 Typography_typography_d2__3FxkY"
+HEADER_CLASS = "HeaderFeature_headerFeature__backgroundImage__ipPVn"
+IMAGE_CONTAINER_ID = "S:4"
+PREVIOUS_LINK_CLASS = "ComicNavigation_controls__button_previous__1N5Zz"
+NEXT_LINK_CLASS = "ComicNavigation_controls__button_next__3iN6Q"
+A_TO_Z_LINK_CLASS = "ComicsAtoZ_comics__link__IyrQd"
+POPULAR_LINK_CLASS = "BadgeByline_badgeByline__link__uZaRR"
+ABOUT_CLASSES = frozenset((
+    "AboutFeature_aboutFeature__details__ru_As",
+    "AboutFeature_aboutFeature__imageContainer__nE23W",
+    "AboutCreator_aboutCreator__details__6YZp3",
+    "AboutCreator_aboutCreator__tcSD7",
+    "SocialLinks_socialLinks__link__84fhl",
+    "AboutCharacter_aboutCharacter__cAOuK",
+))
+
+META_FIELDS = {
+    ("property", "og:title"): "title",
+    ("property", "og:description"): "description",
+    ("property", "og:image"): "share_image_url",
+    ("name", "keywords"): "keywords",
+}
+
+STRIP_SOURCES = {
+    "title": "title",
+    "description": "description",
+    "share_image_url": "share_image_url",
+    "keywords": "keywords",
+    "author": "byline",
+    "followers_count": "byline",
+    "name": "name",
+    "header_feature_url": "header_style",
+    "image_url": "image_json",
+}
+
+NAVIGATION_SOURCES = ("previous_href", "next_href")
+
+_backend = _Shared(lambda: "fast")
+
+
+def get_parser_backend() -> str:
+    """
+    Returns the name of the backend used to parse pages.
+    """
+    return _backend.get()
+
+def set_parser_backend(name: str) -> None:
+    """
+    Sets the backend used to parse pages. Every backend yields the same values.
+
+    - ``"fast"`` extracts the needed fields while streaming through the page, without building a tree. About pages, which need their structure, are parsed like ``"strainer"``.
+    - ``"strainer"`` builds a BeautifulSoup tree of the needed elements only.
+    - ``"html.parser"`` builds a full BeautifulSoup tree with Python's parser.
+    - ``"lxml"`` builds a full BeautifulSoup tree with lxml, which must be installed.
+
+    :param name: The name of the backend.
+    :type name: :class:`str`
+    """
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{name}'. Choose one of {', '.join(PARSER_BACKENDS)}.")
+    if name == "lxml":
+        try:
+            import lxml # pylint: disable=import-outside-toplevel, unused-import
+        except ImportError as e:
+            raise ValueError("The 'lxml' parser backend requires the lxml package.") from e
+    _backend.set(name)
+
+
+def parse_strip(html: bytes, *, backend: Optional[str] = None, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Extracts the fields of a :class:`Comic` from a strip page, along with the ISO dates of the previous and next strips linked from it.
+
+    :param html: The page.
+    :type html: :class:`bytes`
+    :param backend: The parser backend to use. Defaults to :func:`get_parser_backend`.
+    :type backend: Optional[:class:`str`]
+    :param fields: The fields to extract, from the keys of `STRIP_SOURCES`. Defaults to all of them. The others are left out, and the elements they come from are not looked for.
+    :type fields: Optional[Iterable[:class:`str`]]
+    """
+    backend = backend or get_parser_backend()
+    fields = STRIP_SOURCES.keys() if fields is None else fields
+    wanted = {*(_strip_source(field) for field in fields), *NAVIGATION_SOURCES}
+    if backend == "fast":
+        extractor = _StripExtractor(wanted)
+        extractor.run(html)
+        raw = extractor.raw
+    else:
+        soup = _soup(html, backend, _wanted_strip_tag)
+        raw = {}
+        for (attribute, value), field in META_FIELDS.items():
+            if field in wanted:
+                tag = soup.find("meta", {attribute: value})
+                raw[field] = tag.attrs.get("content") if tag else None
+
+        if "byline" in wanted:
+            tag = soup.find("span", {"class": BYLINE_CLASS})
+            raw["byline"] = tag.text if tag else None
+
+        if "name" in wanted:
+            tag = soup.find("h1", {"class": NAME_CLASS})
+            raw["name"] = tag.text if tag else None
+
+        if "header_style" in wanted:
+            tag = soup.find("div", {"class": HEADER_CLASS})
+            raw["header_style"] = tag.attrs.get("style") if tag else None
+
+        if "image_json" in wanted:
+            tag = soup.find("div", {"id": IMAGE_CONTAINER_ID})
+            subtag = tag.find("script", {"type": "application/ld+json"}) if tag else None
+            raw["image_json"] = subtag.text if subtag else None
+
+        tag = soup.find("a", {"class": PREVIOUS_LINK_CLASS})
+        raw["previous_href"] = tag.attrs.get("href") if tag else None
+
+        tag = soup.find("a", {"class": NEXT_LINK_CLASS})
+        raw["next_href"] = tag.attrs.get("href") if tag else None
+
+    return _strip_fields(raw, fields)
+
+def parse_about(html: bytes, *, backend: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Extracts the fields of an :class:`About` from an about page.
+
+    :param html: The page.
+    :type html: :class:`bytes`
+    :param backend: The parser backend to use. Defaults to :func:`get_parser_backend`.
+    :type backend: Optional[:class:`str`]
+    """
+    backend = backend or get_parser_backend()
+    soup = _soup(html, "strainer" if backend == "fast" else backend, _wanted_about_tag)
+    fields = {}
+
+    fields["about"] = _rich_text(soup.find("div", {"class": "AboutFeature_aboutFeature__details__ru_As"}))
+    fields["about_feature_url"] = _first_srcset_url(soup.find("div", {"class": "AboutFeature_aboutFeature__imageContainer__nE23W"}))
+    fields["about_author"] = _rich_text(soup.find("div", {"class": "AboutCreator_aboutCreator__details__6YZp3"}))
+    fields["author_image_url"] = _first_srcset_url(soup.find("div", {"class": "AboutCreator_aboutCreator__tcSD7"}))
+
+    tags = soup.find_all("a", {"class": "SocialLinks_socialLinks__link__84fhl"})
+    fields["social_urls"] = [tag.attrs["href"] for tag in tags]
+
+    tags = soup.find_all("div", {"class": "AboutCharacter_aboutCharacter__cAOuK"})
+    fields["characters"] = []
+    for tag in tags:
+        name = tag.find("h3").text if tag.find("h3") else None
+        image_url = _first_srcset_url(tag)
+        description = tag.find("p").text if tag.find("p") else None
+
+        if name and image_url and description:
+            fields["characters"].append({"name": name, "image_url": image_url, "description": description})
+
+    return fields
+
+def parse_a_to_z(html: bytes, *, backend: Optional[str] = None) -> List[str]:
+    """
+    Extracts the comic identifiers from an A to Z listing page.
+
+    :param html: The page.
+    :type html: :class:`bytes`
+    :param backend: The parser backend to use. Defaults to :func:`get_parser_backend`.
+    :type backend: Optional[:class:`str`]
+    """
+    return _listing_identifiers(html, A_TO_Z_LINK_CLASS, backend or get_parser_backend())
+
+def parse_a_to_z_entries(html: bytes, *, backend: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Extracts the identifier and display name of every comic in an A to Z listing page.
+
+    :param html: The page.
+    :type html: :class:`bytes`
+    :param backend: The parser backend to use. Defaults to :func:`get_parser_backend`.
+    :type backend: Optional[:class:`str`]
+    """
+    return [{"identifier": href.split("/")[-1], "name": name} for href, name in _listing_links(html, A_TO_Z_LINK_CLASS, backend or get_parser_backend()) if href]
+
+def parse_popular(html: bytes, *, backend: Optional[str] = None) -> List[str]:
+    """
+    Extracts the comic identifiers from a popular comics page.
+
+    :param html: The page.
+    :type html: :class:`bytes`
+    :param backend: The parser backend to use. Defaults to :func:`get_parser_backend`.
+    :type backend: Optional[:class:`str`]
+    """
+    return _listing_identifiers(html, POPULAR_LINK_CLASS, backend or get_parser_backend())
+
+
+def _strip_fields(raw: Dict[str, Optional[str]], wanted: Iterable[str]) -> Dict[str, Any]:
+    fields = {}
+    for field in ("title", "description", "share_image_url", "name"):
+        if field in wanted:
+            fields[field] = raw[field]
+    if "keywords" in wanted:
+        fields["keywords"] = raw["keywords"].split(", ") if raw["keywords"] is not None else None
+
+    byline = raw["byline"].split(" | ") if raw.get("byline") else []
+    if "author" in wanted:
+        fields["author"] = byline[0][3:] if byline else None
+    if "followers_count" in wanted:
+        fields["followers_count"] = byline[1].split(" ")[0] if len(byline) > 1 else None
+
+    if "header_feature_url" in wanted:
+        fields["header_feature_url"] = None
+        if raw["header_style"]:
+            match = search(r'url\("([^"]+)"\)', raw["header_style"])
+            fields["header_feature_url"] = urlunparse(urlparse(match.group(1))._replace(query="")) if match else None
+
+    if "image_url" in wanted:
+        fields["image_url"] = loads(raw["image_json"]).get("contentUrl") if raw["image_json"] else None
+
+    fields["previous_date"] = _link_date(raw["previous_href"])
+    fields["next_date"] = _link_date(raw["next_href"])
+    return fields
+
+def _strip_source(field: str) -> str:
+    if field not in STRIP_SOURCES:
+        raise ValueError(f"Unknown strip field '{field}'. Choose from {', '.join(STRIP_SOURCES)}.")
+    return STRIP_SOURCES[field]
+
+@lru_cache(maxsize=None)
+def _strip_parser(fields: FrozenSet[str]) -> Callable[[bytes], Dict[str, Any]]:
+    if fields == STRIP_SOURCES.keys():
+        return parse_strip
+    for field in fields:
+        _strip_source(field)
+
+    def parser(html: bytes) -> Dict[str, Any]:
+        return parse_strip(html, fields=fields)
+
+    # Parsed results are cached under the parser's name, which must differ between sets of fields.
+    parser.__qualname__ = f"parse_strip[{','.join(sorted(fields))}]"
+    return parser
+
+def _link_date(href: Optional[str]) -> Optional[str]:
+    match = search(r"/(\d{4})/(\d{2})/(\d{2})/?(?:[?#]|$)", href) if href else None
+    return "-".join(match.groups()) if match else None
+
+def _listing_identifiers(html: bytes, link_class: str, backend: str) -> List[str]:
+    return [href.split("/")[-1] for href, _ in _listing_links(html, link_class, backend) if href]
+
+def _listing_links(html: bytes, link_class: str, backend: str) -> List[Tuple[Optional[str], str]]:
+    if backend == "fast":
+        extractor = _LinkExtractor(link_class)
+        extractor.run(html)
+        links = [(href, "".join(parts)) for href, parts in extractor.links]
+    else:
+        soup = _soup(html, backend, lambda name, attrs: name == "a" and _has_class(attrs.get("class"), link_class))
+        links = [(tag.attrs.get("href"), tag.get_text()) for tag in soup.find_all("a", {"class": link_class})]
+    return [(href, " ".join(text.split())) for href, text in links]
+
+def _rich_text(container) -> List[Union[Dict[str, str], str]]:
+    tag = container.find("div", {"class": "RichTextParser_richTextParser__joxf7"}) if container else None
+    if not tag:
+        return []
+
+    subtags = []
+    for paragraph in tag.find_all("p"):
+        subtags.extend(list(paragraph.descendants))
+
+    text = []
+    index = 0
+    while index < len(subtags):
+        if subtags[index].name == "a":
+            text.append({"url": subtags[index].attrs["href"], "text": subtags[index].text})
+            index += 2
+        else:
+            text.append(subtags[index].text)
+            index += 1
+    return text
+
+def _first_srcset_url(container) -> Optional[str]:
+    tag = container.find("img") if container else None
+    urls = tag.attrs["srcset"].split(", ") if tag and tag.attrs.get("srcset") else []
+
+    url = urls[0].split(" ")[0] if urls else None
+    if url:
+        return urlunparse(urlparse(url)._replace(query=""))
+    return None
+
+
+def _has_class(value: Optional[Union[str, List[str]]], name: str) -> bool:
+    if not value:
+        return False
+    classes = value.split() if isinstance(value, str) else list(value)
+    return name in classes or name == " ".join(classes)
+
+def _wanted_strip_tag(name: str, attrs: Dict[str, Any]) -> bool:
+    if name == "meta":
+        return True
+    if name == "span":
+        return _has_class(attrs.get("class"), BYLINE_CLASS)
+    if name == "h1":
+        return _has_class(attrs.get("class"), NAME_CLASS)
+    if name == "div":
+        return attrs.get("id") == IMAGE_CONTAINER_ID or _has_class(attrs.get("class"), HEADER_CLASS)
+    if name == "a":
+        return _has_class(attrs.get("class"), PREVIOUS_LINK_CLASS) or _has_class(attrs.get("class"), NEXT_LINK_CLASS)
+    return False
+
+def _wanted_about_tag(name: str, attrs: Dict[str, Any]) -> bool: # pylint: disable=unused-argument
+    value = attrs.get("class")
+    classes = value.split() if isinstance(value, str) else value or []
+    return not ABOUT_CLASSES.isdisjoint(classes)
+
+
+@lru_cache(maxsize=None)
+def _tag_filter_type() -> Optional[type]:
+    # BeautifulSoup is only imported by the backends that build a tree, as importing it is slow.
+    try:
+        from bs4.filter import ElementFilter # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    class _TagFilter(ElementFilter):
+        def __init__(self, wanted: Callable[[str, Dict[str, Any]], bool]) -> None:
+            super().__init__()
+            self.wanted = wanted
+
+        def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+            return self.wanted(name, attrs or {})
+
+        def allow_string_creation(self, string) -> bool:
+            return False
+
+    return _TagFilter
+
+def _strainer(wanted: Callable[[str, Dict[str, Any]], bool]):
+    tag_filter = _tag_filter_type()
+    if tag_filter is None:
+        # beautifulsoup4 < 4.13 calls a name function with the tag name and its attributes.
+        from bs4 import SoupStrainer # pylint: disable=import-outside-toplevel
+        return SoupStrainer(wanted)
+    return tag_filter(wanted)
+
+def _soup(html: bytes, backend: str, wanted: Callable[[str, Dict[str, Any]], bool]) -> BeautifulSoup:
+    from bs4 import BeautifulSoup # pylint: disable=import-outside-toplevel, redefined-outer-name
+    if backend == "strainer":
+        return BeautifulSoup(html, "html.parser", parse_only=_strainer(wanted))
+    if backend in ("html.parser", "lxml"):
+        return BeautifulSoup(html, backend)
+    raise ValueError(f"Unknown parser backend '{backend}'. Choose one of {', '.join(PARSER_BACKENDS)}.")
+
+
+def _decode(html: bytes) -> str:
+    for bom, encoding in ((b"\xef\xbb\xbf", "utf-8"), (b"\xff\xfe", "utf-16-le"), (b"\xfe\xff", "utf-16-be")):
+        if html.startswith(bom):
+            return html[len(bom):].decode(encoding, errors="replace")
+    match = search(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)""", html[:4096], IGNORECASE)
+    for encoding in ([match.group(1).decode("ascii")] if match else []) + ["utf-8"]:
+        try:
+            return html.decode(encoding)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return html.decode("windows-1252", errors="replace")
+
+
+class _Done(Exception):
+    pass
+
+
+class _Extractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+
+    def run(self, html: Union[bytes, str]) -> None:
+        if isinstance(html, bytes):
+            html = _decode(html)
+        try:
+            self.feed(html)
+            self.close()
+        except _Done:
+            pass
+
+
+class _StripExtractor(_Extractor):
+    def __init__(self, wanted: Iterable[str]) -> None:
+        super().__init__()
+        self.raw = {"title": None, "description": None, "share_image_url": None, "keywords": None, "byline": None, "name": None, "header_style": None, "image_json": None, "previous_href": None, "next_href": None}
+        # Unwanted values count as found, so that they are not looked for and do not delay the end of the page.
+        self._found = {key for key in (*self.raw, "image_container") if key not in wanted and (key != "image_container" or "image_json" not in wanted)}
+        self._captures = []
+        self._image_depth = 0
+        self._raw_text = None
+
+    def _find(self, key: str) -> bool:
+        if key in self._found:
+            return False
+        self._found.add(key)
+        return True
+
+    def handle_starttag(self, tag, attrs) -> None:
+        attrs = {name: value if value is not None else "" for name, value in attrs}
+        if tag in ("script", "style"):
+            self._raw_text = tag
+        for capture in self._captures:
+            if capture[1] == tag:
+                capture[2] += 1
+
+        if tag == "meta":
+            self._start_meta(attrs)
+        elif tag == "span" and _has_class(attrs.get("class"), BYLINE_CLASS) and self._find("byline"):
+            self._captures.append(["byline", tag, 1, []])
+        elif tag == "h1" and _has_class(attrs.get("class"), NAME_CLASS) and self._find("name"):
+            self._captures.append(["name", tag, 1, []])
+        elif tag == "div":
+            self._start_div(attrs)
+        elif tag == "script" and self._image_depth and attrs.get("type") == "application/ld+json" and self._find("image_json"):
+            self._captures.append(["image_json", tag, 1, []])
+        elif tag == "a":
+            self._start_link(attrs)
+
+    def _start_meta(self, attrs: Dict[str, str]) -> None:
+        for (attribute, value), field in META_FIELDS.items():
+            if attrs.get(attribute) == value and self._find(field):
+                self.raw[field] = attrs.get("content")
+
+    def _start_div(self, attrs: Dict[str, str]) -> None:
+        if self._image_depth:
+            self._image_depth += 1
+        elif attrs.get("id") == IMAGE_CONTAINER_ID and self._find("image_container"):
+            self._image_depth = 1
+        if _has_class(attrs.get("class"), HEADER_CLASS) and self._find("header_style"):
+            self.raw["header_style"] = attrs.get("style")
+
+    def _start_link(self, attrs: Dict[str, str]) -> None:
+        if _has_class(attrs.get("class"), PREVIOUS_LINK_CLASS) and self._find("previous_href"):
+            self.raw["previous_href"] = attrs.get("href")
+        elif _has_class(attrs.get("class"), NEXT_LINK_CLASS) and self._find("next_href"):
+            self.raw["next_href"] = attrs.get("href")
+
+    def handle_endtag(self, tag) -> None:
+        if tag == self._raw_text:
+            self._raw_text = None
+        if tag == "div" and self._image_depth:
+            self._image_depth -= 1
+        for capture in list(self._captures):
+            if capture[1] == tag:
+                capture[2] -= 1
+                if capture[2] == 0:
+                    self._captures.remove(capture)
+                    self.raw[capture[0]] = "".join(capture[3])
+        if not self._captures and not self._image_depth and len(self._found) == len(self.raw) + 1:
+            raise _Done()
+
+    def handle_data(self, data) -> None:
+        for capture in self._captures:
+            # Like BeautifulSoup, text inside a script or style element only counts for that element.
+            if self._raw_text is None or capture[1] == self._raw_text:
+                capture[3].append(data)
+
+    def close(self) -> None:
+        super().close()
+        for field, _, _, parts in self._captures:
+            self.raw[field] = "".join(parts)
+
+
+class _LinkExtractor(_Extractor):
+    def __init__(self, link_class: str) -> None:
+        super().__init__()
+        self.link_class = link_class
+        self.links = []
+        self._text = None
+
+    def handle_starttag(self, tag, attrs) -> None:
+        if tag == "a":
+            attrs = dict(attrs)
+            if _has_class(attrs.get("class"), self.link_class):
+                self._text = []
+                self.links.append((attrs.get("href"), self._text))
+
+    def handle_endtag(self, tag) -> None:
+        if tag == "a":
+            self._text = None
+
+    def handle_data(self, data) -> None:
+        if self._text is not None:
+            self._text.append(data)
@@ -0,0 +1,254 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from random import uniform
+from threading import Event, Lock
+from time import monotonic, time
+from typing import Any, Dict, Iterator, Optional
+
+from .cache import _Shared
+
+DEFAULT_RATE = 10.0
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 30.0
+
+RETRY_BUDGET_WINDOW = 100
+
+THROTTLE_CODES = (429, 503)
+RETRY_CODES = (429, 502, 503, 504)
+
+
+class _Bucket:
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.tokens = burst
+        self.updated = monotonic()
+        self.blocked_until = 0.0
+
+
+class RateLimiter:
+
+    """
+    A class that paces requests with a token bucket per host and schedules retries with exponential backoff and jitter.
+
+    The rate adapts to the server: it is halved whenever the server throttles a request (429 or 503) and grows back slowly with every successful one. A `Retry-After` header pauses every request to that host. Retries are drawn from a budget shared by every worker that uses the limiter, so that a struggling server is not flooded with retries.
+
+    :param rate: The initial number of requests per second allowed to each host, or None for no limit.
+    :type rate: Optional[:class:`float`]
+    :param burst: The number of requests that can be made at once before pacing starts. Defaults to `rate`.
+    :type burst: Optional[:class:`float`]
+    :param min_rate: The lowest rate the limiter adapts down to.
+    :type min_rate: :class:`float`
+    :param max_rate: The highest rate the limiter adapts up to. Defaults to five times `rate`.
+    :type max_rate: Optional[:class:`float`]
+    :param increase: The number of requests per second added to the rate after each successful request.
+    :type increase: :class:`float`
+    :param max_retries: The maximum number of retries for one request.
+    :type max_retries: :class:`int`
+    :param base_delay: The delay, in seconds, before the first retry. It doubles with every retry.
+    :type base_delay: :class:`float`
+    :param max_delay: The longest delay, in seconds, before a retry.
+    :type max_delay: :class:`float`
+    :param retry_ratio: The number of retries earned by each request. The budget holds at most `min_retries` plus the retries earned by `RETRY_BUDGET_WINDOW` requests.
+    :type retry_ratio: :class:`float`
+    :param min_retries: The number of retries available before any request has been made.
+    :type min_retries: :class:`int`
+    """
+
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        rate: Optional[float] = DEFAULT_RATE,
+        *,
+        burst: Optional[float] = None,
+        min_rate: float = 0.5,
+        max_rate: Optional[float] = None,
+        increase: float = 0.5,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        retry_ratio: float = 0.2,
+        min_retries: int = 10
+    ) -> None:
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate or 1.0, 1.0)
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else (rate or 0.0) * 5
+        self.increase = increase
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_ratio = retry_ratio
+        self.min_retries = min_retries
+        self._budget = float(min_retries)
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = Lock()
+        self._stats = {"requests": 0, "throttled": 0, "retries": 0, "retries_denied": 0, "waited": 0.0}
+
+    def reserve(self, host: str = "") -> float:
+        """
+        Takes a token for a request to `host` and returns the number of seconds to wait before sending it.
+
+        :param host: The host the request is sent to.
+        :type host: :class:`str`
+        """
+        with self._lock:
+            self._stats["requests"] += 1
+            self._budget = min(self._budget + self.retry_ratio, self.min_retries + RETRY_BUDGET_WINDOW * self.retry_ratio)
+            now = monotonic()
+            bucket = self._bucket(host, now)
+            wait = max(bucket.blocked_until - now, 0.0)
+            if bucket.rate:
+                bucket.tokens = min(bucket.tokens + (now - bucket.updated) * bucket.rate, self.burst)
+                bucket.updated = now
+                bucket.tokens -= 1
+                if bucket.tokens < 0:
+                    wait = max(wait, -bucket.tokens / bucket.rate)
+            self._stats["waited"] += wait
+            return wait
+
+    def record(self, host: str, status: Optional[int], retry_after: Optional[str] = None) -> None:
+        """
+        Adapts the rate for `host` to the outcome of a request.
+
+        :param host: The host the request was sent to.
+        :type host: :class:`str`
+        :param status: The HTTP status code of the response, or None if no response was received.
+        :type status: Optional[:class:`int`]
+        :param retry_after: The value of the response's `Retry-After` header.
+        :type retry_after: Optional[:class:`str`]
+        """
+        with self._lock:
+            now = monotonic()
+            bucket = self._bucket(host, now)
+            if status in THROTTLE_CODES:
+                self._stats["throttled"] += 1
+                if bucket.rate:
+                    bucket.rate = max(bucket.rate / 2, self.min_rate)
+                delay = _retry_after_seconds(retry_after)
+                if delay is not None:
+                    bucket.blocked_until = max(bucket.blocked_until, now + min(delay, self.max_delay))
+            elif status is not None and status < 400 and bucket.rate:
+                bucket.rate = min(bucket.rate + self.increase, max(self.max_rate, bucket.rate))
+
+    def retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Returns the number of seconds to wait before retrying a failed request, or None if it should not be retried.
+
+        A retry is allowed while `attempt` is below `max_retries`, the shared retry budget is not exhausted, the delay ends before the deadline of the current call, if any (see :func:`fetch_latest`), and the work has not been abandoned, such as by closing a stream. The delay honours `retry_after`, and otherwise grows exponentially from `base_delay` with full jitter.
+
+        :param attempt: The number of retries already made for the request.
+        :type attempt: :class:`int`
+        :param retry_after: The value of the response's `Retry-After` header.
+        :type retry_after: Optional[:class:`str`]
+        """
+        delay = _retry_after_seconds(retry_after)
+        if delay is None:
+            delay = uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        delay = min(delay, self.max_delay)
+
+        deadline, stop = _deadline.get(), _stop.get()
+        with self._lock:
+            if attempt >= self.max_retries or self._budget < 1 or (deadline is not None and monotonic() + delay > deadline) or (stop is not None and stop.is_set()):
+                self._stats["retries_denied"] += 1
+                return None
+            self._budget -= 1
+            self._stats["retries"] += 1
+        return delay
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns counters of requests, throttled responses, retries made and denied, the total time spent waiting, the remaining retry budget and the current rate of each host.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["retry_budget"] = self._budget
+            stats["rates"] = {host: bucket.rate for host, bucket in self._buckets.items()}
+        return stats
+
+    def _bucket(self, host: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(self.rate, self.burst)
+            bucket.updated = now
+        return bucket
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time(), 0.0)
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+_shared = _Shared(RateLimiter)
+_deadline: ContextVar[Optional[float]] = ContextVar("gocomics_deadline", default=None)
+_stop: ContextVar[Optional[Event]] = ContextVar("gocomics_stop", default=None)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Returns the rate limiter shared by the library, creating it on first use.
+    """
+    return _shared.get()
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """
+    Replaces the rate limiter shared by the library. Passing None restores a default limiter on next use.
+
+    :param limiter: The new shared limiter.
+    :type limiter: Optional[:class:`RateLimiter`]
+    """
+    _shared.set(limiter)
+
+@contextmanager
+def _retry_deadline(deadline: Optional[float]) -> Iterator[None]:
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+@contextmanager
+def _retry_stop(stop: Event) -> Iterator[None]:
+    # Denies every retry made in the block once `stop` is set.
+    token = _stop.set(stop)
+    try:
+        yield
+    finally:
+        _stop.reset(token)
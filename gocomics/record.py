@@ -0,0 +1,186 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+from datetime import date
+from json import dumps, loads
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .parsers import parse_strip
+
+RECORD_FIELDS = ("title", "description", "share_image_url", "keywords", "author", "followers_count", "name", "header_feature_url", "image_url", "previous_date", "next_date")
+
+
+class StripRecord:
+
+    """
+    A class that represents the metadata of a strip, as an immutable and compact value.
+
+    Records never access the network. They can be built from a page or from fields that were already fetched, serialized to dictionaries or JSON and back, and turned into a :class:`Comic` with :meth:`Comic.from_record`.
+
+    :param identifier: The comic's identifier.
+    :type identifier: :class:`str`
+    :param date: The strip's date, or None for the latest strip.
+    :type date: Optional[:class:`date`]
+    :param fields: The fields in `RECORD_FIELDS`, by name. Fields not given are None.
+    :type fields: Any
+    :ivar title: The title of the comic.
+    :ivar description: The description of the comic.
+    :ivar share_image_url: The URL of the comic's share image.
+    :ivar keywords: The keywords associated with the comic, as a tuple.
+    :ivar author: The author of the comic.
+    :ivar followers_count: The number of followers of the comic.
+    :ivar name: The name of the comic.
+    :ivar header_feature_url: The URL of the comic's header feature image.
+    :ivar image_url: The URL of the comic's main image.
+    :ivar previous_date: The date of the previous strip.
+    :ivar next_date: The date of the next strip.
+    """
+
+    __slots__ = ("identifier", "date", *RECORD_FIELDS)
+
+    identifier: str
+    title: Optional[str]
+    description: Optional[str]
+    share_image_url: Optional[str]
+    keywords: Optional[Tuple[str, ...]]
+    author: Optional[str]
+    followers_count: Optional[str]
+    name: Optional[str]
+    header_feature_url: Optional[str]
+    image_url: Optional[str]
+    previous_date: Optional[date]
+    next_date: Optional[date]
+
+    def __init__(self, identifier: str, date: Optional[date] = None, **fields: Any) -> None: # pylint: disable=redefined-outer-name
+        unknown = set(fields).difference(RECORD_FIELDS)
+        if unknown:
+            raise TypeError(f"StripRecord got unexpected fields: {', '.join(sorted(unknown))}")
+        if fields.get("keywords") is not None:
+            fields["keywords"] = tuple(fields["keywords"])
+        object.__setattr__(self, "identifier", identifier)
+        object.__setattr__(self, "date", date)
+        for name in RECORD_FIELDS:
+            object.__setattr__(self, name, fields.get(name))
+
+    @classmethod
+    def from_fields(cls, identifier: str, day: Optional[date], fields: Dict[str, Any]) -> StripRecord:
+        """
+        Builds a record from the fields extracted by :func:`parse_strip`, such as those stored by an :class:`HTTPCache`.
+
+        :param identifier: The comic's identifier.
+        :type identifier: :class:`str`
+        :param day: The strip's date, or None for the latest strip.
+        :type day: Optional[:class:`date`]
+        :param fields: The extracted fields.
+        :type fields: Dict[:class:`str`, Any]
+        """
+        values = {name: fields.get(name) for name in RECORD_FIELDS}
+        values["previous_date"] = _iso_date(values["previous_date"])
+        values["next_date"] = _iso_date(values["next_date"])
+        return cls(identifier, day, **values)
+
+    @classmethod
+    def from_page(cls, identifier: str, day: Optional[date], html: bytes) -> StripRecord:
+        """
+        Builds a record from a strip page that was already downloaded.
+
+        :param identifier: The comic's identifier.
+        :type identifier: :class:`str`
+        :param day: The strip's date, or None for the latest strip.
+        :type day: Optional[:class:`date`]
+        :param html: The page.
+        :type html: :class:`bytes`
+        """
+        return cls.from_fields(identifier, day, parse_strip(html))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> StripRecord:
+        """
+        Builds a record from a dictionary returned by :meth:`to_dict`.
+
+        :param data: The dictionary.
+        :type data: Dict[:class:`str`, Any]
+        """
+        return cls.from_fields(data["identifier"], _iso_date(data.get("date")), data)
+
+    @classmethod
+    def from_json(cls, text: str) -> StripRecord:
+        """
+        Builds a record from a JSON string returned by :meth:`to_json`.
+
+        :param text: The JSON string.
+        :type text: :class:`str`
+        """
+        return cls.from_dict(loads(text))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the record as a JSON-serializable dictionary. Dates are ISO strings.
+        """
+        data = {slot: getattr(self, slot) for slot in self.__slots__}
+        for name in ("date", "previous_date", "next_date"):
+            data[name] = data[name].isoformat() if data[name] else None
+        data["keywords"] = list(self.keywords) if self.keywords is not None else None
+        return data
+
+    def to_json(self) -> str:
+        """
+        Returns the record as a JSON string.
+        """
+        return dumps(self.to_dict())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for slot, value in zip(self.__slots__, state):
+            object.__setattr__(self, slot, value)
+
+    def __eq__(self, __o: object) -> bool:
+        if not isinstance(__o, StripRecord):
+            return NotImplemented
+        return self.__getstate__() == __o.__getstate__()
+
+    def __hash__(self) -> int:
+        return hash(self.__getstate__())
+
+    def __repr__(self) -> str:
+        # The date slot is not declared in the class body, where it would shadow the date type.
+        return f"StripRecord(identifier={self.identifier}, date={getattr(self, 'date')})"
+
+
+def _iso_date(value: Optional[Union[str, date]]) -> Optional[date]:
+    if isinstance(value, str):
+        return date.fromisoformat(value) if value else None
+    return value
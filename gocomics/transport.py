@@ -0,0 +1,641 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import annotations
+
+import zlib
+from abc import ABC, abstractmethod
+from copy import copy, deepcopy
+from functools import partial
+from http.client import HTTPConnection, HTTPException, HTTPMessage, HTTPSConnection
+from io import BytesIO
+from ssl import SSLContext, create_default_context
+from sys import version_info
+from threading import BoundedSemaphore, Event, Lock
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.error import HTTPError, URLError
+from urllib.parse import SplitResult, urljoin, urlsplit
+
+from .cache import _Shared
+from .events import _emit
+from .ratelimit import RETRY_CODES, RateLimiter, get_rate_limiter
+
+if TYPE_CHECKING:
+    from .httpcache import CacheEntry, HTTPCache
+    from .negativecache import NegativeCache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_POOL_SIZE = 10
+MAX_REDIRECTS = 5
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+DEFAULT_HEADERS = {
+    "User-Agent": f"Python-urllib/{version_info[0]}.{version_info[1]}",
+    "Accept-Encoding": "gzip, deflate, br" if brotli is not None else "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+
+class _Request:
+
+    __slots__ = ("method", "started", "first_byte", "stream", "done")
+
+    def __init__(self, method: str, started: float, stream: Any, done: Callable[[bool], None]) -> None:
+        self.method = method
+        self.started = started
+        self.first_byte = perf_counter() - started
+        self.stream = stream
+        self.done = done
+
+
+class _BaseResponse(ABC):
+
+    # What Response and AsyncResponse share: everything but reading the body from the connection.
+
+    def __init__(self, url: str, status: int, reason: str, headers: HTTPMessage, source: Union[_Request, bytes]) -> None:
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.from_cache = False
+        self.coalesced = False
+        self.parsed = None
+        if isinstance(source, _Request):
+            self._request = source
+            self._content = None
+            self._decoder = _decoder(headers.get("Content-Encoding"))
+        else:
+            self._request = None
+            self._content = source
+            self._decoder = None
+        self._received = 0
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.headers.get_content_charset() or "utf-8", errors="replace")
+
+    @property
+    @abstractmethod
+    def content(self) -> bytes:
+        """
+        Returns the whole body.
+        """
+
+    def _pending(self) -> _Request:
+        if self._request is None:
+            raise ValueError("The response body has already been consumed.")
+        return self._request
+
+    def _decode(self, data: bytes) -> bytes:
+        self._received += len(data)
+        return self._decoder.decompress(data) if self._decoder is not None else data
+
+    def _flush(self) -> bytes:
+        return self._decoder.flush() if hasattr(self._decoder, "flush") else b""
+
+    def _finish(self, reusable: bool, **detail) -> None:
+        # Reports the request and hands its connection back to the transport, once.
+        request, self._request = self._request, None
+        if request is not None:
+            _emit("request", duration=perf_counter() - request.started, size=self._received, url=self.url, status=self.status, method=request.method, first_byte=request.first_byte, **detail)
+            request.done(reusable)
+
+
+class Response(_BaseResponse):
+
+    """
+    A class that represents an HTTP response returned by a :class:`Transport`.
+
+    The body is decoded (gzip, deflate or brotli) as it is read. The underlying connection, and the per-host slot held by the request, are released once the body has been read completely, so always read the body or close the response.
+
+    :ivar url: The final URL of the response, after redirects.
+    :ivar status: The HTTP status code.
+    :ivar reason: The HTTP reason phrase.
+    :ivar headers: The response headers.
+    :ivar from_cache: Whether the response was served from an :class:`HTTPCache`.
+    :ivar coalesced: Whether the response was shared with a concurrent request for the same URL, instead of being fetched for this one.
+    :ivar parsed: The result of the parser passed to :meth:`Transport.get`, if any.
+    """
+
+    def __enter__(self) -> Response:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def iter_content(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Yields the decoded body in chunks of at most `chunk_size` raw bytes.
+
+        :param chunk_size: The number of bytes to read from the connection at a time.
+        :type chunk_size: :class:`int`
+        """
+        if self._content is not None:
+            yield self._content
+            return
+
+        raw = self._pending().stream
+        for data in iter(partial(raw.read, chunk_size), b""):
+            data = self._decode(data)
+            if data:
+                yield data
+
+        tail = self._flush()
+        if tail:
+            yield tail
+        raw.close()
+        self._finish(not raw.will_close)
+
+    def read(self) -> bytes:
+        """
+        Reads and returns the whole decoded body.
+        """
+        if self._content is None:
+            self._content = b"".join(self.iter_content())
+        return self._content
+
+    @property
+    def content(self) -> bytes:
+        return self.read()
+
+    def close(self) -> None:
+        """
+        Closes the response. If the body was not read completely, the connection is discarded instead of being reused.
+        """
+        if self._request is not None:
+            self._request.stream.close()
+            self._finish(False, complete=False)
+
+
+class _BaseTransport(ABC):
+
+    # What Transport and AsyncTransport share: their settings, coalescing counters and connection hand-back.
+
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        *,
+        timeout: float,
+        pool_size: int,
+        headers: Optional[Mapping[str, str]],
+        ssl_context: Optional[SSLContext],
+        cache: Optional[HTTPCache],
+        negative_cache: Optional[NegativeCache],
+        limiter: Optional[RateLimiter],
+        coalesce: bool
+    ) -> None:
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self.ssl_context = ssl_context
+        self.cache = cache
+        self.negative_cache = negative_cache
+        self.limiter = limiter
+        self.coalesce = coalesce
+        self._stats = {"flights": 0, "coalesced": 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the number of requests made by :meth:`get` (``"flights"``) and of calls that shared one of them instead (``"coalesced"``).
+        """
+        return dict(self._stats)
+
+    def _done(self, key: Tuple[str, str], connection: Any, reusable: bool) -> None:
+        if reusable:
+            self._release(key, connection)
+        else:
+            connection.close()
+        self._unlimit(key)
+
+    @abstractmethod
+    def _release(self, key: Tuple[str, str], connection: Any) -> None:
+        pass
+
+    @abstractmethod
+    def _unlimit(self, key: Tuple[str, str]) -> None:
+        pass
+
+
+class Transport(_BaseTransport):
+
+    """
+    A class that sends HTTP requests over pooled keep-alive connections.
+
+    A single transport is shared by the whole library. Use :func:`set_transport` to replace it, or pass one to :class:`Comic` and the search functions directly.
+
+    :param timeout: The socket timeout, in seconds, for connecting and reading.
+    :type timeout: :class:`float`
+    :param pool_size: The maximum number of idle connections kept per host.
+    :type pool_size: :class:`int`
+    :param per_host: The maximum number of requests in flight to a single host. Other threads wait for a request to finish before sending theirs. Unbounded by default.
+    :type per_host: Optional[:class:`int`]
+    :param headers: Extra headers sent with every request.
+    :type headers: Optional[Mapping[:class:`str`, :class:`str`]]
+    :param ssl_context: The SSL context used for HTTPS connections.
+    :type ssl_context: Optional[:class:`ssl.SSLContext`]
+    :param cache: A persistent cache consulted by :meth:`get`.
+    :type cache: Optional[:class:`HTTPCache`]
+    :param negative_cache: A persistent cache of the comics known not to exist, consulted by :class:`Comic` before any request.
+    :type negative_cache: Optional[:class:`NegativeCache`]
+    :param limiter: The rate limiter pacing and retrying requests. Defaults to the shared rate limiter.
+    :type limiter: Optional[:class:`RateLimiter`]
+    :param coalesce: Whether concurrent calls to :meth:`get` for the same URL share a single request.
+    :type coalesce: :class:`bool`
+    """
+
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        per_host: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        ssl_context: Optional[SSLContext] = None,
+        cache: Optional[HTTPCache] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        limiter: Optional[RateLimiter] = None,
+        coalesce: bool = True
+    ) -> None:
+        super().__init__(timeout=timeout, pool_size=pool_size, headers=headers, ssl_context=ssl_context, cache=cache, negative_cache=negative_cache, limiter=limiter, coalesce=coalesce)
+        self.per_host = per_host
+        self._idle: Dict[Tuple[str, str], List[HTTPConnection]] = {}
+        self._host_semaphores: Dict[Tuple[str, str], BoundedSemaphore] = {}
+        self._flights: Dict[tuple, _Flight] = {}
+        self._lock = Lock()
+
+    def __enter__(self) -> Transport:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def open(self, url: str, *, method: str = "GET", headers: Optional[Mapping[str, str]] = None) -> Response:
+        """
+        Sends a request and returns the response without reading its body. Redirects are followed.
+
+        Requests are paced by the transport's rate limiter. Throttled or failed requests (429, 502, 503, 504 or connection errors) are retried with backoff, as long as the limiter allows it.
+
+        :param url: The URL to request.
+        :type url: :class:`str`
+        :param method: The HTTP method.
+        :type method: :class:`str`
+        :param headers: Extra headers for this request.
+        :type headers: Optional[Mapping[:class:`str`, :class:`str`]]
+
+        :raises HTTPError: If the server answers with a status code of 400 or above.
+        :raises URLError: If the server cannot be reached.
+        """
+        limiter = self.limiter or get_rate_limiter()
+        attempt = 0
+        while True:
+            try:
+                return self._open(url, method, headers, limiter)
+            except URLError as e:
+                delay = _backoff(limiter, url, e, attempt)
+            sleep(delay)
+            attempt += 1
+
+    def _open(self, url: str, method: str, headers: Optional[Mapping[str, str]], limiter: RateLimiter) -> Response:
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._send(url, method, headers, limiter)
+            if response.status < 400 and not _is_redirect(response):
+                return response
+            url, method = _follow(url, method, response, response.read())
+        raise URLError(f"Too many redirects while fetching '{url}'.")
+
+    def get(
+        self,
+        url: str,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        parser: Optional[Callable[[bytes], Any]] = None,
+        refresh: bool = False
+    ) -> Response:
+        """
+        Sends a GET request and returns the response with its body already read.
+
+        If the transport has a cache, fresh entries are returned without a request and stale ones are revalidated with a conditional request.
+
+        Unless `coalesce` is False, a call made while another thread is already getting the same URL, with the same headers and `refresh`, waits for that request instead of sending its own. It receives a copy of the response, with :attr:`Response.coalesced` set, and a copy of the parsed result if it uses the same parser. If the request fails, it raises a copy of the error, chained to the original.
+
+        :param url: The URL to request.
+        :type url: :class:`str`
+        :param headers: Extra headers for this request.
+        :type headers: Optional[Mapping[:class:`str`, :class:`str`]]
+        :param parser: A function turning the body into a JSON-serializable value, stored as :attr:`Response.parsed`. Its result is cached alongside the body.
+        :type parser: Optional[Callable[[:class:`bytes`], Any]]
+        :param refresh: If True, a full request is made even if the cache holds the page.
+        :type refresh: :class:`bool`
+        """
+        if not self.coalesce:
+            return self._get(url, headers, parser, refresh)
+
+        key = _flight_key(url, headers, refresh)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(parser)
+                self._stats["flights"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if leader:
+            try:
+                flight.response = self._get(url, headers, parser, refresh)
+                return flight.response
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+
+        _emit("cache_hit", url=url, cache="inflight")
+        flight.done.wait()
+        if flight.error is not None:
+            raise _waiter_error(flight.error) from flight.error
+        return _coalesced(flight.response, self.cache, url, parser, flight.parser)
+
+    def _get(self, url: str, headers: Optional[Mapping[str, str]], parser: Optional[Callable[[bytes], Any]], refresh: bool) -> Response:
+        entry, request_headers = _cache_lookup(self.cache, url, headers, refresh)
+        if entry is not None and entry.fresh:
+            return _with_parsed(self.cache, url, _cached_response(Response, entry), parser)
+        response = self.open(url, headers=request_headers)
+        response.read()
+        return _with_parsed(self.cache, url, _revalidated(self.cache, url, entry, response), parser)
+
+    def close(self) -> None:
+        """
+        Closes every idle connection in the pool.
+        """
+        with self._lock:
+            connections = [connection for pool in self._idle.values() for connection in pool]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+    def _send(self, url: str, method: str, headers: Optional[Mapping[str, str]], limiter: RateLimiter) -> Response:
+        parts, target, request_headers = _request_parts(url, self.headers, headers)
+        key = (parts.scheme, parts.netloc)
+
+        delay = limiter.reserve(parts.netloc)
+        if delay:
+            _emit("sleep", duration=delay, url=url, reason="rate_limit")
+            sleep(delay)
+
+        self._limit(key)
+        try:
+            while True:
+                connection, reused = self._acquire(key)
+                started = perf_counter()
+                try:
+                    connection.request(method, target, headers=request_headers)
+                    raw = connection.getresponse()
+                except (HTTPException, OSError) as e:
+                    connection.close()
+                    if reused:
+                        continue
+                    limiter.record(parts.netloc, None)
+                    _emit("request", duration=perf_counter() - started, size=0, url=url, method=method, error=str(e))
+                    raise URLError(e) from e
+                limiter.record(parts.netloc, raw.status, raw.headers.get("Retry-After"))
+                return Response(url, raw.status, raw.reason, raw.headers, _Request(method, started, raw, partial(self._done, key, connection)))
+        except BaseException:
+            self._unlimit(key)
+            raise
+
+    def _limit(self, key: Tuple[str, str]) -> None:
+        if self.per_host is None:
+            return
+        with self._lock:
+            if key not in self._host_semaphores:
+                self._host_semaphores[key] = BoundedSemaphore(self.per_host)
+            semaphore = self._host_semaphores[key]
+        semaphore.acquire()
+
+    def _unlimit(self, key: Tuple[str, str]) -> None:
+        if self.per_host is not None:
+            self._host_semaphores[key].release()
+
+    def _acquire(self, key: Tuple[str, str]) -> Tuple[HTTPConnection, bool]:
+        with self._lock:
+            pool = self._idle.get(key)
+            if pool:
+                return pool.pop(), True
+
+        scheme, netloc = key
+        if scheme == "https":
+            if self.ssl_context is None:
+                self.ssl_context = create_default_context()
+            return HTTPSConnection(netloc, timeout=self.timeout, context=self.ssl_context), False
+        return HTTPConnection(netloc, timeout=self.timeout), False
+
+    def _release(self, key: Tuple[str, str], connection: HTTPConnection) -> None:
+        with self._lock:
+            pool = self._idle.setdefault(key, [])
+            if len(pool) < self.pool_size:
+                pool.append(connection)
+                return
+        connection.close()
+
+
+def _request_parts(url: str, default_headers: Mapping[str, str], headers: Optional[Mapping[str, str]]) -> Tuple[SplitResult, str, Dict[str, str]]:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        raise URLError(f"Unsupported URL scheme '{parts.scheme}'.")
+    target = parts.path or "/"
+    if parts.query:
+        target += f"?{parts.query}"
+
+    request_headers = dict(default_headers)
+    if headers:
+        request_headers.update(headers)
+    return parts, target, request_headers
+
+def _is_redirect(response: _BaseResponse) -> bool:
+    return response.status in REDIRECT_CODES and bool(response.headers.get("Location"))
+
+def _follow(url: str, method: str, response: _BaseResponse, body: bytes) -> Tuple[str, str]:
+    # Returns the URL and method to request next, or raises the error the response stands for.
+    if not _is_redirect(response):
+        raise HTTPError(url, response.status, response.reason, response.headers, BytesIO(body))
+    return urljoin(url, response.headers["Location"]), "GET" if response.status == 303 else method
+
+def _backoff(limiter: RateLimiter, url: str, error: URLError, attempt: int) -> float:
+    # Returns how long to wait before retrying, or raises the error if it may not be retried.
+    retry_after = error.headers.get("Retry-After") if isinstance(error, HTTPError) else None
+    delay = limiter.retry_delay(attempt, retry_after) if _retryable(error) else None
+    if delay is None:
+        raise error
+    _emit("retry", duration=delay, url=url, status=getattr(error, "code", None), attempt=attempt + 1, error=str(error))
+    _emit("sleep", duration=delay, url=url, reason="retry")
+    return delay
+
+def _retryable(error: URLError) -> bool:
+    if isinstance(error, HTTPError):
+        return error.code in RETRY_CODES
+    return isinstance(error.reason, (HTTPException, OSError))
+
+def _cache_lookup(cache: Optional[HTTPCache], url: str, headers: Optional[Mapping[str, str]], refresh: bool) -> Tuple[Optional[CacheEntry], Dict[str, str]]:
+    # Returns the cached entry for the URL, if any, and the headers to revalidate it with.
+    entry = cache.lookup(url) if cache is not None and not refresh else None
+    if entry is not None and entry.fresh:
+        _emit("cache_hit", url=url, cache="http")
+    request_headers = dict(headers or {})
+    if entry is not None:
+        request_headers.update(entry.validators())
+    return entry, request_headers
+
+def _revalidated(cache: Optional[HTTPCache], url: str, entry: Optional[CacheEntry], response: _BaseResponse) -> _BaseResponse:
+    # Returns the cached response if the server confirmed it is current, otherwise stores the new one.
+    if response.status == 304 and entry is not None:
+        _emit("cache_hit", url=url, cache="http", revalidated=True)
+        cache.revalidated(url)
+        return _cached_response(type(response), entry)
+    if cache is not None:
+        _emit("cache_miss", url=url, cache="http")
+        if response.status == 200:
+            cache.store(url, response.headers, response.content)
+    return response
+
+def _cached_response(cls: type, entry: CacheEntry) -> _BaseResponse:
+    response = cls(entry.url, 200, "OK", entry.headers, entry.body)
+    response.from_cache = True
+    return response
+
+def _with_parsed(cache: Optional[HTTPCache], url: str, response: _BaseResponse, parser: Optional[Callable[[bytes], Any]]) -> _BaseResponse:
+    if parser is not None:
+        response.parsed = _parse(cache, url, response, parser)
+    return response
+
+class _Flight:
+
+    __slots__ = ("parser", "done", "response", "error")
+
+    def __init__(self, parser: Optional[Callable[[bytes], Any]]) -> None:
+        self.parser = parser
+        self.done = Event()
+        self.response = None
+        self.error = None
+
+
+def _flight_key(url: str, headers: Optional[Mapping[str, str]], refresh: bool) -> tuple:
+    return url, refresh, tuple(sorted((headers or {}).items()))
+
+def _coalesced(response, cache: Optional[HTTPCache], url: str, parser: Optional[Callable[[bytes], Any]], shared_parser: Optional[Callable[[bytes], Any]]):
+    response = copy(response)
+    response.coalesced = True
+    if parser is not shared_parser:
+        response.parsed = _parse(cache, url, response, parser) if parser is not None else None
+    else:
+        # Every caller gets its own result, so that changing one does not change the others.
+        response.parsed = deepcopy(response.parsed)
+    return response
+
+def _waiter_error(error: Exception) -> Exception:
+    # Every waiter raises its own copy of the shared error, so that their tracebacks are not all appended to one exception.
+    if isinstance(error, HTTPError):
+        body = error.fp.getvalue() if isinstance(error.fp, BytesIO) else b""
+        return HTTPError(error.url, error.code, error.msg, error.hdrs, BytesIO(body))
+    try:
+        return copy(error)
+    except TypeError:
+        # Raised by exceptions that cannot be rebuilt from their arguments.
+        return URLError(error)
+
+def _parse(cache: Optional[HTTPCache], url: str, response, parser: Callable[[bytes], Any]) -> Any:
+    found, value = _cached_parse(cache, url, response, parser)
+    if found:
+        return value
+    started = perf_counter()
+    value = parser(response.content)
+    _store_parse(cache, url, response, parser, value=value, duration=perf_counter() - started)
+    return value
+
+def _cached_parse(cache: Optional[HTTPCache], url: str, response, parser: Callable[[bytes], Any]) -> Tuple[bool, Any]:
+    if cache is None or not response.from_cache:
+        return False, None
+    name = _parser_name(parser)
+    found, value = cache.parsed(url, name)
+    _emit("cache_hit" if found else "cache_miss", url=url, cache="parsed", parser=name)
+    return found, value
+
+def _store_parse(cache: Optional[HTTPCache], url: str, response, parser: Callable[[bytes], Any], *, value: Any, duration: float) -> None: # pylint: disable=too-many-arguments
+    name = _parser_name(parser)
+    _emit("parse", duration=duration, size=len(response.content), url=url, parser=name)
+    if cache is not None and response.status == 200:
+        cache.store_parsed(url, name, value)
+
+def _parser_name(parser: Callable[[bytes], Any]) -> str:
+    return f"{parser.__module__}.{parser.__qualname__}"
+
+def _decoder(encoding: Optional[str]):
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return zlib.decompressobj()
+    if encoding == "br" and brotli is not None:
+        return _BrotliDecoder()
+    return None
+
+
+class _BrotliDecoder:
+    def __init__(self) -> None:
+        decompressor = brotli.Decompressor()
+        self.decompress = getattr(decompressor, "process", None) or decompressor.decompress
+
+
+_shared = _Shared(Transport)
+
+
+def get_transport() -> Transport:
+    """
+    Returns the transport shared by the library, creating it on first use.
+    """
+    return _shared.get()
+
+def set_transport(transport: Optional[Transport]) -> None:
+    """
+    Replaces the transport shared by the library. Passing None restores a default transport on next use.
+
+    :param transport: The new shared transport.
+    :type transport: Optional[:class:`Transport`]
+    """
+    previous = _shared.set(transport)
+    if previous is not None and previous is not transport:
+        previous.close()
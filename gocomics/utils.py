@@ -25,21 +25,28 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from urllib.request import Request, urlopen
-from typing import List, Literal, Optional, Generator
-from datetime import datetime, timedelta
-
-from bs4 import BeautifulSoup
-from requests.utils import requote_uri
-
-from .comic import Comic
-from .endpoints import BASE_URL
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import partial
+from threading import Event
+from typing import Callable, List, Literal, Optional, Generator, Tuple, Union
+from datetime import date, datetime, timedelta
+
+from .comic import Comic, _is_missing
+from .dates import DateIndex, _installed_date_index
+from .endpoints import BASE_URL, requote_uri
+from .events import _stage
+from .parsers import parse_a_to_z, parse_popular
+from .ratelimit import _retry_stop
+from .transport import Transport, get_transport
 
 
 def search(
     *,
     last_updated_today: Optional[bool] = None,
-    categories: List[Literal["comicos-en-espanol", "family-comics", "funny-animals", "gag-comics", "graphic-novels", "mental-health-comics", "newspaper-comic-strips", "offbeat-comics", "office-humor", "relationship-comics", "sci-fi-fantasy-comics", "sports-comics", "vintage-comics", "webcomics", "kids"]] = None
+    categories: List[Literal["comicos-en-espanol", "family-comics", "funny-animals", "gag-comics", "graphic-novels", "mental-health-comics", "newspaper-comic-strips", "offbeat-comics", "office-humor", "relationship-comics", "sci-fi-fantasy-comics", "sports-comics", "vintage-comics", "webcomics", "kids"]] = None,
+    transport: Optional[Transport] = None
 ) -> List[str]:
     """
     Returns an alphabetical list of comic identifiers.
@@ -48,26 +55,19 @@ def search(
     :type last_updated_today: Optional[bool]
     :param categories: A list of categories to filter the comics.
     :type categories: List[Literal["comicos-en-espanol", "family-comics", "funny-animals", "gag-comics", "graphic-novels", "mental-health-comics", "newspaper-comic-strips", "offbeat-comics", "office-humor", "relationship-comics", "sci-fi-fantasy-comics", "sports-comics", "vintage-comics", "webcomics", "kids"]]
+    :param transport: The transport used to fetch the page. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
     """
-    url = f"{BASE_URL}comics/a-to-z"
-    if last_updated_today and categories:
-        url += f"?lastUpdated=today&category={','.join(categories)}"
-    elif last_updated_today:
-        url += "?lastUpdated=today"
-    elif categories:
-        url += f"?category={','.join(categories)}"
-
-    page = Request(requote_uri(url))
-    with urlopen(page) as result:
-        soup = BeautifulSoup(result.read(), "html.parser")
-
-    tags = soup.find_all("a", {"class": "ComicsAtoZ_comics__link__IyrQd"})
-    return [tag.attrs["href"].split("/")[-1] for tag in tags if tag.attrs.get("href")]
+    transport = transport or get_transport()
+    url = _listing_url(f"{BASE_URL}comics/a-to-z", last_updated_today, categories)
+    with _stage("search", url):
+        return transport.get(url, parser=parse_a_to_z).parsed
 
 def search_political(
     *,
     last_updated_today: Optional[bool] = None,
-    categories: List[Literal["left", "center", "right"]] = None
+    categories: List[Literal["left", "center", "right"]] = None,
+    transport: Optional[Transport] = None
 ) -> List[str]:
     """
     Returns an alphabetical list of political comic identifiers.
@@ -76,52 +76,141 @@ def search_political(
     :type last_updated_today: Optional[bool]
     :param categories: A list of political categories to filter the comics.
     :type categories: List[Literal["left", "center", "right"]]
+    :param transport: The transport used to fetch the page. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
     """
-    url = f"{BASE_URL}political-cartoons/political-a-to-z"
-    if last_updated_today and categories:
-        url += f"?lastUpdated=today&category={','.join(categories)}"
-    elif last_updated_today:
-        url += "?lastUpdated=today"
-    elif categories:
-        url += f"?category={','.join(categories)}"
-
-    page = Request(requote_uri(url))
-    with urlopen(page) as result:
-        soup = BeautifulSoup(result.read(), "html.parser")
+    transport = transport or get_transport()
+    url = _listing_url(f"{BASE_URL}political-cartoons/political-a-to-z", last_updated_today, categories)
+    with _stage("search_political", url):
+        return transport.get(url, parser=parse_a_to_z).parsed
 
-    tags = soup.find_all("a", {"class": "ComicsAtoZ_comics__link__IyrQd"})
-    return [tag.attrs["href"].split("/")[-1] for tag in tags if tag.attrs.get("href")]
-
-def get_popular_comics(*, political: Optional[bool] = False) -> List[str]:
+def get_popular_comics(*, political: Optional[bool] = False, transport: Optional[Transport] = None) -> List[str]:
     """
     Returns a list of popular comic identifiers.
 
     :param political: If True, returns popular political comics.
     :type political: Optional[bool]
+    :param transport: The transport used to fetch the page. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
     """
-    url = f"{BASE_URL}comics/popular"
-    if political:
-        url = f"{BASE_URL}political-cartoons/political-popular"
-
-    page = Request(requote_uri(url))
-    with urlopen(page) as result:
-        soup = BeautifulSoup(result.read(), "html.parser")
-
-    tags = soup.find_all("a", {"class": "BadgeByline_badgeByline__link__uZaRR"})
-    return [tag.attrs["href"].split("/")[-1] for tag in tags if tag.attrs.get("href")]
+    transport = transport or get_transport()
+    url = _popular_url(political)
+    with _stage("popular", url):
+        return transport.get(url, parser=parse_popular).parsed
 
-def stream_comics(identifier: str, *, start_date: Optional[datetime] = datetime(1993, 7, 12), end_date: Optional[datetime] = datetime.today()) -> Generator[Comic, None, None]:
+def stream_comics( # pylint: disable=too-many-arguments
+    identifier: str,
+    *,
+    start_date: Optional[datetime] = datetime(1993, 7, 12),
+    end_date: Optional[datetime] = datetime.today(),
+    transport: Optional[Transport] = None,
+    workers: Optional[int] = None,
+    prefetch: Optional[int] = None,
+    index: Optional[DateIndex] = None
+) -> Generator[Union[Comic, Exception], None, None]:
     """
     Streams comics for a given identifier from `start_date` to `end_date`.
 
+    Only dates with a strip are requested: each strip page links to the next strip, and the links are remembered in a :class:`DateIndex`. Dates without a strip are skipped. Where the index has no links yet, the stream probes one day at a time until it finds a strip.
+
+    .. note::
+
+        If `workers` is set, comics are built ahead of the consumer in a thread pool, but they are still yielded in date order. A date that fails to resolve then yields the exception it raised instead of a :class:`Comic`, and the stream carries on. Where the index has no links yet, the following days are requested speculatively, and those that turn out to have no strip are cancelled if they have not started. Once the stream is closed, the comics still being built make no further retries.
+
     :param identifier: The comic identifier.
     :type identifier: str
     :param start_date: The start date for the comic stream.
     :type start_date: Optional[datetime]
     :param end_date: The end date for the comic stream.
     :type end_date: Optional[datetime]
+    :param transport: The transport used by every comic. Defaults to the shared transport.
+    :type transport: Optional[:class:`Transport`]
+    :param workers: The number of threads building comics ahead of the consumer.
+    :type workers: Optional[int]
+    :param prefetch: The maximum number of comics built or buffered ahead of the consumer. Defaults to twice `workers`.
+    :type prefetch: Optional[int]
+    :param index: The index of publication dates to use and update. Defaults to the index installed with :func:`set_date_index`, or else a new in-memory index for this stream only. It is saved when the stream ends.
+    :type index: Optional[:class:`DateIndex`]
     """
-    current_date = start_date
-    while current_date <= end_date:
-        yield Comic(identifier, current_date)
-        current_date += timedelta(days=1)
+    index = index or _installed_date_index() or DateIndex()
+    start_date = start_date.date() if isinstance(start_date, datetime) else start_date
+    end_date = end_date.date() if isinstance(end_date, datetime) else end_date
+    current_date = index.first_date(identifier, start_date) or start_date
+
+    try:
+        if workers:
+            build = partial(Comic, identifier, transport=transport)
+            with closing(_prefetched_comics(identifier, current_date, end_date, index, build, workers=workers, window=max(prefetch or workers * 2, 1))) as results:
+                yield from (result for _, result in results if not isinstance(result, Exception) or not _is_missing(result))
+        else:
+            yield from _sequential_comics(identifier, current_date, end_date, transport, index)
+    finally:
+        index.save()
+
+def _sequential_comics(identifier: str, current_date: Optional[date], end_date: date, transport: Optional[Transport], index: DateIndex) -> Generator[Comic, None, None]:
+    while current_date is not None and current_date <= end_date:
+        try:
+            comic = Comic(identifier, current_date, transport=transport)
+        except ValueError as e:
+            if not _is_missing(e):
+                raise
+            current_date = index.next_date(identifier, current_date) or current_date + timedelta(days=1)
+            continue
+        index.record(identifier, comic.date, comic.previous_date, comic.next_date)
+        yield comic
+        current_date = _following_date(comic, end_date)
+
+def _prefetched_comics(identifier: str, current_date: Optional[date], end_date: date, index: DateIndex, build: Callable[[date], Comic], *, workers: int, window: int) -> Generator[Tuple[date, Union[Comic, Exception]], None, None]: # pylint: disable=too-many-arguments
+    # Yields each date tried with the comic `build` returned for it, or the exception it raised, including for dates without a strip.
+    pending = deque()
+    executor = ThreadPoolExecutor(workers)
+    stop = Event()
+    try:
+        while (current_date is not None and current_date <= end_date) or pending:
+            while current_date is not None and current_date <= end_date and len(pending) < window:
+                pending.append((current_date, executor.submit(_build_until, stop, build, current_date)))
+                current_date = index.next_date(identifier, current_date) or current_date + timedelta(days=1)
+            day, future = pending.popleft()
+            try:
+                result = future.result()
+            except Exception as e: # pylint: disable=broad-except
+                result = e
+            if isinstance(result, Comic):
+                index.record(identifier, result.date, result.previous_date, result.next_date)
+                following = _following_date(result, end_date)
+                # Dates before the next strip have no strip of their own.
+                while pending and (following is None or pending[0][0] < following):
+                    pending.popleft()[1].cancel()
+                if following is None or (current_date is not None and current_date < following):
+                    current_date = following
+            yield day, result
+    finally:
+        stop.set()
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+def _build_until(stop: Event, build: Callable[[date], Comic], day: date) -> Comic:
+    with _retry_stop(stop):
+        return build(day)
+
+def _following_date(comic: Comic, end_date: date) -> Optional[date]:
+    if comic.next_date is not None and comic.next_date > comic.date:
+        return comic.next_date
+    # A page without a sensible next link may still have later strips, so the next day is probed.
+    following = comic.date + timedelta(days=1)
+    return following if following <= end_date else None
+
+def _listing_url(url: str, last_updated_today: Optional[bool], categories: Optional[List[str]]) -> str:
+    if last_updated_today and categories:
+        url += f"?lastUpdated=today&category={','.join(categories)}"
+    elif last_updated_today:
+        url += "?lastUpdated=today"
+    elif categories:
+        url += f"?category={','.join(categories)}"
+    return requote_uri(url)
+
+def _popular_url(political: Optional[bool]) -> str:
+    if political:
+        return requote_uri(f"{BASE_URL}political-cartoons/political-popular")
+    return requote_uri(f"{BASE_URL}comics/popular")
@@ -26,5 +26,6 @@ setup(
     python_requires='>= 3.8.0',
     packages = ["gocomics"],
     include_package_data = True,
-    install_requires = ["beautifulsoup4", "requests"]
+    install_requires = ["beautifulsoup4"],
+    extras_require = {"parquet": ["pyarrow"]}
 )
@@ -0,0 +1,151 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+# pylint: skip-file
+
+import gzip
+import random
+import threading
+import time
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PAGES = Path(__file__).resolve().parent / "pages"
+
+
+def page(name):
+    return (PAGES / name).read_bytes()
+
+
+def strip(previous=None, next=None):
+    """
+    Returns the strip page with its navigation linking to the given dates, if any.
+    """
+    html = page("strip.html")
+    html = html.replace(b'href="/garfield/2019/12/31"', f'href="/garfield/{previous:%Y/%m/%d}"'.encode() if previous else b"")
+    return html.replace(b'href="/garfield/2020/01/02"', f'href="/garfield/{next:%Y/%m/%d}"'.encode() if next else b"")
+
+
+class StubServer:
+    """
+    A local HTTP server that serves canned responses, used instead of the live site in tests.
+
+    Routes map a path (including the query string) to a ``(status, headers, body)`` tuple. Responses queued for a path are served once each, before its route.
+
+    Every response can be delayed by `latency` seconds, and a `error_rate` fraction of them replaced by 503 errors, drawn from a generator seeded with `seed`.
+    """
+
+    def __init__(self, routes=None, latency=0.0, error_rate=0.0, seed=0):
+        self.routes = dict(routes or {})
+        self.queued = {}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.errors = 0
+        self.hits = Counter()
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Buffer each response and send it in one write, so that small bodies are not delayed by Nagle's algorithm.
+            wbufsize = -1
+
+            def do_GET(self):
+                self.respond()
+
+            def do_HEAD(self):
+                self.respond(head=True)
+
+            def respond(self, head=False):
+                server.hits[self.path] += 1
+                server.requests.append((self.path, dict(self.headers)))
+                if server.latency:
+                    time.sleep(server.latency)
+                with server.lock:
+                    failed = server.error_rate and server.random.random() < server.error_rate
+                    server.errors += bool(failed)
+                queued = server.queued.get(self.path)
+                if failed:
+                    status, headers, body = 503, {"Retry-After": "0"}, b"Service Unavailable"
+                elif queued:
+                    status, headers, body = queued.pop(0)
+                else:
+                    status, headers, body = server.routes.get(self.path, (404, {}, b"Not Found"))
+                headers = dict(headers)
+                if headers.get("ETag") and self.headers.get("If-None-Match") == headers["ETag"]:
+                    status, body = 304, b""
+                requested = self.headers.get("Range", "")
+                if status == 200 and headers.get("Accept-Ranges") == "bytes" and requested.startswith("bytes=") and self.headers.get("If-Range", headers.get("ETag")) == headers.get("ETag"):
+                    start = int(requested[6:].split("-")[0])
+                    if start >= len(body):
+                        status, body = 416, b""
+                    else:
+                        headers["Content-Range"] = f"bytes {start}-{len(body) - 1}/{len(body)}"
+                        status, body = 206, body[start:]
+                if "gzip" in self.headers.get("Accept-Encoding", "") and body:
+                    body = gzip.compress(body)
+                    headers["Content-Encoding"] = "gzip"
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if not head:
+                    self.wfile.write(body)
+                self.wfile.flush()
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def add(self, path, body, status=200, headers=None):
+        self.routes[path] = (status, headers or {"Content-Type": "text/html; charset=utf-8"}, body)
+
+    def archive(self, identifier, days):
+        """
+        Serves linked strip pages of `identifier` for each of `days`, in order.
+        """
+        for previous, day, following in zip([None] + days, days, days[1:] + [None]):
+            html = strip(previous, following).replace(b"/garfield/", f"/{identifier}/".encode())
+            self.add(f"/{identifier}/{day:%Y/%m/%d}", html)
+
+    def queue(self, path, body, status=200, headers=None):
+        self.queued.setdefault(path, []).append((status, headers or {}, body))
@@ -0,0 +1,174 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+# pylint: skip-file
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from datetime import date
+from unittest import mock
+from urllib.error import HTTPError
+
+from gocomics import AsyncComic, AsyncTransport, Comic, DateIndex, RateLimiter
+from gocomics import aio
+from gocomics.about import ABOUT_CACHE
+from tests.server import StubServer, page, strip
+
+class TestAsync(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.server.add("/garfield", page("strip.html"))
+        self.server.add("/garfield/about", page("about.html"))
+        self.server.add("/comics/a-to-z?category=webcomics", page("a-to-z.html"))
+        self.server.add("/comics/popular", page("popular.html"))
+        for day in range(1, 6):
+            self.server.add(f"/garfield/2020/01/0{day}", strip(date(2020, 1, day - 1) if day > 1 else None, date(2020, 1, day + 1) if day < 5 else None))
+        for module in ("gocomics.comic", "gocomics.utils", "gocomics.aio"):
+            patcher = mock.patch(f"{module}.BASE_URL", self.server.base_url)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        ABOUT_CACHE.clear()
+        self.addCleanup(ABOUT_CACHE.clear)
+
+    def tearDown(self):
+        self.server.__exit__()
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_async_comic(self):
+        async def main():
+            async with AsyncTransport(timeout=5) as transport:
+                comic = await AsyncComic("garfield", transport=transport)
+                about = await comic.fetch_about()
+                return comic, about
+        comic, about = self.run_async(main())
+        self.assertIsInstance(comic, Comic)
+        self.assertEqual(comic.name, "Garfield")
+        self.assertEqual(comic.author, "Jim Davis")
+        self.assertEqual(comic.fetch_count, 1)
+        self.assertEqual(comic.image_url, "https://featureassets.gocomics.com/assets/abc123def456")
+        self.assertEqual([character.name for character in comic.characters], ["Odie", "Jon"])
+        self.assertEqual(self.server.hits["/garfield/about"], 1)
+
+    def test_async_coalescing(self):
+        async def build(transport):
+            return await AsyncComic("garfield", transport=transport)
+        async def main():
+            async with AsyncTransport(timeout=5) as transport:
+                comics = await asyncio.gather(*(build(transport) for _ in range(4)))
+                return comics, transport.stats
+        comics, stats = self.run_async(main())
+        self.assertEqual(self.server.hits["/garfield"], 1)
+        self.assertEqual(stats, {"flights": 1, "coalesced": 3})
+        self.assertEqual(sorted(comic.fetch_count for comic in comics), [0, 0, 0, 1])
+        comics[0].keywords.append("lasagna")
+        self.assertTrue(all("lasagna" not in comic.keywords for comic in comics[1:]))
+
+    def test_async_coalesced_errors(self):
+        async def main():
+            async with AsyncTransport(timeout=5) as transport:
+                return await asyncio.gather(*(transport.get(self.server.base_url + "missing") for _ in range(3)), return_exceptions=True)
+        errors = self.run_async(main())
+        self.assertEqual(self.server.hits["/missing"], 1)
+        self.assertTrue(all(isinstance(error, HTTPError) and error.code == 404 for error in errors))
+        self.assertEqual(len({id(error) for error in errors}), 3)
+        self.assertEqual([error.__cause__ is errors[0] for error in errors], [False, True, True])
+
+    def test_async_comic_missing(self):
+        async def main():
+            async with AsyncTransport(timeout=5) as transport:
+                await AsyncComic("notacomic", transport=transport)
+        with self.assertRaises(ValueError):
+            self.run_async(main())
+
+    def test_async_listings(self):
+        async def main():
+            async with AsyncTransport(timeout=5) as transport:
+                return (
+                    await aio.search(categories=["webcomics"], transport=transport),
+                    await aio.get_popular_comics(transport=transport),
+                )
+        identifiers, popular = self.run_async(main())
+        self.assertEqual(identifiers, ["9to5", "calvinandhobbes", "garfield"])
+        self.assertEqual(popular, ["garfield", "peanuts", "calvinandhobbes"])
+
+    def test_async_stream_comics(self):
+        async def main():
+            async with AsyncTransport(timeout=5, concurrency=2, per_host=2) as transport:
+                return [comic.date async for comic in aio.stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 5), concurrency=3, transport=transport)]
+        dates = self.run_async(main())
+        self.assertEqual(dates, [date(2020, 1, day) for day in range(1, 6)])
+
+    def test_async_stream_comics_errors(self):
+        self.server.add("/garfield/2020/01/03", b"", status=500)
+        async def main():
+            async with AsyncTransport(timeout=5, limiter=RateLimiter(rate=None, max_retries=0)) as transport:
+                return [item async for item in aio.stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 5), transport=transport, index=DateIndex())]
+        items = self.run_async(main())
+        self.assertEqual([item.date for item in items if isinstance(item, Comic)], [date(2020, 1, 1), date(2020, 1, 2), date(2020, 1, 4), date(2020, 1, 5)])
+        self.assertIsInstance(items[2], ValueError)
+        self.assertEqual(items[2].__cause__.code, 500)
+
+    def test_async_refresh(self):
+        self.server.add("/garfield", page("strip.html"), headers={"ETag": '"v1"'})
+        async def main():
+            async with AsyncTransport(timeout=5) as transport:
+                comic = await AsyncComic("garfield", transport=transport)
+                unchanged = await comic.refresh()
+                self.server.add("/garfield", page("strip.html").replace(b"abc123def456", b"fedcba654321"), headers={"ETag": '"v2"'})
+                return comic, unchanged, await comic.refresh()
+        comic, unchanged, changed = self.run_async(main())
+        self.assertEqual((unchanged, changed), ([], ["image_url"]))
+        self.assertEqual(comic.image_url, "https://featureassets.gocomics.com/assets/fedcba654321")
+        self.assertEqual(self.server.requests[-1][1].get("If-None-Match"), '"v1"')
+
+    def test_async_image(self):
+        image = bytes(range(256)) * 100
+        self.server.add("/assets/abc123", image, headers={"Content-Type": "image/gif"})
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        async def main():
+            async with AsyncTransport(timeout=5) as transport:
+                comic = await AsyncComic("garfield", transport=transport)
+                comic.image_url = self.server.base_url + "assets/abc123"
+                return comic, await comic.read_image(), await comic.download(path=directory.name)
+        comic, buffer, path = self.run_async(main())
+        self.assertEqual(buffer, image)
+        self.assertEqual(path, os.path.join(directory.name, "garfield.gif"))
+        with self.assertRaises(TypeError):
+            comic.iter_image()
+
+    def test_async_stream_comics_invalid_range(self):
+        async def main():
+            return [comic async for comic in aio.stream_comics("garfield", start_date=date(2020, 1, 5), end_date=date(2020, 1, 1))]
+        self.assertEqual(self.run_async(main()), [])
+
+if __name__ == "__main__":
+    unittest.main()
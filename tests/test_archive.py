@@ -0,0 +1,312 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+
+# pylint: skip-file
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from datetime import date, timedelta
+from hashlib import sha256
+from unittest import mock
+
+from gocomics import ABOUT_CACHE, Comic, DateIndex, HTTPCache, MetricsCollector, RateLimiter, Transport, fetch_comics, fetch_latest, mirror, observe, read_manifest, read_sync_state, set_date_index, sync
+from gocomics.parsers import parse_strip
+from tests.server import StubServer, page, strip
+
+class TestMirror(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        strip = page("strip.html").replace(b"https://featureassets.gocomics.com/", self.server.base_url.encode())
+        self.images = {}
+        for day in (1, 2, 4):
+            self.images[day] = f"image {day}".encode() * 100
+            self.server.add(f"/garfield/2020/01/0{day}", strip.replace(b"abc123def456", f"image{day}".encode()))
+            self.server.add(f"/assets/image{day}", self.images[day], headers={"Content-Type": "image/jpeg"})
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, base_delay=0.01, max_retries=1))
+        patcher = mock.patch("gocomics.comic.BASE_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.__exit__()
+
+    def mirror(self, **kwargs):
+        return mirror("garfield", date(2020, 1, 1), date(2020, 1, 4), self.directory.name, workers=3, transport=self.transport, **kwargs)
+
+    def test_mirror(self):
+        self.assertEqual(self.mirror(), {"complete": 3, "missing": 1})
+        entries = read_manifest(os.path.join(self.directory.name, "manifest.jsonl"))
+        self.assertEqual(list(entries), ["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04"])
+        self.assertEqual(entries["2020-01-03"]["status"], "missing")
+        entry = entries["2020-01-02"]
+        self.assertEqual(entry["file"], "2020-01-02.jpg")
+        self.assertEqual(entry["size"], len(self.images[2]))
+        self.assertEqual(entry["sha256"], sha256(self.images[2]).hexdigest())
+        self.assertTrue(entry["url"].endswith("/assets/image2"))
+        with open(os.path.join(self.directory.name, "2020-01-02.jpg"), "rb") as file:
+            self.assertEqual(file.read(), self.images[2])
+
+    def test_rerun_skips_done_dates(self):
+        self.server.add("/assets/image4", b"", status=500)
+        self.assertEqual(self.mirror(), {"complete": 2, "missing": 1, "failed": 1})
+        self.server.add("/assets/image4", self.images[4], headers={"Content-Type": "image/jpeg"})
+        os.remove(os.path.join(self.directory.name, "2020-01-01.jpg"))
+        hits = self.server.hits.copy()
+        self.assertEqual(self.mirror(), {"skipped": 2, "complete": 2})
+        self.assertEqual(self.server.hits["/garfield/2020/01/02"], hits["/garfield/2020/01/02"])
+        self.assertEqual(self.server.hits["/garfield/2020/01/03"], hits["/garfield/2020/01/03"])
+        self.assertEqual(read_manifest(os.path.join(self.directory.name, "manifest.jsonl"))["2020-01-04"]["status"], "complete")
+
+    def test_recent_missing_dates_are_retried(self):
+        today = date.today()
+        self.assertEqual(mirror("garfield", today, today, self.directory.name, transport=self.transport), {"missing": 1})
+        self.server.add(f"/garfield/{today:%Y/%m/%d}", self.server.routes["/garfield/2020/01/01"][2])
+        self.assertEqual(mirror("garfield", today, today, self.directory.name, transport=self.transport), {"complete": 1})
+        self.assertEqual(self.mirror(), {"complete": 3, "missing": 1})
+        self.assertEqual(self.mirror(), {"skipped": 4})
+
+    def test_dates_between_strips_are_not_requested(self):
+        image = page("strip.html").replace(b"https://featureassets.gocomics.com/", self.server.base_url.encode()).replace(b"abc123def456", b"image1")
+        self.server.add("/garfield/2020/01/01", image.replace(b'href="/garfield/2020/01/02"', b'href="/garfield/2020/01/08"'))
+        self.server.add("/garfield/2020/01/08", image.replace(b'href="/garfield/2019/12/31"', b'href="/garfield/2020/01/01"').replace(b'href="/garfield/2020/01/02"', b""))
+        self.assertEqual(mirror("garfield", date(2020, 1, 1), date(2020, 1, 10), self.directory.name, workers=1, transport=self.transport), {"complete": 2, "missing": 8})
+        self.assertTrue(all(self.server.hits[f"/garfield/2020/01/0{day}"] == 0 for day in range(3, 8)))
+        entries = read_manifest(os.path.join(self.directory.name, "manifest.jsonl"))
+        self.assertEqual([day for day, entry in entries.items() if entry["status"] == "complete"], ["2020-01-01", "2020-01-08"])
+        self.assertEqual(len(entries), 10)
+        hits = sum(self.server.hits.values())
+        self.assertEqual(mirror("garfield", date(2020, 1, 1), date(2020, 1, 10), self.directory.name, transport=self.transport), {"skipped": 10})
+        self.assertEqual(sum(self.server.hits.values()), hits)
+
+    def test_page_without_image_fails(self):
+        self.server.add("/garfield/2020/01/03", page("strip.html").replace(b"https://featureassets.gocomics.com/assets/abc123def456", b""))
+        self.assertEqual(self.mirror(), {"complete": 3, "failed": 1})
+        self.assertEqual(read_manifest(os.path.join(self.directory.name, "manifest.jsonl"))["2020-01-03"]["error"], "The strip page has no image URL.")
+
+    def test_read_manifest_ignores_torn_lines(self):
+        path = os.path.join(self.directory.name, "manifest.jsonl")
+        with open(path, "w") as file:
+            file.write(json.dumps({"date": "2020-01-01", "status": "failed"}) + "\n")
+            file.write(json.dumps({"date": "2020-01-01", "status": "missing"}) + "\n")
+            file.write('{"date": "2020-01-0')
+        self.assertEqual(read_manifest(path), {"2020-01-01": {"date": "2020-01-01", "status": "missing"}})
+        self.assertEqual(read_manifest(os.path.join(self.directory.name, "missing.jsonl")), {})
+
+class TestSync(unittest.TestCase):
+    def setUp(self):
+        self.today = date.today()
+        self.days = [self.today - timedelta(days=offset) for offset in (3, 2, 1, 0)]
+        self.server = StubServer().__enter__()
+        for previous, day, following in zip([None] + self.days, self.days, self.days[1:] + [None]):
+            self.server.add(f"/garfield/{day:%Y/%m/%d}", strip(previous, following))
+        self.server.add(f"/peanuts/{self.days[0]:%Y/%m/%d}", strip())
+        self.server.add("/comics/a-to-z?lastUpdated=today", page("a-to-z.html"))
+        self.server.add("/political-cartoons/political-a-to-z?lastUpdated=today", b"<html></html>")
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, max_retries=0))
+        set_date_index(DateIndex())
+        self.addCleanup(set_date_index, None)
+        for module in ("gocomics.comic", "gocomics.utils"):
+            patcher = mock.patch(f"{module}.BASE_URL", self.server.base_url)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.state_path = os.path.join(self.directory.name, "state.json")
+        yesterday = self.days[2].isoformat()
+        with open(self.state_path, "w") as file:
+            json.dump({"garfield": {"mark": self.days[0].isoformat(), "checked": self.days[0].isoformat()}, "peanuts": {"mark": self.days[0].isoformat(), "checked": yesterday}}, file)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.__exit__()
+
+    def sync(self):
+        return list(sync(["garfield", "peanuts", "calvinandhobbes"], self.state_path, transport=self.transport))
+
+    def test_sync(self):
+        results = self.sync()
+        self.assertEqual([(comic.identifier, comic.date) for comic in results], [("garfield", day) for day in self.days[1:]])
+        self.assertFalse(any(path.startswith("/peanuts") for path in self.server.hits))
+        self.assertEqual(self.server.hits[f"/calvinandhobbes/{self.today:%Y/%m/%d}"], 1)
+        state = read_sync_state(self.state_path)
+        self.assertEqual(state["garfield"], {"mark": self.today.isoformat(), "checked": self.today.isoformat()})
+        self.assertEqual(state["calvinandhobbes"], {"mark": None, "checked": self.days[2].isoformat()})
+        self.assertEqual(state["peanuts"]["checked"], self.days[2].isoformat())
+
+        self.server.hits.clear()
+        self.assertEqual(self.sync(), [])
+        self.assertEqual(set(self.server.hits), {"/comics/a-to-z?lastUpdated=today", "/political-cartoons/political-a-to-z?lastUpdated=today", f"/calvinandhobbes/{self.today:%Y/%m/%d}"})
+
+    def test_strip_published_after_sync(self):
+        self.server.add(f"/garfield/{self.today:%Y/%m/%d}", b"", status=404)
+        self.assertEqual([comic.date for comic in self.sync()], self.days[1:3])
+        self.assertEqual(read_sync_state(self.state_path)["garfield"], {"mark": self.days[2].isoformat(), "checked": self.days[2].isoformat()})
+
+        self.server.add(f"/garfield/{self.today:%Y/%m/%d}", strip(self.days[2], None))
+        self.assertEqual([(comic.identifier, comic.date) for comic in self.sync()], [("garfield", self.today)])
+        self.assertEqual(read_sync_state(self.state_path)["garfield"], {"mark": self.today.isoformat(), "checked": self.today.isoformat()})
+
+    def test_failure_keeps_progress(self):
+        self.server.add(f"/garfield/{self.days[2]:%Y/%m/%d}", b"", status=500)
+        results = self.sync()
+        self.assertEqual(results[0].date, self.days[1])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(read_sync_state(self.state_path)["garfield"], {"mark": self.days[1].isoformat(), "checked": self.days[1].isoformat()})
+
+    def test_without_update_check(self):
+        results = list(sync(["peanuts"], self.state_path, transport=self.transport, check_updates=False))
+        self.assertEqual(results, [])
+        self.assertEqual(self.server.hits[f"/peanuts/{self.today:%Y/%m/%d}"], 1)
+        self.assertNotIn("/comics/a-to-z?lastUpdated=today", self.server.hits)
+
+class TestFetchLatest(unittest.TestCase):
+    def start(self, latency=0.0, **kwargs):
+        self.server = StubServer(latency=latency).__enter__()
+        self.addCleanup(self.server.__exit__)
+        for identifier in ("garfield", "peanuts", "calvinandhobbes"):
+            self.server.add(f"/{identifier}", page("strip.html"))
+        self.server.add("/busy", b"", status=503, headers={"Retry-After": "5"})
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, base_delay=0.01), **kwargs)
+        self.addCleanup(self.transport.close)
+        patcher = mock.patch("gocomics.comic.BASE_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_results_and_failures(self):
+        self.start()
+        comics, failures = fetch_latest(["garfield", "missing", "peanuts", "garfield"], workers=4, transport=self.transport)
+        self.assertEqual(list(comics), ["garfield", "peanuts"])
+        self.assertIsInstance(comics["peanuts"], Comic)
+        self.assertEqual(list(failures), ["missing"])
+        self.assertIsInstance(failures["missing"], ValueError)
+        self.assertEqual(self.server.hits["/garfield"], 1)
+
+    def test_deadline_returns_partial_results(self):
+        self.start(latency=0.3)
+        started = time.monotonic()
+        comics, failures = fetch_latest(["garfield", "peanuts", "calvinandhobbes"], workers=1, deadline=0.45, transport=self.transport)
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertEqual(list(comics), ["garfield"])
+        self.assertEqual(list(failures), ["peanuts", "calvinandhobbes"])
+        self.assertTrue(all(isinstance(error, TimeoutError) for error in failures.values()))
+
+    def test_deadline_denies_late_retries(self):
+        self.start()
+        started = time.monotonic()
+        comics, failures = fetch_latest(["busy"], deadline=2, transport=self.transport)
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(self.server.hits["/busy"], 1)
+        self.assertNotIsInstance(failures["busy"], TimeoutError)
+
+    def test_per_host_limit(self):
+        self.start(latency=0.1, per_host=1)
+        started = time.monotonic()
+        comics, failures = fetch_latest(["garfield", "peanuts", "calvinandhobbes"], workers=3, transport=self.transport)
+        self.assertGreaterEqual(time.monotonic() - started, 0.3)
+        self.assertEqual(len(comics), 3)
+
+class TestFetchComics(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        for day in (1, 2, 4):
+            self.server.add(f"/garfield/2020/01/0{day}", page("strip.html"))
+        self.server.add("/peanuts", page("strip.html"))
+        self.server.add("/garfield/about", page("about.html"))
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, base_delay=0.01, max_retries=1))
+        self.addCleanup(self.transport.close)
+        for module in ("about", "comic"):
+            patcher = mock.patch(f"gocomics.{module}.BASE_URL", self.server.base_url)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        ABOUT_CACHE.clear()
+        self.addCleanup(ABOUT_CACHE.clear)
+        set_date_index(DateIndex())
+        self.addCleanup(set_date_index, None)
+
+    def strips(self):
+        return [("garfield", date(2020, 1, day)) for day in range(1, 5)] + ["peanuts"]
+
+    def test_process_pool(self):
+        results = list(fetch_comics(self.strips(), fetch_workers=4, parse_workers=2, transport=self.transport))
+        self.assertEqual(len(results), 5)
+        self.assertIsInstance(results[2], ValueError)
+        comics = [results[0], results[1], results[3], results[4]]
+        self.assertEqual([comic.date for comic in comics], [date(2020, 1, 1), date(2020, 1, 2), date(2020, 1, 4), None])
+        fields = parse_strip(page("strip.html"))
+        for comic in comics:
+            self.assertIsInstance(comic, Comic)
+            self.assertEqual((comic.title, comic.image_url, comic.fetch_count), (fields["title"], fields["image_url"], 1))
+        self.assertEqual(comics[0], Comic("garfield", date(2020, 1, 1), transport=self.transport))
+
+    def test_inline_parse_with_about(self):
+        results = list(fetch_comics(self.strips(), parse_workers=0, about=True, transport=self.transport))
+        self.assertEqual(sum(isinstance(result, Comic) for result in results), 4)
+        self.assertEqual(self.server.hits["/garfield/about"], 1)
+        self.assertIn(("garfield", self.transport), ABOUT_CACHE)
+        self.assertNotIn(("peanuts", self.transport), ABOUT_CACHE)
+        results[0].characters
+        self.assertEqual(self.server.hits["/garfield/about"], 1)
+
+    def test_parsed_fields_are_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.transport.cache = HTTPCache(f"{directory}/cache.sqlite3")
+            strips = self.strips()[:2]
+            list(fetch_comics(strips, parse_workers=1, transport=self.transport))
+            with observe(MetricsCollector()) as metrics:
+                comics = list(fetch_comics(strips, parse_workers=1, transport=self.transport))
+            self.transport.cache.close()
+        self.assertEqual(metrics.count("parse"), 0)
+        self.assertEqual(metrics.count("cache_hit", cache="parsed"), 2)
+        self.assertEqual([comic.fetch_count for comic in comics], [0, 0])
+
+    def test_image_retry_runs_in_a_fetch_thread(self):
+        threads = []
+        with mock.patch("gocomics.comic.sleep", lambda delay: threads.append(threading.current_thread())):
+            for parse_workers in (0, 1):
+                self.server.queue("/peanuts", page("strip.html").replace(b'id="S:4"', b'id="S:5"'))
+                comic, = fetch_comics(["peanuts"], parse_workers=parse_workers, transport=self.transport)
+                self.assertEqual(comic.image_url, "https://featureassets.gocomics.com/assets/abc123def456")
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_close_stops_the_pipeline(self):
+        stream = fetch_comics(self.strips() * 10, fetch_workers=1, parse_workers=0, prefetch=2, transport=self.transport)
+        next(stream)
+        stream.close()
+        self.assertLessEqual(sum(self.server.hits.values()), 4)
+
+if __name__ == "__main__":
+    unittest.main()
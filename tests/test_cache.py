@@ -0,0 +1,78 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+# pylint: skip-file
+
+import unittest
+
+from unittest import mock
+from gocomics import TTLCache
+
+class TestTTLCache(unittest.TestCase):
+    def test_get_and_set(self):
+        cache = TTLCache(4)
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("b", 2), 2)
+        self.assertIn("a", cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_lru_eviction(self):
+        cache = TTLCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+
+    def test_ttl_expiry(self):
+        with mock.patch("gocomics.cache.monotonic", return_value=100.0) as clock:
+            cache = TTLCache(2, ttl=10)
+            cache.set("a", 1)
+            clock.return_value = 105.0
+            self.assertEqual(cache.get("a"), 1)
+            clock.return_value = 111.0
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(len(cache), 0)
+
+    def test_pop_and_clear(self):
+        cache = TTLCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.pop("a"), 1)
+        self.assertIsNone(cache.pop("a"))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            TTLCache(0)
+
+if __name__ == "__main__":
+    unittest.main()
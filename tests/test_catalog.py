@@ -0,0 +1,132 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+
+# pylint: skip-file
+
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+from gocomics import COMIC_CATEGORIES, POLITICAL_CATEGORIES, Catalog, CatalogEntry, RateLimiter, Transport
+from tests.server import StubServer
+
+COMICS = {"9to5": "9 to 5", "calvinandhobbes": "Calvin and Hobbes", "garfield": "Garfield", "peanuts": "Peanuts"}
+POLITICAL = {"lisabenson": "Lisa Benson", "tomtoles": "Tom Toles"}
+
+
+def listing(identifiers, names, link_class="ComicsAtoZ_comics__link__IyrQd"):
+    links = "".join(f'<a class="{link_class}" href="/{identifier}">{names.get(identifier, identifier)}</a>\n' for identifier in identifiers)
+    return f"<!DOCTYPE html><html><body>{links}</body></html>".encode()
+
+class TestCatalog(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.serve(COMICS, POLITICAL)
+        for category in COMIC_CATEGORIES:
+            self.server.add(f"/comics/a-to-z?category={category}", listing([], {}))
+        for category in POLITICAL_CATEGORIES:
+            self.server.add(f"/political-cartoons/political-a-to-z?category={category}", listing([], {}))
+        self.server.add("/comics/a-to-z?category=funny-animals", listing(["garfield", "peanuts"], COMICS))
+        self.server.add("/comics/a-to-z?category=newspaper-comic-strips", listing(["calvinandhobbes", "garfield", "peanuts"], COMICS))
+        self.server.add("/political-cartoons/political-a-to-z?category=left", listing(["tomtoles"], POLITICAL))
+        self.server.add("/comics/popular", listing(["garfield", "calvinandhobbes"], COMICS, "BadgeByline_badgeByline__link__uZaRR"))
+        self.server.add("/political-cartoons/political-popular", listing(["tomtoles"], POLITICAL, "BadgeByline_badgeByline__link__uZaRR"))
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, max_retries=0))
+        for module in ("gocomics.catalog", "gocomics.utils"):
+            patcher = mock.patch(f"{module}.BASE_URL", self.server.base_url)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "catalog.json")
+        self.catalog = Catalog(self.path)
+        self.catalog.build(transport=self.transport)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.__exit__()
+
+    def serve(self, comics, political):
+        self.server.add("/comics/a-to-z", listing(sorted(comics), comics))
+        self.server.add("/political-cartoons/political-a-to-z", listing(sorted(political), political))
+
+    def identifiers(self, entries):
+        return [entry.identifier for entry in entries]
+
+    def test_build(self):
+        self.assertEqual(len(self.catalog), 6)
+        self.assertEqual(self.catalog.get("garfield"), CatalogEntry("garfield", "Garfield", ["newspaper-comic-strips", "funny-animals"], False, 1))
+        self.assertEqual(self.catalog.get("tomtoles"), CatalogEntry("tomtoles", "Tom Toles", ["left"], True, 1))
+        self.assertIsNone(self.catalog.get("lisabenson").rank)
+        self.assertEqual(len(self.server.hits), 4 + len(COMIC_CATEGORIES) + len(POLITICAL_CATEGORIES))
+        self.assertIsNotNone(self.catalog.updated)
+
+    def test_queries(self):
+        self.assertEqual(self.identifiers(self.catalog.category("funny-animals")), ["garfield", "peanuts"])
+        self.assertEqual(self.catalog.category("kids"), [])
+        self.assertEqual(self.identifiers(self.catalog.political()), ["lisabenson", "tomtoles"])
+        self.assertEqual(self.identifiers(self.catalog.popular()), ["garfield", "tomtoles", "calvinandhobbes"])
+        self.assertEqual(self.identifiers(self.catalog.popular(political=False, limit=1)), ["garfield"])
+        self.assertEqual(self.identifiers(self.catalog.prefix("Ca")), ["calvinandhobbes"])
+        self.assertEqual(self.identifiers(self.catalog.prefix("hob")), ["calvinandhobbes"])
+        self.assertEqual(self.identifiers(self.catalog.prefix("9 t")), ["9to5"])
+        self.assertEqual(self.catalog.prefix(" "), [])
+        self.assertEqual(self.identifiers(self.catalog.fuzzy("calvin hobbs")), ["calvinandhobbes"])
+        self.assertEqual(self.identifiers(self.catalog.fuzzy("garfeild", limit=1)), ["garfield"])
+        self.assertEqual(self.catalog.fuzzy("zzz"), [])
+
+    def test_persistence(self):
+        catalog = Catalog(self.path)
+        self.assertEqual(list(catalog), list(self.catalog))
+        self.assertEqual(catalog.updated, self.catalog.updated)
+        self.assertEqual(self.identifiers(catalog.fuzzy("peanut")), ["peanuts"])
+
+    def test_refresh(self):
+        self.server.hits.clear()
+        self.assertEqual(self.catalog.refresh(transport=self.transport), ([], []))
+        self.assertEqual(len(self.server.hits), 4)
+        self.assertEqual(self.catalog.get("garfield").categories, ("funny-animals", "newspaper-comic-strips"))
+
+        self.server.hits.clear()
+        self.serve({**COMICS, "pearlsbeforeswine": "Pearls Before Swine"}, {"tomtoles": "Tom Toles"})
+        self.server.add("/comics/a-to-z?category=funny-animals", listing(["garfield", "pearlsbeforeswine", "peanuts"], COMICS))
+        self.assertEqual(self.catalog.refresh(transport=self.transport), (["pearlsbeforeswine"], ["lisabenson"]))
+        self.assertEqual(len(self.server.hits), 4 + len(COMIC_CATEGORIES) + len(POLITICAL_CATEGORIES))
+        self.assertEqual(self.catalog.get("pearlsbeforeswine").categories, ("funny-animals",))
+        self.assertNotIn("lisabenson", self.catalog)
+        self.assertIn("pearlsbeforeswine", Catalog(self.path))
+
+    def test_in_memory(self):
+        catalog = Catalog()
+        self.assertIsNone(catalog.path)
+        self.assertEqual(catalog.refresh(transport=self.transport), (sorted([*COMICS, *POLITICAL]), []))
+        self.assertEqual(len(catalog), 6)
+
+if __name__ == "__main__":
+    unittest.main()
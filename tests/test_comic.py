@@ -25,10 +25,16 @@ SOFTWARE.
 
 # pylint: skip-file
 
+import io
+import os
+import tempfile
 import unittest
 
 from datetime import datetime, timedelta
-from gocomics import Comic
+from hashlib import sha256
+from unittest import mock
+from gocomics import ABOUT_CACHE, STRIP_FIELDS, Comic, RateLimiter, Transport
+from tests.server import StubServer, page
 
 class TestComic(unittest.TestCase):
     def setUp(self):
@@ -132,5 +138,259 @@ class TestComic(unittest.TestCase):
         self.assertIsInstance(comic.header_feature_url, (str, type(None)))
         self.assertIsInstance(comic.image_url, (str, type(None)))
 
+class TestComicFetchCount(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.server.add("/garfield/2020/01/01", page("strip.html"))
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, base_delay=0.01))
+        self.addCleanup(self.transport.close)
+        patcher = mock.patch("gocomics.comic.BASE_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_page_is_fetched_once(self):
+        comic = Comic("garfield", datetime(2020, 1, 1), transport=self.transport)
+        self.assertEqual((len(self.server.requests), comic.fetch_count), (1, 1))
+        for name in (*STRIP_FIELDS, "previous_date", "next_date", "url"):
+            getattr(comic, name)
+        comic.to_record()
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.server.hits["/garfield/2020/01/01"], 1)
+
+class TestComicFields(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.server.add("/garfield", page("strip.html"))
+        self.server.add("/blank", page("strip.html").replace(b"ld+json", b"text/plain"))
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, base_delay=0.01, max_retries=2))
+        self.addCleanup(self.transport.close)
+        patcher = mock.patch("gocomics.comic.BASE_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_image_only(self):
+        comic = Comic("garfield", transport=self.transport, fields={"image_url"})
+        self.assertEqual(comic.image_url, "https://featureassets.gocomics.com/assets/abc123def456")
+        self.assertNotIn("title", vars(comic))
+        self.assertEqual(self.server.hits["/garfield"], 1)
+
+    def test_other_fields_are_resolved_on_access(self):
+        comic = Comic("garfield", transport=self.transport, fields={"image_url"})
+        self.assertEqual(comic.author, "Jim Davis")
+        self.assertEqual(comic.to_record(), Comic("garfield", transport=self.transport).to_record())
+        self.assertEqual(self.server.hits["/garfield"], 3)
+        self.assertEqual(comic.fetch_count, 2)
+        with self.assertRaises(AttributeError):
+            comic.colour
+
+    def test_image_is_not_retried_unless_requested(self):
+        comic = Comic("blank", transport=self.transport, fields={"title", "author"})
+        self.assertEqual(comic.author, "Jim Davis")
+        self.assertEqual(self.server.hits["/blank"], 1)
+        self.assertIsNone(comic.image_url)
+        self.assertEqual(self.server.hits["/blank"], 4)
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            Comic("garfield", transport=self.transport, fields={"colour"})
+        self.assertEqual(self.server.hits["/garfield"], 0)
+
+class TestComicRefresh(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.server.add("/garfield", page("strip.html"), headers={"ETag": '"v1"'})
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, base_delay=0.01))
+        self.addCleanup(self.transport.close)
+        patcher = mock.patch("gocomics.comic.BASE_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def update(self, etag='"v2"'):
+        html = page("strip.html").replace(b"abc123def456", b"fedcba654321").replace(b"2020/01/02", b"2020/01/03")
+        self.server.add("/garfield", html, headers={"ETag": etag} if etag else {})
+
+    def test_unchanged(self):
+        comic = Comic("garfield", transport=self.transport)
+        self.assertEqual(comic.refresh(), [])
+        self.assertEqual(self.server.requests[-1][1].get("If-None-Match"), '"v1"')
+        self.assertEqual((self.server.hits["/garfield"], comic.fetch_count), (2, 2))
+
+    def test_changed(self):
+        comic = Comic("garfield", transport=self.transport)
+        self.update()
+        self.assertEqual(comic.refresh(), ["image_url", "next_date"])
+        self.assertEqual(comic.image_url, "https://featureassets.gocomics.com/assets/fedcba654321")
+        self.assertEqual(comic.refresh(), [])
+        self.assertEqual(self.server.requests[-1][1].get("If-None-Match"), '"v2"')
+
+    def test_without_validators(self):
+        self.server.add("/garfield", page("strip.html"))
+        comic = Comic("garfield", transport=self.transport)
+        self.assertEqual(comic.refresh(), [])
+        self.assertNotIn("If-None-Match", self.server.requests[-1][1])
+        self.update(etag=None)
+        self.assertEqual(comic.refresh(), ["image_url", "next_date"])
+
+    def test_only_extracted_fields_are_compared(self):
+        comic = Comic("garfield", transport=self.transport, fields={"title"})
+        self.update()
+        self.assertEqual(comic.refresh(), ["next_date"])
+        self.assertNotIn("image_url", vars(comic))
+        self.assertEqual(comic.image_url, "https://featureassets.gocomics.com/assets/fedcba654321")
+
+    def test_about(self):
+        comic = Comic("garfield", transport=self.transport)
+        ABOUT_CACHE.set(("garfield", self.transport), object())
+        self.addCleanup(ABOUT_CACHE.clear)
+        comic.refresh()
+        self.assertIn(("garfield", self.transport), ABOUT_CACHE)
+        comic.refresh(about=True)
+        self.assertNotIn(("garfield", self.transport), ABOUT_CACHE)
+
+class TestComicAbout(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.server.add("/garfield", page("strip.html"))
+        self.server.add("/garfield/about", page("about.html"))
+        self.transports = [Transport(timeout=5) for _ in range(2)]
+        for transport in self.transports:
+            self.addCleanup(transport.close)
+        for module in ("about", "comic"):
+            patcher = mock.patch(f"gocomics.{module}.BASE_URL", self.server.base_url)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        ABOUT_CACHE.clear()
+        self.addCleanup(ABOUT_CACHE.clear)
+
+    def test_cached_per_transport(self):
+        comics = [Comic("garfield", transport=transport) for transport in (*self.transports, self.transports[0])]
+        self.assertEqual([[character.name for character in comic.characters] for comic in comics], [["Odie", "Jon"]] * 3)
+        self.assertEqual(self.server.hits["/garfield/about"], 2)
+
+    def test_lists_are_copies(self):
+        comic = Comic("garfield", transport=self.transports[0])
+        comic.characters.clear()
+        comic.social_urls.append("https://example.com")
+        comic.about_author.clear()
+        other = Comic("garfield", transport=self.transports[0])
+        self.assertEqual(len(other.characters), 2)
+        self.assertNotIn("https://example.com", other.social_urls)
+        self.assertTrue(comic.about_author)
+
+class TestComicDownload(unittest.TestCase):
+    def setUp(self):
+        self.image = bytes(range(256)) * 1000
+        self.server = StubServer().__enter__()
+        self.server.add("/garfield", page("strip.html"))
+        self.server.add("/assets/abc123", self.image, headers={"Content-Type": "image/gif", "ETag": '"v1"', "Accept-Ranges": "bytes"})
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, base_delay=0.01))
+        patcher = mock.patch("gocomics.comic.BASE_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.comic = Comic("garfield", transport=self.transport)
+        self.comic.image_url = self.server.base_url + "assets/abc123"
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.__exit__()
+
+    def test_extension_from_content_type(self):
+        path = self.comic.download(path=self.directory.name, chunk_size=1000)
+        self.assertTrue(path.endswith("garfield.gif"))
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), self.image)
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["garfield.gif", "garfield.gif.validator"])
+
+    def test_filename_without_extension(self):
+        path = self.comic.download(filename="2020-01-01", path=self.directory.name)
+        self.assertEqual(os.path.basename(path), "2020-01-01.gif")
+
+    def test_invalid_filename(self):
+        with self.assertRaises(ValueError):
+            self.comic.download(filename="garfield.txt", path=self.directory.name)
+
+    def test_skips_unchanged_image(self):
+        path = self.comic.download(path=self.directory.name)
+        self.assertEqual(self.comic.download(path=self.directory.name), path)
+        self.assertEqual(self.server.hits["/assets/abc123"], 2)
+        self.assertEqual(self.server.requests[-1][1]["If-None-Match"], '"v1"')
+
+        self.server.add("/assets/abc123", self.image[::-1], headers={"Content-Type": "image/gif", "ETag": '"v2"', "Accept-Ranges": "bytes"})
+        self.comic.download(path=self.directory.name)
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), self.image[::-1])
+        with open(f"{path}.validator") as file:
+            self.assertEqual(file.read(), '"v2"')
+        self.comic.download(path=self.directory.name, overwrite=True)
+        self.assertNotIn("If-None-Match", self.server.requests[-1][1])
+
+    def test_resumes_partial_download(self):
+        path = self._interrupt()
+        self.comic.download(path=self.directory.name)
+        self.assertEqual(self.server.requests[-1][1]["Range"], "bytes=1000-")
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), self.image)
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["garfield.gif", "garfield.gif.validator"])
+
+    def test_restarts_changed_image(self):
+        path = self._interrupt()
+        self.server.add("/assets/abc123", self.image[::-1], headers={"Content-Type": "image/gif", "ETag": '"v2"', "Accept-Ranges": "bytes"})
+        self.comic.download(path=self.directory.name)
+        self.assertEqual(self.server.requests[-1][1]["If-Range"], '"v1"')
+        self.assertEqual(self.server.hits["/assets/abc123"], 1)
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), self.image[::-1])
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["garfield.gif", "garfield.gif.validator"])
+
+    def test_download_to(self):
+        buffer = io.BytesIO()
+        self.assertEqual(self.comic.download_to(buffer, chunk_size=4096), len(self.image))
+        self.assertEqual(buffer.getvalue(), self.image)
+
+    def test_iter_image(self):
+        chunks = list(self.comic.iter_image(chunk_size=4096))
+        self.assertEqual(b"".join(chunks), self.image)
+        self.assertTrue(all(len(chunk) <= 4096 for chunk in chunks))
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_read_image(self):
+        buffer = self.comic.read_image(checksum=f"SHA256:{sha256(self.image).hexdigest()}")
+        self.assertIsInstance(buffer, memoryview)
+        self.assertTrue(buffer.readonly)
+        self.assertEqual(buffer, self.image)
+
+    def test_checksum_mismatch(self):
+        chunks = []
+        with self.assertRaises(ValueError):
+            for chunk in self.comic.iter_image(chunk_size=4096, checksum=f"sha256:{sha256(b'other').hexdigest()}"):
+                chunks.append(chunk)
+        received = b"".join(chunks)
+        self.assertLess(len(received), len(self.image))
+        self.assertTrue(self.image.startswith(received))
+        with self.assertRaises(ValueError):
+            self.comic.read_image(checksum=f"md5:{sha256(self.image).hexdigest()}")
+        for checksum in ("abc", "sha256:", "nohash:abc"):
+            with self.assertRaises(ValueError):
+                self.comic.iter_image(checksum=checksum)
+
+    def test_max_size(self):
+        with self.assertRaises(ValueError):
+            self.comic.read_image(max_size=len(self.image) - 1)
+        self.assertEqual(self.server.hits["/assets/abc123"], 1)
+        self.assertEqual(self.comic.read_image(max_size=len(self.image)), self.image)
+
+    def _interrupt(self):
+        with open(os.path.join(self.directory.name, "garfield.part"), "wb") as file:
+            file.write(self.image[:1000])
+        with open(os.path.join(self.directory.name, "garfield.part.validator"), "w") as file:
+            file.write('"v1"')
+        return os.path.join(self.directory.name, "garfield.gif")
+
 if __name__ == "__main__":
     unittest.main()
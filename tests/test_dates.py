@@ -0,0 +1,75 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+
+# pylint: skip-file
+
+import os
+import tempfile
+import unittest
+
+from datetime import date
+
+from gocomics import DateIndex
+
+class TestDateIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = DateIndex()
+        self.index.record("garfield", date(2020, 1, 8), date(2020, 1, 1), date(2020, 1, 15))
+
+    def test_links(self):
+        self.assertEqual(self.index.next_date("garfield", date(2020, 1, 1)), date(2020, 1, 8))
+        self.assertEqual(self.index.next_date("garfield", date(2020, 1, 8)), date(2020, 1, 15))
+        self.assertIsNone(self.index.next_date("garfield", date(2020, 1, 15)))
+        self.assertIsNone(self.index.next_date("peanuts", date(2020, 1, 1)))
+        self.assertEqual(self.index.dates("garfield"), [date(2020, 1, 1), date(2020, 1, 8), date(2020, 1, 15)])
+
+    def test_first_date(self):
+        self.assertEqual(self.index.first_date("garfield", date(2020, 1, 1)), date(2020, 1, 1))
+        self.assertEqual(self.index.first_date("garfield", date(2020, 1, 2)), date(2020, 1, 8))
+        self.assertEqual(self.index.first_date("garfield", date(2020, 1, 15)), date(2020, 1, 15))
+        self.assertIsNone(self.index.first_date("garfield", date(2019, 12, 25)))
+        self.assertIsNone(self.index.first_date("garfield", date(2020, 1, 16)))
+
+    def test_ignores_backward_links(self):
+        self.index.record("garfield", date(2020, 1, 15), date(2020, 1, 20), date(2020, 1, 10))
+        self.assertIsNone(self.index.next_date("garfield", date(2020, 1, 15)))
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dates.json")
+            index = DateIndex(path)
+            index.save()
+            self.assertFalse(os.path.exists(path))
+            index.record("garfield", date(2020, 1, 1), None, date(2020, 1, 2))
+            index.save()
+            self.assertEqual(DateIndex(path).next_date("garfield", date(2020, 1, 1)), date(2020, 1, 2))
+            index.clear("garfield")
+            index.save()
+            self.assertEqual(DateIndex(path).dates("garfield"), [])
+
+if __name__ == "__main__":
+    unittest.main()
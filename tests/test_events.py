@@ -0,0 +1,168 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+
+# pylint: skip-file
+
+import asyncio
+import io
+import json
+import tempfile
+import unittest
+
+from unittest import mock
+
+from gocomics import AsyncComic, AsyncTransport, Comic, Event, HTTPCache, Histogram, MetricsCollector, RateLimiter, Transport, add_observer, get_about, get_popular_comics, observe, remove_observer, search
+from gocomics.about import ABOUT_CACHE
+from tests.server import StubServer, page
+
+class TestHistogram(unittest.TestCase):
+    def test_observe(self):
+        histogram = Histogram((0.1, 1.0))
+        self.assertIsNone(histogram.quantile(0.5))
+        for value in (0.05, 0.05, 0.5, 2.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual((histogram.count, histogram.minimum, histogram.maximum), (4, 0.05, 2.0))
+        self.assertAlmostEqual(histogram.mean, 0.65)
+        self.assertEqual(histogram.quantile(0.5), 0.1)
+        self.assertEqual(histogram.quantile(0.99), 2.0)
+        self.assertEqual(histogram.to_dict()["buckets"], {"0.1": 2, "1.0": 1, "+Inf": 1})
+
+class TestMetricsCollector(unittest.TestCase):
+    def test_labels(self):
+        metrics = MetricsCollector()
+        metrics(Event("request", stage="comic", duration=0.2, size=100))
+        metrics(Event("request", stage="about", duration=0.4, size=50))
+        metrics(Event("cache_hit", detail={"cache": "http"}))
+        self.assertEqual(metrics.count("request"), 2)
+        self.assertEqual(metrics.count("request", stage="about"), 1)
+        self.assertEqual(metrics.size("request"), 150)
+        self.assertAlmostEqual(metrics.histogram("request").mean, 0.3)
+        self.assertEqual(metrics.count("cache_hit", cache="http"), 1)
+        self.assertEqual(metrics.count("cache_hit", cache="about"), 0)
+        self.assertEqual(len(json.loads(json.dumps(metrics.snapshot()))), 3)
+        metrics.reset()
+        self.assertEqual(metrics.count("request"), 0)
+
+class TestEvents(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.server.add("/garfield", page("strip.html"))
+        self.server.add("/garfield/about", page("about.html"))
+        self.server.add("/comics/a-to-z", page("a-to-z.html"))
+        self.server.add("/comics/popular", page("popular.html"))
+        self.server.add("/assets/abc123", b"GIF89a" + bytes(100), headers={"Content-Type": "image/gif"})
+        for module in ("gocomics.about", "gocomics.comic", "gocomics.utils", "gocomics.aio"):
+            patcher = mock.patch(f"{module}.BASE_URL", self.server.base_url)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, base_delay=0.01))
+        self.events = []
+        add_observer(self.events.append)
+        self.addCleanup(remove_observer, self.events.append)
+        ABOUT_CACHE.clear()
+        self.addCleanup(ABOUT_CACHE.clear)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.__exit__()
+
+    def names(self):
+        return [(event.name, event.stage) for event in self.events]
+
+    def test_comic(self):
+        Comic("garfield", transport=self.transport)
+        self.assertEqual(self.names(), [("request", "comic"), ("parse", "comic"), ("stage", "comic")])
+        request = self.events[0]
+        self.assertEqual((request.status, request.detail["method"]), (200, "GET"))
+        self.assertGreater(request.size, 0)
+        self.assertLessEqual(request.detail["first_byte"], request.duration)
+        self.assertEqual(self.events[1].size, len(page("strip.html")))
+        self.assertGreaterEqual(self.events[2].duration, request.duration)
+
+    def test_retry(self):
+        self.server.queue("/garfield", b"", status=503, headers={"Retry-After": "0"})
+        Comic("garfield", transport=self.transport)
+        self.assertEqual(self.names()[:4], [("request", "comic"), ("retry", "comic"), ("sleep", "comic"), ("request", "comic")])
+        self.assertEqual((self.events[0].status, self.events[1].status), (503, 503))
+        self.assertEqual(self.events[1].detail["attempt"], 1)
+        self.assertEqual(self.events[2].detail["reason"], "retry")
+
+    def test_about(self):
+        comic = Comic("garfield", transport=self.transport)
+        self.events.clear()
+        comic.about
+        comic.characters
+        self.assertEqual([event.name for event in self.events if event.stage == "about"], ["cache_miss", "request", "parse", "stage", "cache_hit", "stage"])
+        self.assertEqual(self.events[0].detail["cache"], "about")
+
+    def test_http_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = HTTPCache(f"{directory}/cache.sqlite3")
+            transport = Transport(timeout=5, cache=cache, limiter=RateLimiter(rate=None))
+            with observe(MetricsCollector()) as metrics:
+                search(transport=transport)
+                search(transport=transport)
+            transport.close()
+            cache.close()
+        self.assertEqual(metrics.count("cache_miss", cache="http"), 1)
+        self.assertEqual(metrics.count("cache_hit", cache="http"), 1)
+        self.assertEqual(metrics.count("cache_hit", cache="parsed"), 1)
+        self.assertEqual(metrics.count("request", stage="search"), 1)
+        self.assertEqual(metrics.count("parse"), 1)
+        self.assertEqual(metrics.count("stage", stage="search"), 2)
+
+    def test_listings_and_download(self):
+        get_popular_comics(transport=self.transport)
+        comic = Comic("garfield", transport=self.transport)
+        comic.image_url = self.server.base_url + "assets/abc123"
+        comic.download_to(io.BytesIO())
+        stages = [event.stage for event in self.events if event.name == "stage"]
+        self.assertEqual(stages, ["popular", "comic", "download"])
+        download = [event for event in self.events if event.name == "request" and event.stage == "download"]
+        self.assertEqual(download[0].size, 106)
+
+    def test_removed_observer(self):
+        remove_observer(self.events.append)
+        with mock.patch("gocomics.events.Event") as event:
+            Comic("garfield", transport=self.transport)
+        self.assertEqual(self.events, [])
+        event.assert_not_called()
+
+    def test_async(self):
+        async def main():
+            async with AsyncTransport(timeout=5) as transport:
+                comic = await AsyncComic("garfield", transport=transport)
+                await comic.fetch_about()
+        asyncio.run(main())
+        self.assertEqual(self.names(), [
+            ("request", "comic"), ("parse", "comic"), ("stage", "comic"),
+            ("cache_miss", "about"), ("request", "about"), ("parse", "about"), ("stage", "about")
+        ])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+
+# pylint: skip-file
+
+import csv
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+from datetime import date
+from unittest import mock
+from urllib.error import HTTPError
+
+from gocomics import EXPORT_FIELDS, RateLimiter, StripRecord, Transport, export, stream_comics
+from tests.server import StubServer, page
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.server.add("/garfield", page("strip.html"))
+        self.server.add("/peanuts", page("strip-edge.html"))
+        self.server.add("/garfield/2020/01/01", page("strip.html"))
+        self.transport = Transport(timeout=5, limiter=RateLimiter(rate=None, max_retries=0))
+        patcher = mock.patch("gocomics.comic.BASE_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.record = StripRecord.from_page("garfield", date(2020, 1, 1), page("strip.html"))
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.__exit__()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_jsonl(self):
+        self.assertEqual(export([self.record] * 5, self.path("comics.jsonl"), batch_size=2), 5)
+        with open(self.path("comics.jsonl")) as file:
+            rows = [json.loads(line) for line in file]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(list(rows[0]), list(EXPORT_FIELDS))
+        self.assertEqual(rows[0]["date"], "2020-01-01")
+        self.assertEqual(rows[0]["keywords"], ["garfield", "jim davis", "comics", "cats"])
+        self.assertEqual(rows[0]["image_url"], self.record.image_url)
+
+    def test_csv(self):
+        export([self.record], self.path("comics.csv"))
+        with open(self.path("comics.csv"), newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(rows[0]["keywords"], "garfield, jim davis, comics, cats")
+        self.assertEqual(rows[0]["author"], "Jim Davis")
+
+    def test_batches_are_flushed(self):
+        def records():
+            for index in range(4):
+                if index == 3:
+                    with open(self.path("comics.jsonl")) as file:
+                        self.assertEqual(len(file.readlines()), 2)
+                yield self.record
+        self.assertEqual(export(records(), self.path("comics.jsonl"), batch_size=2), 4)
+
+    def test_stream_and_identifiers(self):
+        items = list(stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 1), transport=self.transport))
+        missing = ValueError("missing")
+        missing.__cause__ = HTTPError(self.server.base_url + "garfield/2020/01/02", 404, "Not Found", None, None)
+        items += [missing, "garfield", "notacomic", "peanuts"]
+        self.assertEqual(export(items, self.path("comics.jsonl"), workers=2, transport=self.transport), 3)
+        with open(self.path("comics.jsonl")) as file:
+            rows = [json.loads(line) for line in file]
+        self.assertEqual([(row["identifier"], row["date"]) for row in rows], [("garfield", "2020-01-01"), ("garfield", None), ("peanuts", None)])
+        self.assertEqual(rows[2]["author"], "Charles M. Schulz")
+
+    def test_identifier_errors_are_raised(self):
+        self.server.add("/peanuts", b"", status=500)
+        for workers in (None, 2):
+            with self.assertRaises(ValueError) as raised:
+                export(["garfield", "notacomic", "peanuts"], self.path("comics.jsonl"), workers=workers, transport=self.transport)
+            self.assertEqual(raised.exception.__cause__.code, 500)
+
+    def test_stream_errors_are_raised(self):
+        error = ValueError("An error occurred while fetching the comic.")
+        with self.assertRaises(ValueError) as raised:
+            export([self.record, error, self.record], self.path("comics.jsonl"), batch_size=1)
+        self.assertIs(raised.exception, error)
+        with open(self.path("comics.jsonl")) as file:
+            self.assertEqual(len(file.readlines()), 1)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            export([self.record], self.path("comics.txt"))
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+    def test_parquet(self):
+        import pyarrow.parquet
+        export([self.record] * 3, self.path("comics.parquet"), batch_size=2)
+        parquet_file = pyarrow.parquet.ParquetFile(self.path("comics.parquet"))
+        self.assertEqual(parquet_file.metadata.num_row_groups, 2)
+        table = parquet_file.read()
+        self.assertEqual(table.column("date").to_pylist(), [date(2020, 1, 1)] * 3)
+        self.assertEqual(table.column("keywords").to_pylist()[0], ["garfield", "jim davis", "comics", "cats"])
+
+    @unittest.skipIf(importlib.util.find_spec("pyarrow"), "pyarrow is installed")
+    def test_parquet_requires_pyarrow(self):
+        with self.assertRaisesRegex(ValueError, "pyarrow"):
+            export([self.record], self.path("comics.parquet"))
+
+if __name__ == "__main__":
+    unittest.main()
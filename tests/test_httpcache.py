@@ -0,0 +1,125 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+# pylint: skip-file
+
+import unittest
+
+from unittest import mock
+
+from gocomics import Comic, HTTPCache, Transport, page_kind, search
+from tests.server import StubServer, page
+
+PARSE_CALLS = []
+
+def count_bytes(html):
+    PARSE_CALLS.append(html)
+    return len(html)
+
+class TestHTTPCache(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.server.add("/garfield", page("strip.html"), headers={"Content-Type": "text/html", "ETag": '"v1"'})
+        self.server.add("/garfield/2020/01/01", page("strip.html"))
+        self.server.add("/comics/a-to-z", page("a-to-z.html"))
+        self.cache = HTTPCache(":memory:")
+        self.transport = Transport(timeout=5, cache=self.cache)
+        for module in ("gocomics.comic", "gocomics.utils"):
+            patcher = mock.patch(f"{module}.BASE_URL", self.server.base_url)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        PARSE_CALLS.clear()
+
+    def tearDown(self):
+        self.transport.close()
+        self.cache.close()
+        self.server.__exit__()
+
+    def test_page_kind(self):
+        self.assertEqual(page_kind("https://gocomics.com/garfield/2020/01/01"), "archive")
+        self.assertEqual(page_kind("https://gocomics.com/garfield"), "latest")
+        self.assertEqual(page_kind("https://gocomics.com/garfield/about"), "about")
+        self.assertEqual(page_kind("https://gocomics.com/comics/a-to-z?category=kids"), "listing")
+        self.assertEqual(page_kind("https://gocomics.com/political-cartoons/political-popular"), "popular")
+        self.assertEqual(page_kind("https://featureassets.gocomics.com/assets/abc"), "other")
+
+    def test_fresh_hit_skips_network_and_parse(self):
+        url = self.server.base_url + "garfield/2020/01/01"
+        first = self.transport.get(url, parser=count_bytes)
+        second = self.transport.get(url, parser=count_bytes)
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.parsed, first.parsed)
+        self.assertEqual(second.content, page("strip.html"))
+        self.assertEqual(self.server.hits["/garfield/2020/01/01"], 1)
+        self.assertEqual(len(PARSE_CALLS), 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_stale_entry_is_revalidated(self):
+        self.cache.ttls["latest"] = 0
+        url = self.server.base_url + "garfield"
+        self.transport.get(url, parser=count_bytes)
+        response = self.transport.get(url, parser=count_bytes)
+        self.assertTrue(response.from_cache)
+        self.assertEqual(self.server.hits["/garfield"], 2)
+        self.assertEqual(self.server.requests[-1][1].get("If-None-Match"), '"v1"')
+        self.assertEqual(self.cache.revalidations, 1)
+        self.assertEqual(len(PARSE_CALLS), 1)
+
+    def test_refresh_bypasses_cache(self):
+        url = self.server.base_url + "garfield/2020/01/01"
+        self.transport.get(url)
+        self.assertFalse(self.transport.get(url, refresh=True).from_cache)
+        self.assertEqual(self.server.hits["/garfield/2020/01/01"], 2)
+
+    def test_comic_and_listing_use_cache(self):
+        first = Comic("garfield", transport=self.transport)
+        comic = Comic("garfield", transport=self.transport)
+        self.assertEqual(first.fetch_count, 1)
+        self.assertEqual(comic.fetch_count, 0)
+        self.assertEqual(comic.image_url, first.image_url)
+        self.assertEqual(search(transport=self.transport), search(transport=self.transport))
+        self.assertEqual(self.server.hits["/comics/a-to-z"], 1)
+
+    def test_in_memory_by_default(self):
+        with HTTPCache() as cache:
+            self.assertEqual(cache.path, ":memory:")
+            Transport(cache=cache).get(self.server.base_url + "garfield/2020/01/01")
+            self.assertTrue(Transport(cache=cache).get(self.server.base_url + "garfield/2020/01/01").from_cache)
+
+    def test_persistence(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite3")
+            with HTTPCache(path) as cache:
+                Transport(cache=cache).get(self.server.base_url + "garfield/2020/01/01")
+            with HTTPCache(path) as cache:
+                self.assertTrue(Transport(cache=cache).get(self.server.base_url + "garfield/2020/01/01").from_cache)
+        self.assertEqual(self.server.hits["/garfield/2020/01/01"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
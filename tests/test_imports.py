@@ -0,0 +1,76 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+
+# pylint: skip-file
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import gocomics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("asyncio", "bs4", "platform", "requests", "sqlite3", "subprocess")
+
+def run(statement):
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(json.dumps([elapsed, [name for name in {HEAVY!r} if name in sys.modules]]))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, check=True, text=True).stdout
+    return json.loads(output)
+
+class TestImports(unittest.TestCase):
+    def test_package(self):
+        elapsed, loaded = run("import gocomics")
+        self.assertEqual(loaded, [])
+        self.assertLess(elapsed, 0.05)
+
+    def test_comic(self):
+        elapsed, loaded = run("from gocomics import Comic")
+        self.assertEqual(loaded, [])
+        self.assertLess(elapsed, 0.25)
+
+    def test_deferred(self):
+        _, loaded = run("from gocomics import Comic\nfrom gocomics.parsers import _soup\n_soup(b'<p></p>', 'html.parser', None)")
+        self.assertIn("bs4", loaded)
+        self.assertNotIn("requests", loaded)
+
+    def test_attributes(self):
+        self.assertIn("Comic", dir(gocomics))
+        self.assertIn("Comic", gocomics.__all__)
+        self.assertIs(gocomics.Comic, gocomics.comic.Comic)
+        self.assertIs(gocomics.endpoints, sys.modules["gocomics.endpoints"])
+        self.assertEqual(gocomics.BASE_URL, "https://gocomics.com/")
+        self.assertIn("BASE_URL", gocomics.__all__)
+        with self.assertRaises(AttributeError):
+            gocomics.NotAComic
@@ -0,0 +1,132 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+
+# pylint: skip-file
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from datetime import date, timedelta
+from unittest import mock
+
+from gocomics import AsyncComic, AsyncTransport, Comic, NegativeCache, RateLimiter, Transport
+from tests.server import StubServer, page
+
+class TestNegativeCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = NegativeCache(":memory:", ttl=100, recent_ttl=10)
+        self.addCleanup(self.cache.close)
+
+    def test_contains(self):
+        self.assertFalse(self.cache.contains("garfield", date(2000, 1, 1)))
+        self.cache.add("garfield", date(2000, 1, 1))
+        self.cache.add("retired")
+        self.assertTrue(self.cache.contains("garfield", date(2000, 1, 1)))
+        self.assertTrue(self.cache.contains("retired"))
+        self.assertFalse(self.cache.contains("garfield"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 2))
+        self.assertEqual(len(self.cache), 2)
+        self.cache.discard("retired")
+        self.assertFalse(self.cache.contains("retired"))
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_expiry(self):
+        recent = date.today() - timedelta(days=1)
+        with mock.patch("gocomics.negativecache.time", return_value=1000):
+            self.cache.add("garfield", date(2000, 1, 1))
+            self.cache.add("garfield", recent)
+        with mock.patch("gocomics.negativecache.time", return_value=1050):
+            self.assertTrue(self.cache.contains("garfield", date(2000, 1, 1)))
+            self.assertFalse(self.cache.contains("garfield", recent))
+        with mock.patch("gocomics.negativecache.time", return_value=1100):
+            self.assertFalse(self.cache.contains("garfield", date(2000, 1, 1)))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_never_expires(self):
+        cache = NegativeCache()
+        self.assertEqual(cache.path, ":memory:")
+        with mock.patch("gocomics.negativecache.time", return_value=0):
+            cache.add("garfield", date(2000, 1, 1))
+        self.assertTrue(cache.contains("garfield", date(2000, 1, 1)))
+        cache.close()
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "missing.sqlite3")
+            with NegativeCache(path) as cache:
+                cache.add("garfield", date(2000, 1, 1))
+            with NegativeCache(path) as cache:
+                self.assertTrue(cache.contains("garfield", date(2000, 1, 1)))
+
+class TestComicNegativeCache(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.server.add("/garfield/2020/01/01", page("strip.html"))
+        self.server.add("/garfield/2020/01/02", b"", status=500)
+        self.cache = NegativeCache(":memory:")
+        self.transport = Transport(timeout=5, negative_cache=self.cache, limiter=RateLimiter(rate=None, max_retries=0))
+        patcher = mock.patch("gocomics.comic.BASE_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.transport.close()
+        self.cache.close()
+        self.server.__exit__()
+
+    def test_missing_comic_is_not_requested_again(self):
+        for _ in range(3):
+            with self.assertRaisesRegex(ValueError, "does not exist"):
+                Comic("garfield", date(2020, 1, 3), transport=self.transport)
+        self.assertEqual(self.server.hits["/garfield/2020/01/03"], 1)
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_other_errors_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                Comic("garfield", date(2020, 1, 2), transport=self.transport)
+        self.assertEqual(self.server.hits["/garfield/2020/01/02"], 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_existing_comic(self):
+        Comic("garfield", date(2020, 1, 1), transport=self.transport)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_async_comic(self):
+        self.cache.add("garfield", date(2020, 1, 3))
+        async def main():
+            async with AsyncTransport(timeout=5, negative_cache=self.cache) as transport:
+                await AsyncComic("garfield", date(2020, 1, 3), transport=transport)
+        with mock.patch("gocomics.aio.BASE_URL", self.server.base_url), self.assertRaises(ValueError):
+            asyncio.run(main())
+        self.assertNotIn("/garfield/2020/01/03", self.server.hits)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+# pylint: skip-file
+
+import importlib.util
+import unittest
+
+from gocomics import PARSER_BACKENDS, get_parser_backend, set_parser_backend
+from gocomics.parsers import parse_strip, parse_about, parse_a_to_z, parse_a_to_z_entries, parse_popular
+from tests.server import page
+
+BACKENDS = [backend for backend in PARSER_BACKENDS if backend != "lxml" or importlib.util.find_spec("lxml")]
+
+class TestParsers(unittest.TestCase):
+    def assertSameForAllBackends(self, function, html):
+        expected = function(html, backend="html.parser")
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                self.assertEqual(function(html, backend=backend), expected)
+        return expected
+
+    def test_strip(self):
+        fields = self.assertSameForAllBackends(parse_strip, page("strip.html"))
+        self.assertEqual(fields["author"], "Jim Davis")
+        self.assertEqual(fields["followers_count"], "2,345,678")
+        self.assertEqual(fields["header_feature_url"], "https://featureassets.gocomics.com/assets/header-garfield.jpg")
+        self.assertEqual(fields["image_url"], "https://featureassets.gocomics.com/assets/abc123def456")
+        self.assertEqual(fields["previous_date"], "2019-12-31")
+        self.assertEqual(fields["next_date"], "2020-01-02")
+
+    def test_strip_edge_cases(self):
+        fields = self.assertSameForAllBackends(parse_strip, page("strip-edge.html"))
+        self.assertEqual(fields["title"], "Peanuts & Friends by Charles Schulz")
+        self.assertEqual(fields["author"], "Charles M. Schulz")
+        self.assertEqual(fields["name"], "Peanuts & Co")
+        self.assertIsNone(fields["header_feature_url"])
+        self.assertEqual(fields["image_url"], "https://featureassets.gocomics.com/assets/peanutsé")
+        self.assertEqual(fields["previous_date"], "2000-02-12")
+        self.assertIsNone(fields["next_date"])
+
+    def test_strip_fields(self):
+        for fields in ({"image_url"}, {"author", "keywords"}, set()):
+            with self.subTest(fields=fields):
+                parsed = self.assertSameForAllBackends(lambda html, backend: parse_strip(html, backend=backend, fields=fields), page("strip.html"))
+                self.assertEqual(set(parsed), fields | {"previous_date", "next_date"})
+                full = parse_strip(page("strip.html"))
+                self.assertTrue(all(parsed[field] == full[field] for field in parsed))
+        with self.assertRaises(ValueError):
+            parse_strip(page("strip.html"), fields={"colour"})
+
+    def test_strip_without_byline(self):
+        html = page("strip.html").replace(b"By Jim Davis | 2,345,678 Followers", b"By Jim Davis").replace(b"Typography_typography_body2___WsK9", b"")
+        fields = self.assertSameForAllBackends(parse_strip, html)
+        self.assertEqual((fields["author"], fields["followers_count"]), (None, None))
+        fields = parse_strip(html.replace(b'<span class="Typography_typography__C_Hp6 ">', b'<span class="Typography_typography__C_Hp6 Typography_typography_body2___WsK9">'))
+        self.assertEqual((fields["author"], fields["followers_count"]), ("Jim Davis", None))
+
+    def test_about(self):
+        fields = self.assertSameForAllBackends(parse_about, page("about.html"))
+        self.assertEqual(fields["social_urls"], ["https://twitter.com/garfield", "https://facebook.com/garfield"])
+        self.assertEqual(len(fields["characters"]), 2)
+
+    def test_listings(self):
+        self.assertEqual(self.assertSameForAllBackends(parse_a_to_z, page("a-to-z.html")), ["9to5", "calvinandhobbes", "garfield"])
+        self.assertEqual(self.assertSameForAllBackends(parse_popular, page("popular.html")), ["garfield", "peanuts", "calvinandhobbes"])
+        entries = self.assertSameForAllBackends(parse_a_to_z_entries, page("a-to-z.html"))
+        self.assertEqual(entries[1], {"identifier": "calvinandhobbes", "name": "Calvin and Hobbes"})
+        self.assertEqual(len(entries), 3)
+
+    def test_set_parser_backend(self):
+        previous = get_parser_backend()
+        try:
+            set_parser_backend("strainer")
+            self.assertEqual(get_parser_backend(), "strainer")
+            with self.assertRaises(ValueError):
+                set_parser_backend("not-a-parser")
+            self.assertEqual(get_parser_backend(), "strainer")
+        finally:
+            set_parser_backend(previous)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+
+# pylint: skip-file
+
+import asyncio
+import unittest
+
+from unittest import mock
+from urllib.error import HTTPError
+
+from gocomics import AsyncTransport, RateLimiter, Transport
+from gocomics.ratelimit import _retry_after_seconds, _retry_deadline
+from tests.server import StubServer, page
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        patcher = mock.patch("gocomics.ratelimit.monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_pacing(self):
+        limiter = RateLimiter(rate=2, burst=2)
+        self.assertEqual(limiter.reserve("host"), 0)
+        self.assertEqual(limiter.reserve("host"), 0)
+        self.assertAlmostEqual(limiter.reserve("host"), 0.5)
+        self.assertEqual(limiter.reserve("other"), 0)
+        self.now += 1.5
+        self.assertEqual(limiter.reserve("host"), 0)
+
+    def test_unlimited(self):
+        limiter = RateLimiter(rate=None)
+        for _ in range(100):
+            self.assertEqual(limiter.reserve("host"), 0)
+
+    def test_adapts_to_throttling(self):
+        limiter = RateLimiter(rate=8, increase=1)
+        limiter.record("host", 429)
+        self.assertEqual(limiter.stats["rates"]["host"], 4)
+        limiter.record("host", 503)
+        self.assertEqual(limiter.stats["rates"]["host"], 2)
+        limiter.record("host", 200)
+        self.assertEqual(limiter.stats["rates"]["host"], 3)
+        self.assertEqual(limiter.stats["throttled"], 2)
+
+    def test_retry_after_blocks_host(self):
+        limiter = RateLimiter(rate=None)
+        limiter.record("host", 429, "3")
+        self.assertEqual(limiter.reserve("host"), 3)
+        self.assertEqual(limiter.reserve("other"), 0)
+        self.assertEqual(limiter.retry_delay(0, "3"), 3)
+
+    def test_retry_after_parsing(self):
+        self.assertEqual(_retry_after_seconds("5"), 5)
+        self.assertIsNone(_retry_after_seconds(None))
+        self.assertIsNone(_retry_after_seconds("soon"))
+        self.assertEqual(_retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+
+    def test_backoff(self):
+        limiter = RateLimiter(base_delay=1, max_delay=5, max_retries=10, min_retries=10)
+        for attempt in range(6):
+            delay = limiter.retry_delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(5, 2 ** attempt))
+
+    def test_max_retries(self):
+        limiter = RateLimiter(max_retries=2)
+        self.assertIsNotNone(limiter.retry_delay(1))
+        self.assertIsNone(limiter.retry_delay(2))
+
+    def test_deadline(self):
+        limiter = RateLimiter(rate=None)
+        with _retry_deadline(self.now + 1):
+            self.assertIsNone(limiter.retry_delay(0, "5"))
+            self.assertEqual(limiter.retry_delay(0, "0"), 0)
+        self.assertEqual(limiter.retry_delay(0, "5"), 5)
+        self.assertEqual(limiter.stats["retries_denied"], 1)
+
+    def test_retry_budget(self):
+        limiter = RateLimiter(rate=None, min_retries=2, retry_ratio=0.5)
+        self.assertIsNotNone(limiter.retry_delay(0))
+        self.assertIsNotNone(limiter.retry_delay(0))
+        self.assertIsNone(limiter.retry_delay(0))
+        limiter.reserve("host")
+        limiter.reserve("host")
+        self.assertIsNotNone(limiter.retry_delay(0))
+        self.assertEqual(limiter.stats["retries"], 3)
+        self.assertEqual(limiter.stats["retries_denied"], 1)
+
+class TestTransportRetries(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.server.add("/garfield", page("strip.html"))
+        self.limiter = RateLimiter(rate=None, base_delay=0.01)
+
+    def tearDown(self):
+        self.server.__exit__()
+
+    def test_retries_throttled_request(self):
+        self.server.queue("/garfield", b"", status=503)
+        self.server.queue("/garfield", b"", status=429, headers={"Retry-After": "0"})
+        with Transport(limiter=self.limiter) as transport:
+            response = transport.get(self.server.base_url + "garfield")
+        self.assertEqual(response.content, page("strip.html"))
+        self.assertEqual(self.server.hits["/garfield"], 3)
+        self.assertEqual(self.limiter.stats["retries"], 2)
+
+    def test_gives_up(self):
+        self.limiter.max_retries = 1
+        for _ in range(3):
+            self.server.queue("/garfield", b"", status=503)
+        with Transport(limiter=self.limiter) as transport, self.assertRaises(HTTPError) as context:
+            transport.get(self.server.base_url + "garfield")
+        self.assertEqual(context.exception.code, 503)
+        self.assertEqual(self.server.hits["/garfield"], 2)
+
+    def test_does_not_retry_client_errors(self):
+        with Transport(limiter=self.limiter) as transport, self.assertRaises(HTTPError):
+            transport.get(self.server.base_url + "missing")
+        self.assertEqual(self.server.hits["/missing"], 1)
+
+    def test_async_retries_throttled_request(self):
+        self.server.queue("/garfield", b"", status=502)
+        async def fetch():
+            transport = AsyncTransport(limiter=self.limiter)
+            try:
+                return (await transport.get(self.server.base_url + "garfield")).content
+            finally:
+                await transport.close()
+        self.assertEqual(asyncio.run(fetch()), page("strip.html"))
+        self.assertEqual(self.server.hits["/garfield"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
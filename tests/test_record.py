@@ -0,0 +1,98 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+
+# pylint: skip-file
+
+import pickle
+import unittest
+
+from datetime import date
+from unittest import mock
+
+from gocomics import Character, Comic, Hyperlink, StripRecord, Transport
+from tests.server import StubServer, page
+
+class TestStripRecord(unittest.TestCase):
+    def setUp(self):
+        self.record = StripRecord.from_page("garfield", date(2020, 1, 1), page("strip.html"))
+
+    def test_from_page(self):
+        self.assertEqual(self.record.author, "Jim Davis")
+        self.assertEqual(self.record.keywords, ("garfield", "jim davis", "comics", "cats"))
+        self.assertEqual(self.record.previous_date, date(2019, 12, 31))
+        self.assertEqual(self.record.next_date, date(2020, 1, 2))
+
+    def test_round_trips(self):
+        self.assertEqual(StripRecord.from_dict(self.record.to_dict()), self.record)
+        self.assertEqual(StripRecord.from_json(self.record.to_json()), self.record)
+        self.assertEqual(pickle.loads(pickle.dumps(self.record)), self.record)
+        self.assertEqual(self.record.to_dict()["date"], "2020-01-01")
+        self.assertEqual(len({self.record, StripRecord.from_json(self.record.to_json())}), 1)
+
+    def test_immutable_and_slotted(self):
+        with self.assertRaises(AttributeError):
+            self.record.title = "Other"
+        with self.assertRaises(AttributeError):
+            del self.record.title
+        self.assertFalse(hasattr(self.record, "__dict__"))
+        with self.assertRaises(TypeError):
+            StripRecord("garfield", colour="orange")
+
+    def test_comic_round_trip(self):
+        transport = Transport(timeout=1)
+        with mock.patch.object(transport, "open", side_effect=AssertionError("no request expected")):
+            comic = Comic.from_record(self.record, transport=transport)
+        self.assertEqual(comic.date, date(2020, 1, 1))
+        self.assertEqual(comic.image_url, self.record.image_url)
+        self.assertEqual(comic.keywords, ["garfield", "jim davis", "comics", "cats"])
+        self.assertEqual(comic.next_date, date(2020, 1, 2))
+        self.assertEqual(comic.fetch_count, 0)
+        self.assertEqual(comic.to_record(), self.record)
+
+    def test_comic_to_record(self):
+        with StubServer() as server, Transport(timeout=5) as transport:
+            server.add("/garfield/2020/01/01", page("strip.html"))
+            with mock.patch("gocomics.comic.BASE_URL", server.base_url):
+                comic = Comic("garfield", date(2020, 1, 1), transport=transport)
+        self.assertEqual(comic.to_record(), self.record)
+
+class TestAboutValues(unittest.TestCase):
+    def test_hyperlink(self):
+        link = Hyperlink("https://example.com", "Example")
+        self.assertEqual(link, Hyperlink.from_dict(link.to_dict()))
+        self.assertNotEqual(link, Hyperlink("https://example.com", "Other"))
+        self.assertEqual(len({link, Hyperlink("https://example.com", "Example")}), 1)
+        self.assertFalse(hasattr(link, "__dict__"))
+
+    def test_character(self):
+        character = Character("Odie", "https://example.com/odie.png", "A dog.")
+        self.assertEqual(character, Character.from_dict(character.to_dict()))
+        self.assertEqual(character.to_dict(), {"name": "Odie", "image_url": "https://example.com/odie.png", "description": "A dog."})
+        self.assertIs(Comic.Character, Character)
+
+if __name__ == "__main__":
+    unittest.main()
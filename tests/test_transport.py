@@ -0,0 +1,171 @@
+"""
+MIT License
+
+Copyright (c) 2025 Omkaar
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+# pylint: skip-file
+
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from urllib.error import HTTPError
+
+from gocomics import Comic, MetricsCollector, Transport, get_transport, observe, set_transport, search, get_popular_comics
+from gocomics.parsers import parse_about, parse_strip
+from tests.server import StubServer, page
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.server.add("/garfield", page("strip.html"))
+        self.server.add("/comics/a-to-z", page("a-to-z.html"))
+        self.server.add("/comics/popular", page("popular.html"))
+        self.server.add("/old", b"", status=301, headers={"Location": "/garfield"})
+        self.transport = Transport(timeout=5)
+        patcher = mock.patch.multiple("gocomics.comic", BASE_URL=self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.multiple("gocomics.utils", BASE_URL=self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.__exit__()
+
+    def test_get_decodes_gzip(self):
+        response = self.transport.get(self.server.base_url + "garfield")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(response.content, page("strip.html"))
+
+    def test_connection_is_reused(self):
+        self.transport.get(self.server.base_url + "garfield")
+        connection = self.transport._idle[("http", self.server.base_url[7:-1])][0]
+        self.transport.get(self.server.base_url + "garfield")
+        self.assertIs(self.transport._idle[("http", self.server.base_url[7:-1])][0], connection)
+
+    def test_http_error(self):
+        with self.assertRaises(HTTPError) as context:
+            self.transport.get(self.server.base_url + "missing")
+        self.assertEqual(context.exception.code, 404)
+
+    def test_redirect(self):
+        response = self.transport.get(self.server.base_url + "old")
+        self.assertTrue(response.url.endswith("/garfield"))
+        self.assertEqual(response.content, page("strip.html"))
+
+    def test_streaming(self):
+        with self.transport.open(self.server.base_url + "garfield") as response:
+            chunks = list(response.iter_content(64))
+        self.assertEqual(b"".join(chunks), page("strip.html"))
+
+    def test_shared_transport(self):
+        set_transport(self.transport)
+        try:
+            self.assertIs(get_transport(), self.transport)
+        finally:
+            set_transport(None)
+        self.assertIsNot(get_transport(), self.transport)
+
+    def test_comic_and_utils_use_transport(self):
+        comic = Comic("garfield", transport=self.transport)
+        self.assertEqual(comic.name, "Garfield")
+        self.assertEqual(comic.image_url, "https://featureassets.gocomics.com/assets/abc123def456")
+        self.assertEqual(comic.fetch_count, 1)
+        self.assertEqual(search(transport=self.transport), ["9to5", "calvinandhobbes", "garfield"])
+        self.assertEqual(get_popular_comics(transport=self.transport), ["garfield", "peanuts", "calvinandhobbes"])
+
+    def test_comic_missing(self):
+        with self.assertRaises(ValueError):
+            Comic("notacomic", transport=self.transport)
+
+class TestCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer(latency=0.2).__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.server.add("/garfield", page("strip.html"))
+        self.url = self.server.base_url + "garfield"
+        patcher = mock.patch("gocomics.comic.BASE_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def concurrently(self, function, count=8):
+        with ThreadPoolExecutor(count) as executor:
+            futures = [executor.submit(function) for _ in range(count)]
+        return [future.exception() or future.result() for future in futures]
+
+    def test_identical_gets_share_one_request(self):
+        with Transport(timeout=5) as transport, observe(MetricsCollector()) as metrics:
+            responses = self.concurrently(lambda: transport.get(self.url, parser=parse_strip))
+        self.assertEqual(self.server.hits["/garfield"], 1)
+        self.assertEqual(transport.stats, {"flights": 1, "coalesced": 7})
+        self.assertEqual(metrics.count("cache_hit", cache="inflight"), 7)
+        self.assertEqual(sum(response.coalesced for response in responses), 7)
+        self.assertTrue(all(response.parsed == responses[0].parsed for response in responses))
+        self.assertTrue(all(response.content == page("strip.html") for response in responses))
+
+    def test_parsed_results_are_not_shared(self):
+        with Transport(timeout=5) as transport:
+            comics = self.concurrently(lambda: Comic("garfield", transport=transport), count=4)
+        comics[0].keywords.append("lasagna")
+        self.assertEqual(self.server.hits["/garfield"], 1)
+        self.assertTrue(all("lasagna" not in comic.keywords for comic in comics[1:]))
+
+    def test_other_parser_parses_the_shared_body(self):
+        with Transport(timeout=5) as transport:
+            with ThreadPoolExecutor(2) as executor:
+                strip = executor.submit(transport.get, self.url, parser=parse_strip)
+                about = executor.submit(transport.get, self.url, parser=parse_about)
+        self.assertEqual(self.server.hits["/garfield"], 1)
+        self.assertEqual(strip.result().parsed["name"], "Garfield")
+        self.assertIn("characters", about.result().parsed)
+
+    def test_errors_are_shared(self):
+        with Transport(timeout=5) as transport:
+            errors = self.concurrently(lambda: transport.get(self.server.base_url + "missing"), count=4)
+        self.assertEqual(self.server.hits["/missing"], 1)
+        self.assertTrue(all(isinstance(error, HTTPError) and error.code == 404 for error in errors))
+        causes = [error.__cause__ for error in errors if error.__cause__ is not None]
+        self.assertEqual(len(causes), 3)
+        self.assertTrue(all(cause is causes[0] and cause in errors for cause in causes))
+        self.assertEqual(len({id(error) for error in errors}), 4)
+        self.assertEqual(len({error.read() for error in errors}), 1)
+
+    def test_comics(self):
+        with Transport(timeout=5) as transport:
+            comics = self.concurrently(lambda: Comic("garfield", transport=transport), count=4)
+        self.assertEqual(self.server.hits["/garfield"], 1)
+        self.assertEqual(sorted(comic.fetch_count for comic in comics), [0, 0, 0, 1])
+        self.assertTrue(all(comic == comics[0] and comic.image_url == comics[0].image_url for comic in comics))
+
+    def test_disabled(self):
+        with Transport(timeout=5, coalesce=False) as transport:
+            self.concurrently(lambda: transport.get(self.url), count=3)
+        self.assertEqual(self.server.hits["/garfield"], 3)
+        self.assertEqual(transport.stats, {"flights": 0, "coalesced": 0})
+
+if __name__ == "__main__":
+    unittest.main()
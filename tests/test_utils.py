@@ -25,10 +25,13 @@ SOFTWARE.
 
 # pylint: skip-file
 
+import time
 import unittest
 
 from datetime import date
-from gocomics import search, search_political, get_popular_comics, stream_comics, Comic
+from unittest import mock
+from gocomics import search, search_political, get_popular_comics, stream_comics, Comic, DateIndex, RateLimiter, Transport, get_date_index, set_date_index
+from tests.server import StubServer, page, strip
 
 class TestUtils(unittest.TestCase):
     def test_search_basic(self):
@@ -148,5 +151,90 @@ class TestUtils(unittest.TestCase):
         comics = list(stream_comics("garfield", start_date=start, end_date=end))
         self.assertEqual(comics, [])
 
+class TestStreamComicsPrefetch(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        days = [date(2020, 1, day) for day in (1, 2, 4, 5)]
+        for previous, day, following in zip([None] + days, days, days[1:] + [None]):
+            self.server.add(f"/garfield/{day:%Y/%m/%d}", strip(previous, following))
+        self.transport = Transport(timeout=5)
+        self.index = DateIndex()
+        set_date_index(self.index)
+        self.addCleanup(set_date_index, None)
+        patcher = mock.patch("gocomics.comic.BASE_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.__exit__()
+
+    def test_prefetch_preserves_order_and_skips_missing_dates(self):
+        results = list(stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 5), transport=self.transport, workers=3, prefetch=2))
+        self.assertEqual([result.date for result in results], [date(2020, 1, day) for day in (1, 2, 4, 5)])
+
+    def test_prefetch_reports_failures(self):
+        self.server.add("/garfield/2020/01/02", b"", status=500)
+        self.transport.limiter = RateLimiter(rate=None, max_retries=0)
+        stream_comics_list = list(stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 2), transport=self.transport, workers=2))
+        self.assertEqual(stream_comics_list[0].date, date(2020, 1, 1))
+        self.assertIsInstance(stream_comics_list[1], ValueError)
+
+    def test_follows_navigation_links(self):
+        results = list(stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 5), transport=self.transport))
+        self.assertEqual([result.date for result in results], [date(2020, 1, day) for day in (1, 2, 4, 5)])
+        self.assertNotIn("/garfield/2020/01/03", self.server.hits)
+
+    def test_known_dates_are_not_probed(self):
+        list(stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 5), transport=self.transport))
+        self.assertEqual(self.index.dates("garfield"), [date(2020, 1, day) for day in (1, 2, 4, 5)])
+        self.server.hits.clear()
+        results = list(stream_comics("garfield", start_date=date(2020, 1, 3), end_date=date(2020, 1, 5), transport=self.transport, workers=3))
+        self.assertEqual([result.date for result in results], [date(2020, 1, 4), date(2020, 1, 5)])
+        self.assertEqual(sorted(self.server.hits), ["/garfield/2020/01/04", "/garfield/2020/01/05"])
+
+    def test_continues_past_missing_next_link(self):
+        self.server.add("/garfield/2020/01/02", strip(date(2020, 1, 1), None))
+        for workers in (None, 3):
+            results = list(stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 5), transport=self.transport, workers=workers))
+            self.assertEqual([result.date for result in results], [date(2020, 1, day) for day in (1, 2, 4, 5)])
+
+    def test_comics_record_only_into_a_set_index(self):
+        Comic("garfield", date(2020, 1, 1), transport=self.transport)
+        self.assertEqual(self.index.dates("garfield"), [date(2020, 1, 1), date(2020, 1, 2)])
+        set_date_index(None)
+        Comic("garfield", date(2020, 1, 4), transport=self.transport)
+        self.assertEqual(get_date_index().dates("garfield"), [])
+
+    def test_streams_use_their_own_index_by_default(self):
+        set_date_index(None)
+        for workers in (None, 3):
+            list(stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 5), transport=self.transport, workers=workers))
+        self.assertEqual(get_date_index().dates("garfield"), [])
+
+    def test_probes_until_first_strip(self):
+        results = list(stream_comics("garfield", start_date=date(2019, 12, 30), end_date=date(2020, 1, 2), transport=self.transport))
+        self.assertEqual([result.date for result in results], [date(2020, 1, 1), date(2020, 1, 2)])
+
+    def test_prefetch_invalid_range(self):
+        self.assertEqual(list(stream_comics("garfield", start_date=date(2020, 1, 5), end_date=date(2020, 1, 1), workers=2)), [])
+
+    def test_prefetch_early_close(self):
+        stream = stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 5), transport=self.transport, workers=2)
+        self.assertEqual(next(stream).date, date(2020, 1, 1))
+        stream.close()
+
+    def test_closed_stream_stops_retrying(self):
+        self.server.add("/garfield/2020/01/02", b"", status=502)
+        self.transport.limiter = RateLimiter(rate=None, max_retries=1000, base_delay=0.02, max_delay=0.02, min_retries=1000)
+        stream = stream_comics("garfield", start_date=date(2020, 1, 1), end_date=date(2020, 1, 5), transport=self.transport, workers=2)
+        self.assertEqual(next(stream).date, date(2020, 1, 1))
+        while self.server.hits["/garfield/2020/01/02"] < 3:
+            time.sleep(0.01)
+        stream.close()
+        hits = self.server.hits["/garfield/2020/01/02"]
+        time.sleep(0.2)
+        self.assertLessEqual(self.server.hits["/garfield/2020/01/02"] - hits, 1)
+
 if __name__ == "__main__":
     unittest.main()